@@ -1,8 +1,7 @@
-import requests
-from lxml import etree
-from typing import Optional
-from bs4 import BeautifulSoup
-from osn_requests.functions import reformat_headers
+from typing import (
+	Optional,
+	TYPE_CHECKING
+)
 from osn_requests.types import (
 	auth_parameter_type,
 	cert_parameter_type,
@@ -18,6 +17,15 @@ from osn_requests.types import (
 	url_parameter_type,
 	verify_parameter_type
 )
+from osn_requests.functions import (
+	reformat_headers,
+	reformat_proxies
+)
+
+
+if TYPE_CHECKING:
+	import requests
+	from lxml import etree
 
 
 def get_req(
@@ -35,20 +43,27 @@ def get_req(
 		stream: Optional[bool] = None,
 		verify: verify_parameter_type = None,
 		cert: cert_parameter_type = None,
-		json: json_parameter_type = None
-) -> requests.Response:
+		json: json_parameter_type = None,
+		session: Optional["requests.Session"] = None
+) -> "requests.Response":
 	"""
 	Sends a GET request to the specified URL using the requests library.
 
 	This function is a wrapper around `requests.get` that simplifies making HTTP GET requests.
 	It accepts various parameters to customize the request, such as headers, parameters, and proxies.
 	Headers are automatically reformatted to replace underscores with hyphens.
+	The requests library is imported on the first call, so importing the package (e.g. only for header generation) stays cheap.
+
+	HTTP, HTTPS, SOCKS4 and SOCKS5 proxies are supported; SOCKS links need the PySocks package and the 'socks5h' scheme makes the proxy
+	resolve host names. A `proxies` dictionary with only 'socks4' or 'socks5' entries is applied to all URLs.
+	If a `session` is given, its connection pool is reused: the session keeps one pool per proxy, for HTTP and SOCKS proxies alike,
+	so consecutive requests through the same proxy do not open a new tunnel each time. The session also keeps its cookies between requests.
 
 	Args:
 		url (url_parameter_type): The URL to request.
 		params (params_parameter_type): Query parameters to append to the URL. Defaults to None.
 		data (data_parameter_type): Data to send in the request body. Defaults to None.
-		headers (headers_parameter_type): Request headers. Underscores in keys are replaced with hyphens. Defaults to None.
+		headers (headers_parameter_type): Request headers. Underscores in keys are replaced with hyphens; `PreparedHeaders` are sent as they are. Defaults to None.
 		cookies (cookies_parameter_type): Request cookies. Defaults to None.
 		files (files_parameter_type): Files to upload. Defaults to None.
 		auth (auth_parameter_type): Authentication tuple or object. Defaults to None.
@@ -60,11 +75,16 @@ def get_req(
 		verify (verify_parameter_type): SSL verification. Defaults to None.
 		cert (cert_parameter_type): SSL client certificate. Defaults to None.
 		json (json_parameter_type): JSON data to send in the request body. Defaults to None.
+		session (Optional[requests.Session]): A session to send the request with. Defaults to None, which means a new connection for every request.
 
 	Returns:
 		requests.Response: The response object from the requests library.
 	"""
-	return requests.get(
+	import requests
+	
+	sender = requests if session is None else session
+	
+	return sender.get(
 			url=url,
 			params=params,
 			data=data,
@@ -74,7 +94,7 @@ def get_req(
 			auth=auth,
 			timeout=timeout,
 			allow_redirects=allow_redirects,
-			proxies=proxies,
+			proxies=reformat_proxies(proxies),
 			hooks=hooks,
 			stream=stream,
 			verify=verify,
@@ -98,8 +118,9 @@ def get_html(
 		stream: Optional[bool] = None,
 		verify: verify_parameter_type = None,
 		cert: cert_parameter_type = None,
-		json: json_parameter_type = None
-) -> etree._Element:
+		json: json_parameter_type = None,
+		session: Optional["requests.Session"] = None
+) -> "etree._Element":
 	"""
 	Fetches HTML content from a URL and parses it into an lxml ElementTree.
 
@@ -110,7 +131,7 @@ def get_html(
 		url (url_parameter_type): The URL to fetch HTML from.
 		params (params_parameter_type): Query parameters to append to the URL. Defaults to None.
 		data (data_parameter_type): Data to send in the request body. Defaults to None.
-		headers (headers_parameter_type): Request headers. Underscores in keys are replaced with hyphens. Defaults to None.
+		headers (headers_parameter_type): Request headers. Underscores in keys are replaced with hyphens; `PreparedHeaders` are sent as they are. Defaults to None.
 		cookies (cookies_parameter_type): Request cookies. Defaults to None.
 		files (files_parameter_type): Files to upload. Defaults to None.
 		auth (auth_parameter_type): Authentication tuple or object. Defaults to None.
@@ -122,10 +143,14 @@ def get_html(
 		verify (verify_parameter_type): SSL verification. Defaults to None.
 		cert (cert_parameter_type): SSL client certificate. Defaults to None.
 		json (json_parameter_type): JSON data to send in the request body. Defaults to None.
+		session (Optional[requests.Session]): A session to send the request with. Defaults to None, which means a new connection for every request.
 
 	Returns:
 		etree._Element: The root element of the parsed HTML as an lxml ElementTree object.
 	"""
+	from lxml import etree
+	from bs4 import BeautifulSoup
+	
 	return etree.HTML(
 			str(
 					BeautifulSoup(
@@ -144,7 +169,8 @@ def get_html(
 									stream=stream,
 									verify=verify,
 									cert=cert,
-									json=json
+									json=json,
+									session=session
 							).content,
 							"html.parser"
 					)
@@ -152,7 +178,7 @@ def get_html(
 	)
 
 
-def find_web_elements(etree_: etree._Element, xpath: str) -> list[etree._Element]:
+def find_web_elements(etree_: "etree._Element", xpath: str) -> list["etree._Element"]:
 	"""
 	Finds all web elements matching a given XPath expression.
 
@@ -166,7 +192,7 @@ def find_web_elements(etree_: etree._Element, xpath: str) -> list[etree._Element
 	return etree_.xpath(xpath)
 
 
-def find_web_element(etree_: etree._Element, xpath: str) -> Optional[etree._Element]:
+def find_web_element(etree_: "etree._Element", xpath: str) -> Optional["etree._Element"]:
 	"""
 	Finds the first web element matching a given XPath expression.
 
@@ -1,5 +1,9 @@
 from typing import Optional
-from osn_requests.types import RequestHeaders
+from osn_requests.headers.prepared import PreparedHeaders
+from osn_requests.types import (
+	RequestHeaders,
+	proxies_parameter_type
+)
 
 
 def reformat_headers(headers: Optional[RequestHeaders]) -> Optional[dict[str, str]]:
@@ -9,6 +13,7 @@ def reformat_headers(headers: Optional[RequestHeaders]) -> Optional[dict[str, st
 	This function takes an optional dictionary of HTTP headers and reformats the keys to use hyphens instead of underscores.
 	This is often necessary because HTTP headers traditionally use hyphens in their names (e.g., 'User-Agent'),
 	while in Python, it's common to use underscores in variable names (e.g., 'user_agent').
+	`PreparedHeaders` objects are already in this form and are returned as they are, without a copy.
 
 	Args:
 		headers (Optional[RequestHeaders]): An optional dictionary of HTTP headers.
@@ -21,7 +26,7 @@ def reformat_headers(headers: Optional[RequestHeaders]) -> Optional[dict[str, st
 	Raises:
 		TypeError: If the input `headers` is not a dictionary or None, or if keys or values within the headers dictionary are not strings.
 	"""
-	if headers is None:
+	if headers is None or isinstance(headers, PreparedHeaders):
 		return headers
 	
 	if isinstance(headers, dict):
@@ -36,3 +41,36 @@ def reformat_headers(headers: Optional[RequestHeaders]) -> Optional[dict[str, st
 		return reformatted_headers
 	
 	raise TypeError("Headers must be a dictionary or None.")
+
+
+def reformat_proxies(proxies: proxies_parameter_type) -> Optional[dict[str, str]]:
+	"""
+	Maps 'socks4' and 'socks5' entries of a proxies dictionary onto the URL schemes used by the request library.
+
+	The request library selects a proxy by the scheme of the requested URL ('http', 'https' or 'all'), so a dictionary like
+	`{"socks5": "socks5h://127.0.0.1:1080"}` would otherwise be ignored. If no scheme entry is set, the SOCKS5 link (or the SOCKS4 link
+	if there is no SOCKS5 one) is used for both 'http' and 'https' URLs. Dictionaries with scheme entries are returned as they are.
+
+	Args:
+		proxies (proxies_parameter_type): An optional dictionary of proxies.
+
+	Returns:
+		Optional[dict[str, str]]: The proxies dictionary to pass to the request library, or None if the input `proxies` was None.
+
+	Raises:
+		TypeError: If the input `proxies` is not a dictionary or None.
+	"""
+	if proxies is None:
+		return proxies
+	
+	if not isinstance(proxies, dict):
+		raise TypeError("Proxies must be a dictionary or None.")
+	
+	if any(key in proxies for key in ["http", "https", "all"]):
+		return proxies
+	
+	for key in ["socks5", "socks4"]:
+		if key in proxies:
+			return {**proxies, "http": proxies[key], "https": proxies[key]}
+	
+	return proxies
@@ -1,16 +1,40 @@
 import random
 from typing import Optional
+from osn_requests.headers.candidates import CandidatePool
+from osn_requests.headers.specs import QualityHeaderSpec
 from osn_requests.headers.accept.data import MimeTypes
 from osn_var_tools.python_instances_tools import get_class_attributes
 from osn_requests.headers.types import (
-	QualityValue,
+	QualityItem,
 	necessary_quality_values
 )
 from osn_requests.headers.functions import (
-	build_start_quality_values,
+	build_start_quality_items,
 	calculate_num_choices,
-	get_quality_string,
-	sort_qualities
+	generate_quality_headers_batch,
+	generate_quality_items,
+	get_rng,
+	join_quality_items,
+	no_quality_bucket,
+	sort_quality_items
+)
+
+
+realistic_mime_types_pool = CandidatePool(
+		mime_type
+		for attribute in [
+			"application_common",
+			"audio_common",
+			"image_common",
+			"video_common",
+			"text_common"
+		]
+		for mime_type in getattr(MimeTypes, attribute)
+)
+all_mime_types_pool = CandidatePool(
+		mime_type
+		for attribute in get_class_attributes(MimeTypes, contains_exclude=["__", "common"]).keys()
+		for mime_type in getattr(MimeTypes, attribute)
 )
 
 
@@ -18,7 +42,8 @@ def generate_random_realistic_accept_header(
 		necessary_mime_types: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a realistic random Accept header string.
@@ -31,56 +56,43 @@ def generate_random_realistic_accept_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many MIME types (including "*/*").
 		max_len (Optional[int]): The maximum number of MIME types to include in the header. Used if `fixed_len` is None. Defaults to the length of the common MIME types list.
 		min_len (int): The minimum number of MIME types to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a realistic random Accept header.
 	"""
-	mime_types = build_start_quality_values(necessary_mime_types)
+	rng = get_rng(rng)
+	
+	mime_types = build_start_quality_items(necessary_mime_types)
 	
 	for mime_type in ["text/html"]:
-		if mime_type not in [a["name"] for a in mime_types]:
-			mime_types.append(QualityValue(name=mime_type, quality=None))
-	
-	mime_types_list = []
-	for attribute in [
-		"application_common",
-		"audio_common",
-		"image_common",
-		"video_common",
-		"text_common"
-	]:
-		mime_types_list += getattr(MimeTypes, attribute)
-	
-	mime_types_list = list(set(mime_types_list) - set(map(lambda a: a["name"], mime_types)))
+		if mime_type not in [a.name for a in mime_types]:
+			mime_types.append(QualityItem(mime_type, no_quality_bucket))
+	
+	excluded_indexes = realistic_mime_types_pool.get_excluded_indexes(mime_types)
 	num_choices = calculate_num_choices(
-			list_len=len(mime_types_list),
+			list_len=realistic_mime_types_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	mime_types += [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.7, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(mime_types_list, k=num_choices)
-	]
+	mime_types += generate_quality_items(realistic_mime_types_pool.sample(num_choices, excluded_indexes, rng), 0.7, rng)
 	
-	mime_types = sort_qualities(mime_types)
+	mime_types = sort_quality_items(mime_types, rng=rng)
 	
-	mime_types.append(QualityValue(name="*/*", quality=0.1))
+	mime_types.append(QualityItem("*/*", 1))
 	
-	return ", ".join(get_quality_string(mime_type) for mime_type in mime_types)
+	return join_quality_items(mime_types)
 
 
 def generate_random_accept_header(
 		necessary_mime_types: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a random Accept header string.
@@ -92,35 +104,167 @@ def generate_random_accept_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many MIME types (including "*/*").
 		max_len (Optional[int]): The maximum number of MIME types to include in the header. Used if `fixed_len` is None. Defaults to the length of the all MIME types list.
 		min_len (int): The minimum number of MIME types to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a random Accept header.
 	"""
-	mime_types = build_start_quality_values(necessary_mime_types)
+	rng = get_rng(rng)
 	
-	mime_types_list = []
-	for attribute in get_class_attributes(MimeTypes, contains_exclude=["__", "common"]).keys():
-		mime_types_list += getattr(MimeTypes, attribute)
+	mime_types = build_start_quality_items(necessary_mime_types)
 	
-	mime_types_list = list(set(mime_types_list) - set(map(lambda a: a["name"], mime_types)))
+	excluded_indexes = all_mime_types_pool.get_excluded_indexes(mime_types)
 	num_choices = calculate_num_choices(
-			list_len=len(mime_types_list),
+			list_len=all_mime_types_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	mime_types += [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.0, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(mime_types_list, k=num_choices)
-	]
-	random.shuffle(mime_types)
+	mime_types += generate_quality_items(all_mime_types_pool.sample(num_choices, excluded_indexes, rng), 0.0, rng)
+	rng.shuffle(mime_types)
+	
+	mime_types.append(QualityItem("*/*", 1))
+	
+	return join_quality_items(mime_types)
+
+
+def generate_random_realistic_accept_header_batch(
+		n: int,
+		necessary_mime_types: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` realistic random Accept header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_realistic_accept_header` call, but the number of MIME types and the quality values
+	of the whole batch are drawn at once.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_mime_types (necessary_quality_values): MIME types that must be included in every header.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random MIME types.
+		max_len (Optional[int]): The maximum number of random MIME types per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random MIME types per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` realistic random Accept header strings.
+	"""
+	rng = get_rng(rng)
+	
+	mime_types = build_start_quality_items(necessary_mime_types)
 	
-	mime_types.append(QualityValue(name="*/*", quality=0.1))
+	for mime_type in ["text/html"]:
+		if mime_type not in [a.name for a in mime_types]:
+			mime_types.append(QualityItem(mime_type, no_quality_bucket))
 	
-	return ", ".join(get_quality_string(mime_type) for mime_type in mime_types)
+	return generate_quality_headers_batch(
+			n=n,
+			pool=realistic_mime_types_pool,
+			start_values=mime_types,
+			excluded_indexes=realistic_mime_types_pool.get_excluded_indexes(mime_types),
+			wildcard="*/*",
+			min_quality=0.7,
+			sort=True,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+def generate_random_accept_header_batch(
+		n: int,
+		necessary_mime_types: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` random Accept header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_accept_header` call, but the number of MIME types and the quality values
+	of the whole batch are drawn at once.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_mime_types (necessary_quality_values): MIME types that must be included in every header.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random MIME types.
+		max_len (Optional[int]): The maximum number of random MIME types per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random MIME types per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` random Accept header strings.
+	"""
+	rng = get_rng(rng)
+	
+	mime_types = build_start_quality_items(necessary_mime_types)
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=all_mime_types_pool,
+			start_values=mime_types,
+			excluded_indexes=all_mime_types_pool.get_excluded_indexes(mime_types),
+			wildcard="*/*",
+			min_quality=0.0,
+			sort=False,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+class AcceptHeaderSpec(QualityHeaderSpec):
+	"""
+	Precompiled arguments of the Accept header generators.
+
+	`AcceptHeaderSpec(...).generate(rng)` follows the distribution of `generate_random_realistic_accept_header` (or of `generate_random_accept_header`
+	if `realistic` is False) called with the same arguments, but the arguments are validated and the pool is built only once. The realistic spec always includes "text/html", like the realistic generator.
+	"""
+	
+	def __init__(
+			self,
+			necessary_mime_types: necessary_quality_values = None,
+			fixed_len: Optional[int] = None,
+			max_len: Optional[int] = None,
+			min_len: int = 0,
+			realistic: bool = True
+	):
+		"""
+		Initializes a new instance of `AcceptHeaderSpec`.
+
+		Args:
+			necessary_mime_types (necessary_quality_values): MIME types that must be included in every header.
+			fixed_len (Optional[int]): If provided, every header will contain exactly this many random MIME types.
+			max_len (Optional[int]): The maximum number of random MIME types per header. Used if `fixed_len` is None.
+			min_len (int): The minimum number of random MIME types per header. Used if `fixed_len` is None. Defaults to 0.
+			realistic (bool): Draw from the common MIME types with realistic quality values and sorted output if True, from all MIME types otherwise. Defaults to True.
+
+		Raises:
+			ValueError: If `necessary_mime_types` is not a supported value, or `min_len` is greater than the number of available MIME types.
+		"""
+		mime_types = build_start_quality_items(necessary_mime_types)
+	
+		if realistic:
+			for mime_type in ["text/html"]:
+				if mime_type not in [a.name for a in mime_types]:
+					mime_types.append(QualityItem(mime_type, no_quality_bucket))
+	
+		super().__init__(
+				pool=realistic_mime_types_pool if realistic else all_mime_types_pool,
+				wildcard="*/*",
+				min_quality=0.7 if realistic else 0.0,
+				sort=realistic,
+				necessary=mime_types,
+				fixed_len=fixed_len,
+				max_len=max_len,
+				min_len=min_len
+		)
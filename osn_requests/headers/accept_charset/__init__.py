@@ -1,23 +1,34 @@
 import random
 from typing import Optional
+from osn_requests.headers.candidates import CandidatePool
+from osn_requests.headers.specs import QualityHeaderSpec
 from osn_requests.headers.accept_charset.data import Charsets
 from osn_requests.headers.types import (
-	QualityValue,
+	QualityItem,
 	necessary_quality_values
 )
 from osn_requests.headers.functions import (
-	build_start_quality_values,
+	build_start_quality_items,
 	calculate_num_choices,
-	get_quality_string,
-	sort_qualities
+	generate_quality_headers_batch,
+	generate_quality_items,
+	get_rng,
+	join_quality_items,
+	no_quality_bucket,
+	sort_quality_items
 )
 
 
+realistic_charsets_pool = CandidatePool(Charsets.common)
+all_charsets_pool = CandidatePool(Charsets.all)
+
+
 def generate_random_realistic_accept_charset_header(
 		necessary_charsets: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a realistic random Accept-Charset header string.
@@ -30,46 +41,43 @@ def generate_random_realistic_accept_charset_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many charsets (including "utf-8" and "ascii").
 		max_len (Optional[int]): The maximum number of charsets to include in the header. Used if `fixed_len` is None. Defaults to the length of the common charset list.
 		min_len (int): The minimum number of charsets to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a realistic random Accept-Charset header.
 	"""
-	charsets = build_start_quality_values(necessary_charsets)
+	rng = get_rng(rng)
+	
+	charsets = build_start_quality_items(necessary_charsets)
 	
 	for charset in ["utf-8", "ascii"]:
-		if charset not in [a["name"] for a in charsets]:
-			charsets.append(QualityValue(name=charset, quality=None))
+		if charset not in [a.name for a in charsets]:
+			charsets.append(QualityItem(charset, no_quality_bucket))
 	
-	charsets_list = list(set(Charsets.common) - set(map(lambda a: a["name"], charsets)))
+	excluded_indexes = realistic_charsets_pool.get_excluded_indexes(charsets)
 	num_choices = calculate_num_choices(
-			list_len=len(charsets_list),
+			list_len=realistic_charsets_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	charsets += [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.7, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(charsets_list, k=num_choices)
-	]
+	charsets += generate_quality_items(realistic_charsets_pool.sample(num_choices, excluded_indexes, rng), 0.7, rng)
 	
-	charsets = sort_qualities(charsets)
+	charsets = sort_quality_items(charsets, rng=rng)
 	
-	charsets.append(QualityValue(name="*", quality=0.1))
+	charsets.append(QualityItem("*", 1))
 	
-	return ", ".join(get_quality_string(charset) for charset in charsets)
+	return join_quality_items(charsets)
 
 
 def generate_random_accept_charset_header(
 		necessary_charsets: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a random Accept-Charset header string.
@@ -81,31 +89,170 @@ def generate_random_accept_charset_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many charsets.
 		max_len (Optional[int]): The maximum number of charsets to include in the header. Used if `fixed_len` is None. Defaults to the length of the all charset list.
 		min_len (int): The minimum number of charsets to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a random Accept-Charset header.
 	"""
-	charsets = build_start_quality_values(necessary_charsets)
+	rng = get_rng(rng)
 	
-	charsets_list = list(set(Charsets.all) - set(map(lambda a: a["name"], charsets)))
+	charsets = build_start_quality_items(necessary_charsets)
+	
+	excluded_indexes = all_charsets_pool.get_excluded_indexes(charsets)
 	num_choices = calculate_num_choices(
-			list_len=len(charsets_list),
+			list_len=all_charsets_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	charsets = [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.0, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(charsets_list, k=num_choices)
-	]
-	random.shuffle(charsets)
+	charsets = generate_quality_items(all_charsets_pool.sample(num_choices, excluded_indexes, rng), 0.0, rng)
+	rng.shuffle(charsets)
 	
-	charsets.append(QualityValue(name="*", quality=0.1))
+	charsets.append(QualityItem("*", 1))
 	
-	return ", ".join(get_quality_string(charset) for charset in charsets)
+	return join_quality_items(charsets)
+
+
+def generate_random_realistic_accept_charset_header_batch(
+		n: int,
+		necessary_charsets: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` realistic random Accept-Charset header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_realistic_accept_charset_header` call, but the number of charsets and the quality values
+	of the whole batch are drawn at once.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_charsets (necessary_quality_values): Charsets that must be included in every header.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random charsets.
+		max_len (Optional[int]): The maximum number of random charsets per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random charsets per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` realistic random Accept-Charset header strings.
+	"""
+	rng = get_rng(rng)
+	
+	charsets = build_start_quality_items(necessary_charsets)
+	
+	for charset in ["utf-8", "ascii"]:
+		if charset not in [a.name for a in charsets]:
+			charsets.append(QualityItem(charset, no_quality_bucket))
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=realistic_charsets_pool,
+			start_values=charsets,
+			excluded_indexes=realistic_charsets_pool.get_excluded_indexes(charsets),
+			wildcard="*",
+			min_quality=0.7,
+			sort=True,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+def generate_random_accept_charset_header_batch(
+		n: int,
+		necessary_charsets: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` random Accept-Charset header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_accept_charset_header` call, but the number of charsets and the quality values
+	of the whole batch are drawn at once.
+	As in `generate_random_accept_charset_header`, the necessary charsets are only excluded from the random candidates.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_charsets (necessary_quality_values): Charsets that must not be drawn as random candidates.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random charsets.
+		max_len (Optional[int]): The maximum number of random charsets per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random charsets per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` random Accept-Charset header strings.
+	"""
+	rng = get_rng(rng)
+	
+	charsets = build_start_quality_items(necessary_charsets)
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=all_charsets_pool,
+			start_values=[],
+			excluded_indexes=all_charsets_pool.get_excluded_indexes(charsets),
+			wildcard="*",
+			min_quality=0.0,
+			sort=False,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+class AcceptCharsetHeaderSpec(QualityHeaderSpec):
+	"""
+	Precompiled arguments of the Accept-Charset header generators.
+
+	`AcceptCharsetHeaderSpec(...).generate(rng)` follows the distribution of `generate_random_realistic_accept_charset_header` (or of `generate_random_accept_charset_header`
+	if `realistic` is False) called with the same arguments, but the arguments are validated and the pool is built only once. The realistic spec always includes "utf-8" and "ascii", like the realistic generator.
+	As in `generate_random_accept_charset_header`, the non-realistic spec only excludes the necessary charsets from the random candidates.
+	"""
+	
+	def __init__(
+			self,
+			necessary_charsets: necessary_quality_values = None,
+			fixed_len: Optional[int] = None,
+			max_len: Optional[int] = None,
+			min_len: int = 0,
+			realistic: bool = True
+	):
+		"""
+		Initializes a new instance of `AcceptCharsetHeaderSpec`.
+
+		Args:
+			necessary_charsets (necessary_quality_values): Charsets that must be included in every header, or only excluded from the random candidates if `realistic` is False.
+			fixed_len (Optional[int]): If provided, every header will contain exactly this many random charsets.
+			max_len (Optional[int]): The maximum number of random charsets per header. Used if `fixed_len` is None.
+			min_len (int): The minimum number of random charsets per header. Used if `fixed_len` is None. Defaults to 0.
+			realistic (bool): Draw from the common charsets with realistic quality values and sorted output if True, from all charsets otherwise. Defaults to True.
+
+		Raises:
+			ValueError: If `necessary_charsets` is not a supported value, or `min_len` is greater than the number of available charsets.
+		"""
+		charsets = build_start_quality_items(necessary_charsets)
+	
+		if realistic:
+			for charset in ["utf-8", "ascii"]:
+				if charset not in [a.name for a in charsets]:
+					charsets.append(QualityItem(charset, no_quality_bucket))
+	
+		super().__init__(
+				pool=realistic_charsets_pool if realistic else all_charsets_pool,
+				wildcard="*",
+				min_quality=0.7 if realistic else 0.0,
+				sort=realistic,
+				necessary=charsets,
+				fixed_len=fixed_len,
+				max_len=max_len,
+				min_len=min_len,
+				include_necessary=realistic
+		)
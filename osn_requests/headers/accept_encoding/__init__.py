@@ -1,23 +1,32 @@
 import random
 from typing import Optional
+from osn_requests.headers.candidates import CandidatePool
+from osn_requests.headers.specs import QualityHeaderSpec
 from osn_requests.headers.accept_encoding.data import Encodings
 from osn_requests.headers.types import (
-	QualityValue,
+	QualityItem,
 	necessary_quality_values
 )
 from osn_requests.headers.functions import (
-	build_start_quality_values,
+	build_start_quality_items,
 	calculate_num_choices,
-	get_quality_string,
-	sort_qualities
+	generate_quality_headers_batch,
+	generate_quality_items,
+	get_rng,
+	join_quality_items,
+	sort_quality_items
 )
 
 
+encodings_pool = CandidatePool(Encodings.all)
+
+
 def generate_random_realistic_accept_encoding_header(
 		necessary_encodings: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a realistic random Accept-Encoding header string.
@@ -30,42 +39,39 @@ def generate_random_realistic_accept_encoding_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many encoding types (including "*").
 		max_len (Optional[int]): The maximum number of encoding types to include in the header. Used if `fixed_len` is None. Defaults to the length of the encoding list.
 		min_len (int): The minimum number of encoding types to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a realistic random Accept-Encoding header.
 	"""
-	encodings = build_start_quality_values(necessary_encodings)
+	rng = get_rng(rng)
 	
-	encodings_list = list(set(Encodings.all) - set(map(lambda a: a["name"], encodings)))
+	encodings = build_start_quality_items(necessary_encodings)
+	
+	excluded_indexes = encodings_pool.get_excluded_indexes(encodings)
 	num_choices = calculate_num_choices(
-			list_len=len(encodings_list),
+			list_len=encodings_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	encodings += [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.7, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(encodings_list, k=num_choices)
-	]
+	encodings += generate_quality_items(encodings_pool.sample(num_choices, excluded_indexes, rng), 0.7, rng)
 	
-	encodings = sort_qualities(encodings)
+	encodings = sort_quality_items(encodings, rng=rng)
 	
-	encodings.append(QualityValue(name="*", quality=0.1))
+	encodings.append(QualityItem("*", 1))
 	
-	return ", ".join(get_quality_string(encoding) for encoding in encodings)
+	return join_quality_items(encodings)
 
 
 def generate_random_accept_encoding_header(
 		necessary_encodings: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a random Accept-Encoding header string.
@@ -77,31 +83,156 @@ def generate_random_accept_encoding_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many encoding types (including "*").
 		max_len (Optional[int]): The maximum number of encoding types to include in the header. Used if `fixed_len` is None. Defaults to the length of the encoding list.
 		min_len (int): The minimum number of encoding types to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a random Accept-Encoding header.
 	"""
-	encodings = build_start_quality_values(necessary_encodings)
+	rng = get_rng(rng)
 	
-	encodings_list = list(set(Encodings.all) - set(map(lambda a: a["name"], encodings)))
+	encodings = build_start_quality_items(necessary_encodings)
+	
+	excluded_indexes = encodings_pool.get_excluded_indexes(encodings)
 	num_choices = calculate_num_choices(
-			list_len=len(encodings_list),
+			list_len=encodings_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	encodings += [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.0, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(encodings_list, k=num_choices)
-	]
-	random.shuffle(encodings)
+	encodings += generate_quality_items(encodings_pool.sample(num_choices, excluded_indexes, rng), 0.0, rng)
+	rng.shuffle(encodings)
 	
-	encodings.append(QualityValue(name="*", quality=0.1))
+	encodings.append(QualityItem("*", 1))
 	
-	return ", ".join(get_quality_string(encoding) for encoding in encodings)
+	return join_quality_items(encodings)
+
+
+def generate_random_realistic_accept_encoding_header_batch(
+		n: int,
+		necessary_encodings: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` realistic random Accept-Encoding header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_realistic_accept_encoding_header` call, but the number of encodings and the quality values
+	of the whole batch are drawn at once.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_encodings (necessary_quality_values): Encodings that must be included in every header.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random encodings.
+		max_len (Optional[int]): The maximum number of random encodings per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random encodings per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` realistic random Accept-Encoding header strings.
+	"""
+	rng = get_rng(rng)
+	
+	encodings = build_start_quality_items(necessary_encodings)
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=encodings_pool,
+			start_values=encodings,
+			excluded_indexes=encodings_pool.get_excluded_indexes(encodings),
+			wildcard="*",
+			min_quality=0.7,
+			sort=True,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+def generate_random_accept_encoding_header_batch(
+		n: int,
+		necessary_encodings: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` random Accept-Encoding header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_accept_encoding_header` call, but the number of encodings and the quality values
+	of the whole batch are drawn at once.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_encodings (necessary_quality_values): Encodings that must be included in every header.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random encodings.
+		max_len (Optional[int]): The maximum number of random encodings per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random encodings per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` random Accept-Encoding header strings.
+	"""
+	rng = get_rng(rng)
+	
+	encodings = build_start_quality_items(necessary_encodings)
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=encodings_pool,
+			start_values=encodings,
+			excluded_indexes=encodings_pool.get_excluded_indexes(encodings),
+			wildcard="*",
+			min_quality=0.0,
+			sort=False,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+class AcceptEncodingHeaderSpec(QualityHeaderSpec):
+	"""
+	Precompiled arguments of the Accept-Encoding header generators.
+
+	`AcceptEncodingHeaderSpec(...).generate(rng)` follows the distribution of `generate_random_realistic_accept_encoding_header` (or of `generate_random_accept_encoding_header`
+	if `realistic` is False) called with the same arguments, but the arguments are validated and the pool is built only once.
+	"""
+	
+	def __init__(
+			self,
+			necessary_encodings: necessary_quality_values = None,
+			fixed_len: Optional[int] = None,
+			max_len: Optional[int] = None,
+			min_len: int = 0,
+			realistic: bool = True
+	):
+		"""
+		Initializes a new instance of `AcceptEncodingHeaderSpec`.
+
+		Args:
+			necessary_encodings (necessary_quality_values): Encodings that must be included in every header.
+			fixed_len (Optional[int]): If provided, every header will contain exactly this many random encodings.
+			max_len (Optional[int]): The maximum number of random encodings per header. Used if `fixed_len` is None.
+			min_len (int): The minimum number of random encodings per header. Used if `fixed_len` is None. Defaults to 0.
+			realistic (bool): Draw from the common encodings with realistic quality values and sorted output if True, from all encodings otherwise. Defaults to True.
+
+		Raises:
+			ValueError: If `necessary_encodings` is not a supported value, or `min_len` is greater than the number of available encodings.
+		"""
+		super().__init__(
+				pool=encodings_pool,
+				wildcard="*",
+				min_quality=0.7 if realistic else 0.0,
+				sort=realistic,
+				necessary=necessary_encodings,
+				fixed_len=fixed_len,
+				max_len=max_len,
+				min_len=min_len
+		)
@@ -1,23 +1,36 @@
 import random
 from typing import Optional
+from osn_requests.headers.candidates import CandidatePool
 from osn_requests.headers.accept_language.data import Languages
 from osn_requests.headers.types import (
-	QualityValue,
+	QualityItem,
 	necessary_quality_values
 )
+from osn_requests.headers.specs import (
+	PreferenceHeaderSpec,
+	QualityHeaderSpec
+)
 from osn_requests.headers.functions import (
-	build_start_quality_values,
+	build_start_quality_items,
 	calculate_num_choices,
-	get_quality_string,
-	sort_qualities
+	generate_quality_headers_batch,
+	generate_quality_items,
+	get_rng,
+	join_quality_items,
+	sort_quality_items
 )
 
 
+realistic_languages_pool = CandidatePool(Languages.common)
+all_languages_pool = CandidatePool(Languages.all)
+
+
 def generate_random_realistic_accept_language_header(
 		necessary_languages: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a realistic random Accept-Language header string.
@@ -30,42 +43,39 @@ def generate_random_realistic_accept_language_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many language codes (including "*").
 		max_len (Optional[int]): The maximum number of language codes to include in the header. Used if `fixed_len` is None. Defaults to the length of the common languages list.
 		min_len (int): The minimum number of language codes to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a realistic random Accept-Language header.
 	"""
-	languages = build_start_quality_values(necessary_languages)
+	rng = get_rng(rng)
+	
+	languages = build_start_quality_items(necessary_languages)
 	
-	languages_list = list(set(Languages.common) - set(map(lambda a: a["name"], languages)))
+	excluded_indexes = realistic_languages_pool.get_excluded_indexes(languages)
 	num_choices = calculate_num_choices(
-			list_len=len(languages_list),
+			list_len=realistic_languages_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	languages += [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.3, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(languages_list, k=num_choices)
-	]
+	languages += generate_quality_items(realistic_languages_pool.sample(num_choices, excluded_indexes, rng), 0.3, rng)
 	
-	languages = sort_qualities(languages)
+	languages = sort_quality_items(languages, rng=rng)
 	
-	languages.append(QualityValue(name="*", quality=0.1))
+	languages.append(QualityItem("*", 1))
 	
-	return ", ".join(get_quality_string(language) for language in languages)
+	return join_quality_items(languages)
 
 
 def generate_random_accept_language_header(
 		necessary_languages: necessary_quality_values = None,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> str:
 	"""
 	Generates a random Accept-Language header string.
@@ -77,31 +87,180 @@ def generate_random_accept_language_header(
 		fixed_len (Optional[int]): If provided, the header will contain exactly this many language codes (including "*").
 		max_len (Optional[int]): The maximum number of language codes to include in the header. Used if `fixed_len` is None. Defaults to the length of the all languages list.
 		min_len (int): The minimum number of language codes to include in the header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		str: A string representing a random Accept-Language header.
 	"""
-	languages = build_start_quality_values(necessary_languages)
+	rng = get_rng(rng)
+	
+	languages = build_start_quality_items(necessary_languages)
 	
-	languages_list = list(set(Languages.all) - set(map(lambda a: a["name"], languages)))
+	excluded_indexes = all_languages_pool.get_excluded_indexes(languages)
 	num_choices = calculate_num_choices(
-			list_len=len(languages_list),
+			list_len=all_languages_pool.count_available(excluded_indexes),
 			fixed_len=fixed_len,
 			min_len=min_len,
-			max_len=max_len
+			max_len=max_len,
+			rng=rng
 	)
 	
-	languages = [
-		QualityValue(
-				name=choice,
-				quality=random.uniform(0.0, 1.0)
-				if random.choice([True, False])
-				else None
-		)
-		for choice in random.sample(languages_list, k=num_choices)
-	]
-	random.shuffle(languages)
+	languages = generate_quality_items(all_languages_pool.sample(num_choices, excluded_indexes, rng), 0.0, rng)
+	rng.shuffle(languages)
 	
-	languages.append(QualityValue(name="*", quality=0.1))
+	languages.append(QualityItem("*", 1))
 	
-	return ", ".join(get_quality_string(language) for language in languages)
+	return join_quality_items(languages)
+
+
+def generate_random_realistic_accept_language_header_batch(
+		n: int,
+		necessary_languages: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` realistic random Accept-Language header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_realistic_accept_language_header` call, but the number of language codes and the quality values
+	of the whole batch are drawn at once.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_languages (necessary_quality_values): Language codes that must be included in every header.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random language codes.
+		max_len (Optional[int]): The maximum number of random language codes per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random language codes per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` realistic random Accept-Language header strings.
+	"""
+	rng = get_rng(rng)
+	
+	languages = build_start_quality_items(necessary_languages)
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=realistic_languages_pool,
+			start_values=languages,
+			excluded_indexes=realistic_languages_pool.get_excluded_indexes(languages),
+			wildcard="*",
+			min_quality=0.3,
+			sort=True,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+def generate_random_accept_language_header_batch(
+		n: int,
+		necessary_languages: necessary_quality_values = None,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` random Accept-Language header strings in one call.
+
+	Every header follows the same distribution as one `generate_random_accept_language_header` call, but the number of language codes and the quality values
+	of the whole batch are drawn at once.
+	As in `generate_random_accept_language_header`, the necessary language codes are only excluded from the random candidates.
+
+	Args:
+		n (int): The number of headers to generate.
+		necessary_languages (necessary_quality_values): Language codes that must not be drawn as random candidates.
+		fixed_len (Optional[int]): If provided, every header will contain exactly this many random language codes.
+		max_len (Optional[int]): The maximum number of random language codes per header. Used if `fixed_len` is None.
+		min_len (int): The minimum number of random language codes per header. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: `n` random Accept-Language header strings.
+	"""
+	rng = get_rng(rng)
+	
+	languages = build_start_quality_items(necessary_languages)
+	
+	return generate_quality_headers_batch(
+			n=n,
+			pool=all_languages_pool,
+			start_values=[],
+			excluded_indexes=all_languages_pool.get_excluded_indexes(languages),
+			wildcard="*",
+			min_quality=0.0,
+			sort=False,
+			fixed_len=fixed_len,
+			max_len=max_len,
+			min_len=min_len,
+			rng=rng
+	)
+
+
+class AcceptLanguageHeaderSpec(QualityHeaderSpec):
+	"""
+	Precompiled arguments of the Accept-Language header generators.
+
+	`AcceptLanguageHeaderSpec(...).generate(rng)` follows the distribution of `generate_random_realistic_accept_language_header` (or of `generate_random_accept_language_header`
+	if `realistic` is False) called with the same arguments, but the arguments are validated and the pool is built only once.
+	As in `generate_random_accept_language_header`, the non-realistic spec only excludes the necessary languages from the random candidates.
+	"""
+	
+	def __init__(
+			self,
+			necessary_languages: necessary_quality_values = None,
+			fixed_len: Optional[int] = None,
+			max_len: Optional[int] = None,
+			min_len: int = 0,
+			realistic: bool = True
+	):
+		"""
+		Initializes a new instance of `AcceptLanguageHeaderSpec`.
+
+		Args:
+			necessary_languages (necessary_quality_values): Languages that must be included in every header, or only excluded from the random candidates if `realistic` is False.
+			fixed_len (Optional[int]): If provided, every header will contain exactly this many random languages.
+			max_len (Optional[int]): The maximum number of random languages per header. Used if `fixed_len` is None.
+			min_len (int): The minimum number of random languages per header. Used if `fixed_len` is None. Defaults to 0.
+			realistic (bool): Draw from the common languages with realistic quality values and sorted output if True, from all languages otherwise. Defaults to True.
+
+		Raises:
+			ValueError: If `necessary_languages` is not a supported value, or `min_len` is greater than the number of available languages.
+		"""
+		super().__init__(
+				pool=realistic_languages_pool if realistic else all_languages_pool,
+				wildcard="*",
+				min_quality=0.3 if realistic else 0.0,
+				sort=realistic,
+				necessary=necessary_languages,
+				fixed_len=fixed_len,
+				max_len=max_len,
+				min_len=min_len,
+				include_necessary=realistic
+		)
+
+
+class BrowserAcceptLanguageHeaderSpec(PreferenceHeaderSpec):
+	"""
+	Precompiled Accept-Language header in the form browsers send it: a primary language followed by languages with strictly descending qualities,
+	e.g. "de,en;q=0.9,fr;q=0.8", drawn from the common languages.
+	"""
+	
+	def __init__(self, max_len: int = 3, min_len: int = 1, spread: bool = False):
+		"""
+		Initializes a new instance of `BrowserAcceptLanguageHeaderSpec`.
+
+		Args:
+			max_len (int): The maximum number of languages per header. Defaults to 3.
+			min_len (int): The minimum number of languages per header. Defaults to 1.
+			spread (bool): Spread the qualities over (0, 1) like Firefox if True, step them down by 0.1 like Chromium and Safari if False. Defaults to False.
+
+		Raises:
+			ValueError: If the lengths are not 1 <= `min_len` <= `max_len` <= 10.
+		"""
+		super().__init__(pool=realistic_languages_pool, max_len=max_len, min_len=min_len, spread=spread)
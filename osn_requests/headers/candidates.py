@@ -0,0 +1,115 @@
+import random
+from typing import Iterable
+from osn_requests.headers.types import QualityItem
+
+
+class CandidatePool:
+	"""
+	Immutable pool of header values to draw random candidates from.
+
+	The values are deduplicated once, keeping their first occurrence, and stored in a tuple together with a map from every value to its index.
+	Values that are already in a header are excluded by index instead of rebuilding a set difference on every call, so drawing candidates
+	costs about as much as one `sample` call of the random generator.
+
+	Attributes:
+		values (tuple[str, ...]): The distinct values of the pool.
+		indexes (dict[str, int]): The index of every value in `values`.
+	"""
+	
+	def __init__(self, values: Iterable[str]):
+		"""
+		Initializes a new instance of `CandidatePool`.
+
+		Args:
+			values (Iterable[str]): The values of the pool. Duplicates are dropped.
+		"""
+		self.indexes: dict[str, int] = {}
+	
+		for value in values:
+			self.indexes.setdefault(value, len(self.indexes))
+	
+		self.values: tuple[str, ...] = tuple(self.indexes)
+	
+	def __len__(self) -> int:
+		return len(self.values)
+	
+	def get_excluded_indexes(self, quality_values: list[QualityItem]) -> set[int]:
+		"""
+		Finds the indexes of the pool values that are already used by a list of QualityItem items.
+
+		Args:
+			quality_values (list[QualityItem]): The items to exclude. Names that are not in the pool are ignored.
+
+		Returns:
+			set[int]: The indexes to exclude.
+		"""
+		indexes = self.indexes
+	
+		return {indexes[value.name] for value in quality_values if value.name in indexes}
+	
+	def count_available(self, excluded_indexes: set[int]) -> int:
+		"""
+		Counts the pool values that are not excluded.
+
+		Args:
+			excluded_indexes (set[int]): The excluded indexes, as returned by `get_excluded_indexes`.
+
+		Returns:
+			int: The number of values that can still be drawn.
+		"""
+		return len(self.values) - len(excluded_indexes)
+	
+	def sample(self, k: int, excluded_indexes: set[int], rng: random.Random) -> list[str]:
+		"""
+		Draws `k` distinct random values that are not excluded.
+
+		If `m` values are excluded, `k + m` distinct indexes are drawn and the excluded ones are dropped. The drawn indexes are in random order,
+		so the first `k` remaining ones are a uniform sample of the allowed values.
+
+		Args:
+			k (int): The number of values to draw. Must not exceed `count_available(excluded_indexes)`.
+			excluded_indexes (set[int]): The indexes that must not be drawn.
+			rng (random.Random): The random generator to draw with.
+
+		Returns:
+			list[str]: The drawn values in random order.
+		"""
+		if not excluded_indexes:
+			return rng.sample(self.values, k=k)
+	
+		values = self.values
+		indexes = rng.sample(range(len(values)), k=k + len(excluded_indexes))
+	
+		return [values[index] for index in indexes if index not in excluded_indexes][:k]
+	
+	def sample_batch(self, lengths: list[int], excluded_indexes: set[int], rng: random.Random) -> list[list[str]]:
+		"""
+		Draws one sample of distinct values that are not excluded for every requested length.
+
+		The random numbers of all samples are drawn in one pass, and every sample is a partial Fisher-Yates shuffle of one shared list
+		of the allowed values. A partial shuffle of any order of the list gives a uniform sample, so the list is not reset between samples.
+
+		Args:
+			lengths (list[int]): The number of values of every sample. None may exceed `count_available(excluded_indexes)`.
+			excluded_indexes (set[int]): The indexes that must not be drawn.
+			rng (random.Random): The random generator to draw with.
+
+		Returns:
+			list[list[str]]: The samples, with the drawn values of each one in random order.
+		"""
+		allowed = [value for index, value in enumerate(self.values) if index not in excluded_indexes]
+		available = len(allowed)
+		draw = rng.random
+		draws = [draw() for _ in range(sum(lengths))]
+		samples = []
+		position = 0
+	
+		for length in lengths:
+			for index in range(length):
+				swap_index = index + int(draws[position + index] * (available - index))
+				allowed[index], allowed[swap_index] = allowed[swap_index], allowed[index]
+	
+			position += length
+			samples.append(allowed[:length])
+	
+		return samples
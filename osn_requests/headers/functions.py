@@ -1,12 +1,80 @@
 import random
-from typing import Any, Optional
+import hashlib
+import threading
+from typing import Any, Optional, Union
+from osn_requests.headers.candidates import CandidatePool
 from osn_requests.headers.types import (
+	QualityItem,
 	QualityValue,
 	necessary_quality_values
 )
 
 
-def sort_qualities(values: list[QualityValue]) -> list[QualityValue]:
+thread_random = threading.local()
+no_quality_bucket = 11
+quality_suffixes = tuple(f"; q={tenth / 10:.1f}" for tenth in range(11)) + ("",)
+
+
+def get_rng(rng: Optional[random.Random] = None) -> random.Random:
+	"""
+	Returns the random generator that a header generator should use.
+
+	Every thread gets its own `random.Random` instance, seeded from the operating system on first use, so generators running
+	in different threads never share and contend for one Mersenne Twister state. Pass a seeded `random.Random` instance
+	to get reproducible output.
+
+	Args:
+		rng (Optional[random.Random]): An explicit random generator. Defaults to None.
+
+	Returns:
+		random.Random: `rng` if it is given, otherwise the random generator of the current thread.
+	"""
+	if rng is not None:
+		return rng
+	
+	try:
+		return thread_random.rng
+	except AttributeError:
+		thread_random.rng = random.Random()
+		return thread_random.rng
+
+
+def get_key_rng(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		purpose: str = ""
+) -> random.Random:
+	"""
+	Returns a random generator seeded from a stable hash of a key.
+
+	The seed is a 128-bit BLAKE2b digest of the salt, the purpose and the key, so the same arguments give the same random stream
+	in every process and on every run, while Python's randomized `hash()` is not involved. Different purposes give independent streams
+	for the same key, e.g. one per header.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Changing it changes the streams of all keys. Defaults to "".
+		purpose (str): The name of the stream. Defaults to "".
+
+	Returns:
+		random.Random: A new random generator.
+	"""
+	digest = hashlib.blake2b(digest_size=16)
+	
+	for part in (salt, purpose, key):
+		if isinstance(part, int):
+			part = str(part)
+	
+		if isinstance(part, str):
+			part = part.encode("utf-8")
+	
+		digest.update(len(part).to_bytes(8, "big"))
+		digest.update(part)
+	
+	return random.Random(int.from_bytes(digest.digest(), "big"))
+
+
+def sort_qualities(values: list[QualityValue], rng: Optional[random.Random] = None) -> list[QualityValue]:
 	"""
 	Sorts and shuffles a list of QualityValue items based on their quality values.
 
@@ -16,38 +84,32 @@ def sort_qualities(values: list[QualityValue]) -> list[QualityValue]:
 
 	Args:
 		values (list[QualityValue]): A list of QualityValue dictionaries.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		list[QualityValue]: A new list of QualityValue dictionaries, sorted by quality groups in descending order and shuffled within each group.
 	"""
-	groups = {}
+	rng = get_rng(rng)
+	
+	groups: dict[int, list[QualityValue]] = {}
 	
 	for value in values:
-		quality_str = f"{value['quality']:.1f}" if isinstance(value["quality"], float) else ""
+		bucket = get_quality_bucket(value["quality"] if isinstance(value["quality"], float) else None)
 	
-		if quality_str not in groups:
-			groups[quality_str] = [value]
+		if bucket not in groups:
+			groups[bucket] = [value]
 		else:
-			groups[quality_str].append(value)
-	
-	groups: dict[str, list[QualityValue]] = dict(
-			sorted(
-					groups.items(),
-					key=lambda item_: float(item_[0])
-					if item_[0]
-					else 2.0,
-					reverse=True
-			)
-	)
+			groups[bucket].append(value)
 	
-	for quality_str, items_list in groups.items():
-		random.shuffle(items_list)
+	sorted_values = []
 	
-	return [
-		QualityValue(name=item["name"], quality=item["quality"])
-		for quality_str, items_list in groups.items()
-		for item in items_list
-	]
+	for bucket in sorted(groups, reverse=True):
+		items_list = groups[bucket]
+		rng.shuffle(items_list)
+	
+		sorted_values += [QualityValue(name=item["name"], quality=item["quality"]) for item in items_list]
+	
+	return sorted_values
 
 
 def get_quality_string(value: QualityValue) -> str:
@@ -66,11 +128,155 @@ def get_quality_string(value: QualityValue) -> str:
 	return f"{value['name']}; q={value['quality']:.1f}" if value["quality"] is not None else value["name"]
 
 
+def get_quality_bucket(quality: Optional[float]) -> int:
+	"""
+	Converts a quality value to the bucket of `QualityItem`.
+
+	The bucket is the number of tenths the quality is printed with, so two qualities share a bucket exactly when they give the same "; q=0.x" suffix.
+
+	Args:
+		quality (Optional[float]): The quality value, or None for no quality.
+
+	Returns:
+		int: The bucket of the quality, or `no_quality_bucket` if it is None.
+	"""
+	if quality is None:
+		return no_quality_bucket
+	
+	return round(round(quality, 1) * 10)
+
+
+def to_quality_value(value: Union[str, QualityValue, QualityItem]) -> QualityValue:
+	"""
+	Converts a header item to a `QualityValue` dictionary.
+
+	Args:
+		value (Union[str, QualityValue, QualityItem]): A name without quality, a QualityItem or a QualityValue dictionary, which is returned as is.
+
+	Returns:
+		QualityValue: The dictionary form of the item.
+	"""
+	if isinstance(value, str):
+		return QualityValue(name=value, quality=None)
+	
+	if isinstance(value, QualityItem):
+		return QualityValue(
+				name=value.name,
+				quality=None
+				if value.bucket == no_quality_bucket
+				else value.bucket / 10
+		)
+	
+	return value
+
+
+def to_quality_item(value: Union[str, QualityValue, QualityItem]) -> QualityItem:
+	"""
+	Converts a header item to a `QualityItem`.
+
+	Args:
+		value (Union[str, QualityValue, QualityItem]): A name without quality, a QualityValue dictionary or a QualityItem, which is returned as is.
+
+	Returns:
+		QualityItem: The compact form of the item.
+
+	Raises:
+		ValueError: If the quality of the item is outside the range from 0.0 to 1.0.
+	"""
+	if isinstance(value, QualityItem):
+		return value
+	
+	if isinstance(value, str) or value["quality"] is None:
+		return QualityItem(value if isinstance(value, str) else value["name"], no_quality_bucket)
+	
+	bucket = get_quality_bucket(value["quality"])
+	
+	if not 0 <= bucket <= 10:
+		raise ValueError(f"Invalid quality value for '{value['name']}': {value['quality']}. Must be between 0.0 and 1.0.")
+	
+	return QualityItem(value["name"], bucket)
+
+
+def generate_quality_items(names: list[str], min_quality: float, rng: random.Random) -> list[QualityItem]:
+	"""
+	Gives random header candidates their quality values.
+
+	Every candidate gets no quality or a uniform random quality from `min_quality` to 1.0 with equal chance, drawn with the same
+	random calls as the original per-item QualityValue dictionaries, but only the bucket of the quality is kept.
+
+	Args:
+		names (list[str]): The names of the candidates.
+		min_quality (float): The lower bound of the random quality values.
+		rng (random.Random): The random generator to draw with.
+
+	Returns:
+		list[QualityItem]: The candidates with their quality buckets.
+	"""
+	return [
+		QualityItem(
+				name,
+				round(round(rng.uniform(min_quality, 1.0), 1) * 10)
+				if rng.choice([True, False])
+				else no_quality_bucket
+		)
+		for name in names
+	]
+
+
+def sort_quality_items(items: list[QualityItem], rng: Optional[random.Random] = None) -> list[QualityItem]:
+	"""
+	Sorts QualityItem items by descending quality and shuffles the items within each quality.
+
+	This is the `sort_qualities` of the compact representation: the groups are keyed by the integer bucket, and the random generator
+	is used in the same order, so both functions give the same order for the same random state.
+
+	Args:
+		items (list[QualityItem]): The items to sort.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[QualityItem]: A new list of the items, grouped by descending quality and shuffled within each group.
+	"""
+	rng = get_rng(rng)
+	
+	groups: dict[int, list[QualityItem]] = {}
+	
+	for item in items:
+		if item.bucket not in groups:
+			groups[item.bucket] = [item]
+		else:
+			groups[item.bucket].append(item)
+	
+	sorted_items = []
+	
+	for bucket in sorted(groups, reverse=True):
+		group = groups[bucket]
+		rng.shuffle(group)
+	
+		sorted_items += group
+	
+	return sorted_items
+
+
+def join_quality_items(items: list[QualityItem]) -> str:
+	"""
+	Assembles a header string from QualityItem items.
+
+	Args:
+		items (list[QualityItem]): The items in header order.
+
+	Returns:
+		str: The items joined with ", ", each followed by its precomputed "; q=0.x" suffix.
+	"""
+	return ", ".join([name + quality_suffixes[bucket] for name, bucket in items])
+
+
 def calculate_num_choices(
 		list_len: int,
 		fixed_len: Optional[int] = None,
 		max_len: Optional[int] = None,
-		min_len: int = 0
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
 ) -> int:
 	"""
 	Calculates the number of choices to be made, considering fixed, maximum, and minimum lengths.
@@ -85,15 +291,18 @@ def calculate_num_choices(
 		fixed_len (Optional[int]): If provided, the function will attempt to return exactly this number of choices. If `fixed_len` is greater than `list_len`, it will return `list_len`.
 		max_len (Optional[int]): The maximum number of choices to be made. Used only when `fixed_len` is None. If None, the maximum number of choices defaults to `list_len`.
 		min_len (int): The minimum number of choices to be made. Used only when `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		int: The calculated number of choices.
 	"""
+	rng = get_rng(rng)
+	
 	if fixed_len is None:
 		min_choices = min_len
 		max_choices = list_len if max_len is None else min(max_len, list_len)
 	
-		num_choices = random.randint(min_choices, max_choices)
+		num_choices = rng.randint(min_choices, max_choices)
 	else:
 		num_choices = min(fixed_len, list_len)
 	
@@ -146,7 +355,8 @@ def build_start_quality_values(values: necessary_quality_values) -> list[Quality
 				- `None`: Returns an empty list.
 				- `str`: A single string representing the 'name' of a `QualityValue` with no specified quality. Returns a list containing a single `QualityValue` with the given name and `quality=None`.
 				- `QualityValue`: A single `QualityValue` dictionary. Returns a list containing this single `QualityValue`.
-				- `list[Union[str, QualityValue]]`: A list where each element can be either a string (name of `QualityValue`) or a `QualityValue` dictionary. Returns a list of `QualityValue` dictionaries. Strings in the list are converted to `QualityValue` with `quality=None`.
+				- `QualityItem`: A single `QualityItem`. Returns a list containing it converted to a `QualityValue`.
+				- `list[Union[str, QualityValue, QualityItem]]`: A list where each element can be either a string (name of `QualityValue`), a `QualityValue` dictionary or a `QualityItem`. Returns a list of `QualityValue` dictionaries. Strings in the list are converted to `QualityValue` with `quality=None`.
 
 	Returns:
 		list[QualityValue]: A list of `QualityValue` dictionaries.
@@ -158,16 +368,158 @@ def build_start_quality_values(values: necessary_quality_values) -> list[Quality
 		return []
 	elif isinstance(values, str):
 		return [QualityValue(name=values, quality=None)]
+	elif isinstance(values, QualityItem):
+		return [to_quality_value(values)]
 	elif is_quality_value(values):
 		return [values]
-	elif isinstance(values, list) and all(isinstance(value, str) or is_quality_value(value) for value in values):
-		return [
-			QualityValue(name=value, quality=None)
-			if isinstance(value, str)
-			else value
+	elif isinstance(values, list) and all(
+			isinstance(value, (str, QualityItem)) or is_quality_value(value)
 			for value in values
-		]
+	):
+		return [to_quality_value(value) for value in values]
+	else:
+		raise ValueError(
+				"Invalid value for 'values'. Must be a QualityValue or a list of QualityValue dictionaries."
+		)
+
+
+def build_start_quality_items(values: necessary_quality_values) -> list[QualityItem]:
+	"""
+	Builds a list of QualityItem items from the same inputs as `build_start_quality_values`.
+
+	Args:
+		values (necessary_quality_values): None, a name, a QualityValue dictionary, a QualityItem, or a list of them.
+
+	Returns:
+		list[QualityItem]: The items in the compact representation.
+
+	Raises:
+		ValueError: If the provided type of `values` argument is not supported, or a quality is outside the range from 0.0 to 1.0.
+	"""
+	if values is None:
+		return []
+	elif isinstance(values, (str, QualityItem)) or is_quality_value(values):
+		return [to_quality_item(values)]
+	elif isinstance(values, list) and all(
+			isinstance(value, (str, QualityItem)) or is_quality_value(value)
+			for value in values
+	):
+		return [to_quality_item(value) for value in values]
 	else:
 		raise ValueError(
 				"Invalid value for 'values'. Must be a QualityValue or a list of QualityValue dictionaries."
 		)
+
+
+def get_quality_distribution(min_quality: float) -> tuple[list[Optional[float]], list[float]]:
+	"""
+	Builds the distribution of the quality values that the random header generators assign to candidates.
+
+	A generator gives a candidate no quality with probability 1/2 and otherwise a `random.uniform(min_quality, 1.0)` quality,
+	which is printed with one decimal. The possible outcomes are therefore None and the one-decimal buckets between `min_quality` and 1.0,
+	and this function returns them with their cumulative probabilities, ready for `random.choices`.
+
+	Args:
+		min_quality (float): The lower bound of the uniform quality range, between 0.0 and 1.0.
+
+	Returns:
+		tuple[list[Optional[float]], list[float]]: The possible qualities (None first) and their cumulative weights.
+	"""
+	qualities: list[Optional[float]] = [None]
+	cum_weights = [0.5]
+	
+	for tenth in range(11):
+		quality = tenth / 10
+		weight = min(quality + 0.05, 1.0) - max(quality - 0.05, min_quality)
+	
+		if weight > 0:
+			qualities.append(quality)
+			cum_weights.append(cum_weights[-1] + 0.5 * weight / (1.0 - min_quality))
+	
+	return qualities, cum_weights
+
+
+def generate_quality_headers_batch(
+		n: int,
+		pool: CandidatePool,
+		start_values: list[QualityItem],
+		excluded_indexes: set[int],
+		wildcard: str,
+		min_quality: float,
+		sort: bool,
+		fixed_len: Optional[int] = None,
+		max_len: Optional[int] = None,
+		min_len: int = 0,
+		rng: Optional[random.Random] = None
+) -> list[str]:
+	"""
+	Generates `n` quality-value header strings in one call.
+
+	This is the shared engine of the `*_batch` header generators. Per header, the result follows the same distribution as the scalar generators:
+	the number of candidates is drawn like `calculate_num_choices` does, candidates are sampled from the pool without the excluded values,
+	each one gets no quality or a uniform quality from `min_quality` to 1.0 with equal chance, and the items are either grouped by quality
+	like `sort_qualities` does or fully shuffled. Instead of one `random.uniform`, `random.choice` and QualityValue dictionary per candidate,
+	the lengths and the rounded qualities of the whole batch are drawn with one `random.choices` call each, the candidates of all headers
+	are drawn with one `CandidatePool.sample_batch` call, and items are built from precomputed "; q=..." suffixes. Only the final shuffle
+	of the items stays per header.
+
+	Args:
+		n (int): The number of headers to generate.
+		pool (CandidatePool): The pool to draw candidates from.
+		start_values (list[QualityItem]): Items put into every header before the random candidates.
+		excluded_indexes (set[int]): Pool indexes that must not be drawn, as returned by `CandidatePool.get_excluded_indexes`.
+		wildcard (str): The name of the wildcard item appended with quality 0.1 to every header.
+		min_quality (float): The lower bound of the random quality values.
+		sort (bool): If True, items are grouped by descending quality and shuffled within each group. If False, all items are shuffled.
+		fixed_len (Optional[int]): If provided, every header gets exactly this many random candidates (or all available ones).
+		max_len (Optional[int]): The maximum number of random candidates. Used if `fixed_len` is None. Defaults to the number of available candidates.
+		min_len (int): The minimum number of random candidates. Used if `fixed_len` is None. Defaults to 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[str]: The generated header strings.
+
+	Raises:
+		ValueError: If `min_len` is greater than the maximum number of candidates.
+	"""
+	rng = get_rng(rng)
+	
+	qualities, cum_weights = get_quality_distribution(min_quality)
+	sort_keys = [get_quality_bucket(quality) for quality in qualities]
+	suffixes = [quality_suffixes[bucket] for bucket in sort_keys]
+	
+	start_items = [(bucket, name + quality_suffixes[bucket]) for name, bucket in start_values]
+	wildcard_string = wildcard + quality_suffixes[1]
+	
+	available = pool.count_available(excluded_indexes)
+	
+	if fixed_len is None:
+		max_choices = available if max_len is None else min(max_len, available)
+	
+		if min_len > max_choices:
+			raise ValueError(f"min_len ({min_len}) is greater than the number of available candidates ({max_choices}).")
+	
+		lengths = rng.choices(range(min_len, max_choices + 1), k=n)
+	else:
+		lengths = [min(fixed_len, available)] * n
+	
+	codes = rng.choices(range(len(qualities)), cum_weights=cum_weights, k=sum(lengths))
+	samples = pool.sample_batch(lengths, excluded_indexes, rng)
+	headers = []
+	position = 0
+	
+	for length, names in zip(lengths, samples):
+		items = start_items + [
+			(sort_keys[code], name + suffixes[code])
+			for name, code in zip(names, codes[position:position + length])
+		]
+		position += length
+	
+		rng.shuffle(items)
+	
+		if sort:
+			items.sort(key=lambda item: item[0], reverse=True)
+	
+		headers.append(", ".join([item[1] for item in items] + [wildcard_string]))
+	
+	return headers
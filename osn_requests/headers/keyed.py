@@ -0,0 +1,172 @@
+from osn_requests.types import RequestHeaders
+from osn_requests.headers.functions import get_key_rng
+from osn_requests.headers.user_agent import generate_random_user_agent_header
+from osn_requests.headers.user_agent.weights import UserAgentWeights
+from typing import (
+	Optional,
+	Union
+)
+from osn_requests.headers.accept import (
+	generate_random_accept_header,
+	generate_random_realistic_accept_header
+)
+from osn_requests.headers.accept_charset import (
+	generate_random_accept_charset_header,
+	generate_random_realistic_accept_charset_header
+)
+from osn_requests.headers.accept_encoding import (
+	generate_random_accept_encoding_header,
+	generate_random_realistic_accept_encoding_header
+)
+from osn_requests.headers.accept_language import (
+	generate_random_accept_language_header,
+	generate_random_realistic_accept_language_header
+)
+
+
+def user_agent_for_key(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		weights: Optional[UserAgentWeights] = None
+) -> str:
+	"""
+	Generates the user agent of a key.
+
+	The generator chain of `generate_random_user_agent_header` is run with a random generator seeded from a hash of the key,
+	so every process returns the same coherent user agent for the same key and salt without storing it anywhere.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Change it to give every key a new user agent. Defaults to "".
+		weights (Optional[UserAgentWeights]): Weights for the user agent choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		str: The user agent string of the key.
+	"""
+	return generate_random_user_agent_header(rng=get_key_rng(key, salt, "User-Agent"), weights=weights)
+
+
+def accept_header_for_key(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		realistic: bool = True
+) -> str:
+	"""
+	Generates the Accept header of a key.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Defaults to "".
+		realistic (bool): Use `generate_random_realistic_accept_header` if True, `generate_random_accept_header` otherwise. Defaults to True.
+
+	Returns:
+		str: The Accept header of the key.
+	"""
+	rng = get_key_rng(key, salt, "Accept")
+	
+	if realistic:
+		return generate_random_realistic_accept_header(rng=rng)
+	
+	return generate_random_accept_header(rng=rng)
+
+
+def accept_charset_header_for_key(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		realistic: bool = True
+) -> str:
+	"""
+	Generates the Accept-Charset header of a key.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Defaults to "".
+		realistic (bool): Use `generate_random_realistic_accept_charset_header` if True, `generate_random_accept_charset_header` otherwise. Defaults to True.
+
+	Returns:
+		str: The Accept-Charset header of the key.
+	"""
+	rng = get_key_rng(key, salt, "Accept-Charset")
+	
+	if realistic:
+		return generate_random_realistic_accept_charset_header(rng=rng)
+	
+	return generate_random_accept_charset_header(rng=rng)
+
+
+def accept_encoding_header_for_key(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		realistic: bool = True
+) -> str:
+	"""
+	Generates the Accept-Encoding header of a key.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Defaults to "".
+		realistic (bool): Use `generate_random_realistic_accept_encoding_header` if True, `generate_random_accept_encoding_header` otherwise. Defaults to True.
+
+	Returns:
+		str: The Accept-Encoding header of the key.
+	"""
+	rng = get_key_rng(key, salt, "Accept-Encoding")
+	
+	if realistic:
+		return generate_random_realistic_accept_encoding_header(rng=rng)
+	
+	return generate_random_accept_encoding_header(rng=rng)
+
+
+def accept_language_header_for_key(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		realistic: bool = True
+) -> str:
+	"""
+	Generates the Accept-Language header of a key.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Defaults to "".
+		realistic (bool): Use `generate_random_realistic_accept_language_header` if True, `generate_random_accept_language_header` otherwise. Defaults to True.
+
+	Returns:
+		str: The Accept-Language header of the key.
+	"""
+	rng = get_key_rng(key, salt, "Accept-Language")
+	
+	if realistic:
+		return generate_random_realistic_accept_language_header(rng=rng)
+	
+	return generate_random_accept_language_header(rng=rng)
+
+
+def headers_for_key(
+		key: Union[str, bytes, int],
+		salt: Union[str, bytes] = "",
+		realistic: bool = True,
+		weights: Optional[UserAgentWeights] = None
+) -> RequestHeaders:
+	"""
+	Generates the whole header profile of a key.
+
+	Every header is derived from its own hash stream of the key, so a header keeps its value even if the set of generated headers
+	changes in a later version.
+
+	Args:
+		key (Union[str, bytes, int]): The key, e.g. a session, account or proxy identifier.
+		salt (Union[str, bytes]): A salt mixed into the hash. Defaults to "".
+		realistic (bool): Use the realistic Accept-* generators if True, the generators over all values otherwise. Defaults to True.
+		weights (Optional[UserAgentWeights]): Weights for the user agent choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		RequestHeaders: Accept, Accept-Encoding, Accept-Charset, Accept-Language and User-Agent headers of the key.
+	"""
+	return RequestHeaders(
+			Accept=accept_header_for_key(key, salt, realistic),
+			Accept_Encoding=accept_encoding_header_for_key(key, salt, realistic),
+			Accept_Charset=accept_charset_header_for_key(key, salt, realistic),
+			Accept_Language=accept_language_header_for_key(key, salt, realistic),
+			User_Agent=user_agent_for_key(key, salt, weights)
+	)
@@ -0,0 +1,250 @@
+import atexit
+import threading
+from collections import deque
+from osn_requests.types import RequestHeaders
+from osn_requests.headers.prepared import PreparedHeaders
+from typing import (
+	Any,
+	Callable,
+	Optional
+)
+from osn_requests.headers.profiles import (
+	generate_request_headers,
+	generate_request_headers_batch
+)
+
+
+class HeaderPool:
+	"""
+	Keeps a ring buffer of ready-to-send request header sets.
+
+	Header sets are generated ahead of time in batches of `batch_size` and stored as `PreparedHeaders`, so taking one with `pop`
+	is a single O(1) `deque.popleft` and `get_req` sends it without reformatting or copying it. Every popped set is a separate dictionary.
+
+	If the pool was started with `start`, a background thread refills the buffer up to `capacity` whenever it falls below `low_watermark`.
+	Otherwise, a `pop` call that finds the buffer empty generates the requested set directly and then tops the buffer up with one batch
+	of at most `min(low_watermark, batch_size)` sets, so no single call pays for filling the whole buffer.
+
+	Attributes:
+		capacity (int): The maximum number of header sets in the buffer.
+		low_watermark (int): The buffer size below which a refill is requested.
+		batch_size (int): The maximum number of header sets generated by one `batch_generator` call.
+		generator (Optional[Callable[..., RequestHeaders]]): The function that generates one header set, or None to use `batch_generator`.
+		batch_generator (Optional[Callable[..., list[RequestHeaders]]]): The function that generates `n` header sets, or None to call `generator` `n` times.
+		generator_kwargs (dict[str, Any]): Keyword arguments passed to the generators on every call.
+		last_error (Optional[Exception]): The error raised by the last failed background refill, or None.
+	"""
+	
+	def __init__(
+			self,
+			capacity: int = 1024,
+			low_watermark: Optional[int] = None,
+			generator: Optional[Callable[..., RequestHeaders]] = None,
+			generator_kwargs: Optional[dict[str, Any]] = None,
+			batch_generator: Optional[Callable[..., list[RequestHeaders]]] = None,
+			batch_size: int = 64
+	):
+		"""
+		Initializes a new instance of `HeaderPool`.
+
+		If neither `generator` nor `batch_generator` is given, `generate_request_headers` and `generate_request_headers_batch` are used,
+		which can be given a `profile` in `generator_kwargs`.
+
+		Args:
+			capacity (int): The maximum number of header sets in the buffer. Defaults to 1024.
+			low_watermark (Optional[int]): The buffer size below which a refill is requested. Defaults to None, which means a quarter of `capacity`.
+			generator (Optional[Callable[..., RequestHeaders]]): The function that generates one header set. Defaults to None.
+			generator_kwargs (Optional[dict[str, Any]]): Keyword arguments passed to the generators on every call. Defaults to None.
+			batch_generator (Optional[Callable[..., list[RequestHeaders]]]): The function that generates `n` header sets, called as `batch_generator(n, **generator_kwargs)`. Defaults to None.
+			batch_size (int): The maximum number of header sets generated by one `batch_generator` call. Defaults to 64.
+
+		Raises:
+			ValueError: If `capacity` or `batch_size` is less than 1 or `low_watermark` is not between 0 and `capacity`.
+		"""
+		if capacity < 1:
+			raise ValueError(f"capacity must be at least 1, got {capacity}")
+	
+		if batch_size < 1:
+			raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+	
+		if low_watermark is None:
+			low_watermark = capacity // 4
+	
+		if not 0 <= low_watermark <= capacity:
+			raise ValueError(f"low_watermark must be between 0 and {capacity}, got {low_watermark}")
+	
+		self.capacity = capacity
+		self.low_watermark = low_watermark
+		self.batch_size = batch_size
+	
+		if generator is None and batch_generator is None:
+			generator, batch_generator = generate_request_headers, generate_request_headers_batch
+	
+		self.generator = generator
+		self.batch_generator = batch_generator
+		self.generator_kwargs = generator_kwargs if generator_kwargs is not None else {}
+		self.last_error: Optional[Exception] = None
+	
+		self._buffer: deque[PreparedHeaders] = deque(maxlen=capacity)
+		self._fill_lock = threading.Lock()
+		self._refill_event = threading.Event()
+		self._stop_event = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+	
+	def __len__(self) -> int:
+		return len(self._buffer)
+	
+	@property
+	def is_running(self) -> bool:
+		"""
+		Whether the background refill thread is running.
+
+		Returns:
+			bool: True if the pool was started and not stopped yet.
+		"""
+		return self._thread is not None and self._thread.is_alive()
+	
+	def generate(self) -> PreparedHeaders:
+		"""
+		Generates one header set and prepares it for sending.
+
+		Returns:
+			PreparedHeaders: The header set with hyphenated keys.
+		"""
+		if self.generator is None:
+			return self.generate_batch(1)[0]
+	
+		return PreparedHeaders(self.generator(**self.generator_kwargs))
+	
+	def generate_batch(self, n: int) -> list[PreparedHeaders]:
+		"""
+		Generates `n` header sets and prepares them for sending.
+
+		Args:
+			n (int): The number of header sets.
+
+		Returns:
+			list[PreparedHeaders]: The header sets with hyphenated keys.
+		"""
+		if self.batch_generator is None:
+			return [self.generate() for _ in range(n)]
+	
+		return [PreparedHeaders(headers) for headers in self.batch_generator(n, **self.generator_kwargs)]
+	
+	def fill(self, size: Optional[int] = None) -> int:
+		"""
+		Fills the buffer up to `size` header sets, in batches of at most `batch_size`.
+
+		Every batch is added to the buffer as soon as it is generated. Only one fill runs at a time; a call made while another fill
+		is running returns immediately. A fill made by the background thread also ends early when `stop` is called.
+
+		Args:
+			size (Optional[int]): The buffer size to fill up to, capped by `capacity`. Defaults to None, which means `capacity`.
+
+		Returns:
+			int: The number of generated header sets.
+		"""
+		if not self._fill_lock.acquire(blocking=False):
+			return 0
+	
+		try:
+			size = self.capacity if size is None else min(size, self.capacity)
+			generated = 0
+			in_thread = threading.current_thread() is self._thread
+	
+			while not (in_thread and self._stop_event.is_set()):
+				missing = size - len(self._buffer)
+	
+				if missing <= 0:
+					break
+	
+				batch = self.generate_batch(min(missing, self.batch_size))
+				self._buffer.extend(batch)
+				generated += len(batch)
+	
+			return generated
+		finally:
+			self._fill_lock.release()
+	
+	def pop(self) -> PreparedHeaders:
+		"""
+		Takes one ready header set from the buffer.
+
+		If the buffer is empty, the set is generated directly. Then a started pool wakes its background thread, and a pool that was not
+		started tops the buffer up with one batch of at most `min(low_watermark, batch_size)` sets.
+
+		Returns:
+			PreparedHeaders: A header set with hyphenated keys, ready to be passed to `get_req`.
+		"""
+		try:
+			headers = self._buffer.popleft()
+		except IndexError:
+			headers = self.generate()
+	
+			if self.is_running:
+				self._refill_event.set()
+			else:
+				self.fill(min(self.low_watermark, self.batch_size))
+	
+			return headers
+	
+		if len(self._buffer) < self.low_watermark:
+			self._refill_event.set()
+	
+		return headers
+	
+	def run(self) -> None:
+		"""
+		The body of the background thread: refills the buffer whenever a refill is requested, until `stop` is called.
+
+		Errors are stored in `last_error` and the thread keeps waiting for the next request.
+		"""
+		while not self._stop_event.is_set():
+			self._refill_event.clear()
+	
+			try:
+				self.fill()
+				self.last_error = None
+			except Exception as error:
+				self.last_error = error
+	
+			self._refill_event.wait()
+	
+	def start(self) -> "HeaderPool":
+		"""
+		Starts the background refill thread. The first fill starts immediately.
+
+		Returns:
+			HeaderPool: The pool itself.
+		"""
+		if self.is_running:
+			return self
+	
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self.run, name="HeaderPool", daemon=True)
+		self._thread.start()
+	
+		atexit.register(self.stop, 1.0)
+	
+		return self
+	
+	def stop(self, timeout: Optional[float] = None) -> None:
+		"""
+		Stops the background refill thread and waits for it to finish the current fill.
+
+		Args:
+			timeout (Optional[float]): Maximum time to wait in seconds. Defaults to None, which means to wait forever.
+		"""
+		self._stop_event.set()
+		self._refill_event.set()
+	
+		if self._thread is not None and self._thread is not threading.current_thread():
+			self._thread.join(timeout)
+	
+		atexit.unregister(self.stop)
+	
+	def __enter__(self) -> "HeaderPool":
+		return self.start()
+	
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.stop()
@@ -0,0 +1,158 @@
+from osn_requests.types import RequestHeaders
+from typing import (
+	Any,
+	Iterable,
+	Mapping,
+	Optional,
+	Union
+)
+
+
+request_header_names = {field: field.replace("_", "-") for field in RequestHeaders.__annotations__}
+canonical_header_names = {name.lower(): name for name in request_header_names.values()}
+
+
+def get_header_name(key: str) -> str:
+	"""
+	Returns the wire form of a header key.
+
+	`RequestHeaders` fields are looked up in the precomputed `request_header_names` map. Other keys get their underscores replaced with hyphens,
+	and names of `RequestHeaders` fields in any case get their canonical case (e.g. "user-agent" gives "User-Agent").
+
+	Args:
+		key (str): The header key, e.g. "User_Agent" or "User-Agent".
+
+	Returns:
+		str: The hyphenated header name.
+
+	Raises:
+		TypeError: If the key is not a string.
+	"""
+	name = request_header_names.get(key)
+	
+	if name is not None:
+		return name
+	
+	if not isinstance(key, str):
+		raise TypeError("Keys and values in headers dictionary must be strings.")
+	
+	name = key.replace("_", "-")
+	
+	return canonical_header_names.get(name.lower(), name)
+
+
+class PreparedHeaders(dict):
+	"""
+	Request headers canonicalized once into their final wire form.
+
+	Keys are stored hyphenated (e.g. "User-Agent" for "User_Agent") and looked up case-insensitively, like HTTP header names are compared.
+	`reformat_headers` and `get_req` return and send a `PreparedHeaders` object as it is, without looping over its keys or copying it,
+	so one object can be reused for many requests. It is a plain `dict` for the request library.
+
+	Keys set later are canonicalized as well, and setting a key that differs from an existing one only in case replaces it.
+	"""
+	
+	def __init__(self, headers: Optional[Union[Mapping[str, Any], Iterable[tuple[str, Any]]]] = None, **kwargs: Any):
+		"""
+		Initializes a new instance of `PreparedHeaders`.
+
+		Args:
+			headers (Optional[Union[Mapping[str, Any], Iterable[tuple[str, Any]]]]): The headers, e.g. a `RequestHeaders` dictionary. Defaults to None.
+			**kwargs (Any): More headers, e.g. `User_Agent="..."`.
+
+		Raises:
+			TypeError: If a key is not a string.
+		"""
+		super().__init__()
+		self._names: dict[str, str] = {}
+	
+		self.update(headers or (), **kwargs)
+	
+	def _get_name(self, key: str) -> Optional[str]:
+		return self._names.get(get_header_name(key).lower())
+	
+	def __setitem__(self, key: str, value: Any) -> None:
+		name = get_header_name(key)
+		lower_name = name.lower()
+		existing_name = self._names.get(lower_name)
+	
+		if existing_name is not None and existing_name != name:
+			super().__delitem__(existing_name)
+	
+		self._names[lower_name] = name
+		super().__setitem__(name, value)
+	
+	def __getitem__(self, key: str) -> Any:
+		name = self._get_name(key)
+	
+		if name is None:
+			raise KeyError(key)
+	
+		return super().__getitem__(name)
+	
+	def __delitem__(self, key: str) -> None:
+		name = self._get_name(key)
+	
+		if name is None:
+			raise KeyError(key)
+	
+		del self._names[name.lower()]
+		super().__delitem__(name)
+	
+	def __contains__(self, key: object) -> bool:
+		return isinstance(key, str) and self._get_name(key) is not None
+	
+	def get(self, key: str, default: Any = None) -> Any:
+		name = self._get_name(key)
+	
+		return default if name is None else super().__getitem__(name)
+	
+	def pop(self, key: str, *default: Any) -> Any:
+		name = self._get_name(key)
+	
+		if name is None:
+			if default:
+				return default[0]
+	
+			raise KeyError(key)
+	
+		del self._names[name.lower()]
+		return super().pop(name)
+	
+	def setdefault(self, key: str, default: Any = None) -> Any:
+		if key not in self:
+			self[key] = default
+	
+		return self[key]
+	
+	def update(self, headers: Union[Mapping[str, Any], Iterable[tuple[str, Any]]] = (), **kwargs: Any) -> None:
+		items = headers.items() if isinstance(headers, Mapping) else headers
+	
+		for key, value in items:
+			self[key] = value
+	
+		for key, value in kwargs.items():
+			self[key] = value
+	
+	def popitem(self) -> tuple[str, Any]:
+		name, value = super().popitem()
+		del self._names[name.lower()]
+	
+		return name, value
+	
+	def __ior__(self, headers: Union[Mapping[str, Any], Iterable[tuple[str, Any]]]) -> "PreparedHeaders":
+		self.update(headers)
+		return self
+	
+	def clear(self) -> None:
+		self._names.clear()
+		super().clear()
+	
+	def copy(self) -> "PreparedHeaders":
+		return PreparedHeaders(self)
+	
+	def __reduce__(self) -> tuple[type, tuple[dict[str, Any]]]:
+		return PreparedHeaders, (dict(self),)
+	
+	def __repr__(self) -> str:
+		return f"PreparedHeaders({super().__repr__()})"
@@ -0,0 +1,254 @@
+import random
+from itertools import accumulate
+from collections import Counter
+from osn_requests.headers.functions import get_rng
+from osn_requests.headers.accept import AcceptHeaderSpec
+from osn_requests.headers.user_agent.weights import UserAgentWeights
+from osn_requests.headers.accept_charset import AcceptCharsetHeaderSpec
+from osn_requests.headers.user_agent.data import UserAgentSupportedParts
+from osn_requests.headers.accept_encoding import AcceptEncodingHeaderSpec
+from osn_requests.headers.user_agent import generate_user_agent_header_from_parts
+from typing import (
+	Optional,
+	Sequence,
+	Union
+)
+from osn_requests.headers.specs import (
+	FixedHeaderSpec,
+	header_spec
+)
+from osn_requests.headers.user_agent.batch import (
+	generate_user_agents,
+	get_user_agent_combinations
+)
+from osn_requests.headers.accept_language import (
+	AcceptLanguageHeaderSpec,
+	BrowserAcceptLanguageHeaderSpec
+)
+from osn_requests.headers.user_agent.errors import (
+	UnsupportedBrowserError,
+	UnsupportedOSError
+)
+from osn_requests.headers.user_agent.data_types import (
+	supported_ua_browsers,
+	supported_ua_platforms
+)
+
+
+class HeaderProfile:
+	"""
+	Precompiled description of a coherent request header set.
+
+	A profile holds one spec per header (`QualityHeaderSpec`, `FixedHeaderSpec` or `PreferenceHeaderSpec`) and the user agent
+	combinations of its browsers and platforms with their cumulative probabilities, so `generate` draws a whole header set
+	from one random generator without validating arguments or building pools.
+
+	Attributes:
+		specs (dict[str, header_spec]): The headers by hyphenated name, in output order.
+		browsers (Optional[tuple[supported_ua_browsers, ...]]): The user agent browsers, or None for all browsers.
+		platforms (Optional[tuple[supported_ua_platforms, ...]]): The user agent platforms, or None for all platforms.
+		weights (Optional[UserAgentWeights]): Weights for the user agent choices.
+		combinations (list[tuple[str, str, str]]): The (os, engine, browser) user agent combinations.
+		cum_weights (list[float]): The cumulative probabilities of `combinations`.
+	"""
+	
+	def __init__(
+			self,
+			specs: dict[str, header_spec],
+			browsers: Optional[Sequence[supported_ua_browsers]] = None,
+			weights: Optional[UserAgentWeights] = None,
+			platforms: Optional[Sequence[supported_ua_platforms]] = None
+	):
+		"""
+		Initializes a new instance of `HeaderProfile`.
+
+		Args:
+			specs (dict[str, header_spec]): The headers by hyphenated name, e.g. {"Accept": AcceptHeaderSpec()}.
+			browsers (Optional[Sequence[supported_ua_browsers]]): The browsers the User-Agent header may claim. Defaults to None, which means all browsers.
+			weights (Optional[UserAgentWeights]): Weights for the user agent choices. Defaults to None, which means uniform choices.
+			platforms (Optional[Sequence[supported_ua_platforms]]): The platforms the User-Agent header may claim. Defaults to None, which means all platforms.
+
+		Raises:
+			UnsupportedBrowserError: If a browser is not supported.
+			UnsupportedOSError: If a platform is not supported.
+			ValueError: If the weights leave no user agent combination of the browsers and platforms.
+		"""
+		self.specs = dict(specs)
+		self.browsers = None if browsers is None else tuple(browsers)
+		self.platforms = None if platforms is None else tuple(platforms)
+		self.weights = weights
+		self.combinations: list[tuple[str, str, str]] = []
+		probabilities: list[float] = []
+	
+		for browser in self.browsers if self.browsers is not None else [None]:
+			if browser is not None and browser not in UserAgentSupportedParts.browser:
+				raise UnsupportedBrowserError(browser)
+	
+			for platform in self.platforms if self.platforms is not None else [None]:
+				if platform is not None and platform not in UserAgentSupportedParts.os:
+					raise UnsupportedOSError(platform)
+	
+				combinations, combination_probabilities = get_user_agent_combinations(os=platform, browser=browser, weights=weights)
+				self.combinations += combinations
+				probabilities += combination_probabilities
+	
+		if not self.combinations:
+			raise ValueError("No user agent combination has a positive weight.")
+	
+		self.cum_weights = list(accumulate(probabilities))
+	
+	def generate(self, rng: Optional[random.Random] = None) -> dict[str, str]:
+		"""
+		Generates one header set.
+
+		Args:
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			dict[str, str]: The headers of the specs and the User-Agent header, with hyphenated keys.
+		"""
+		rng = get_rng(rng)
+	
+		headers = {name: spec.generate(rng) for name, spec in self.specs.items()}
+		os, engine, browser = rng.choices(self.combinations, cum_weights=self.cum_weights)[0]
+		headers["User-Agent"] = generate_user_agent_header_from_parts(os, engine, browser, rng=rng, weights=self.weights)
+	
+		return headers
+	
+	def generate_batch(self, n: int, rng: Optional[random.Random] = None) -> list[dict[str, str]]:
+		"""
+		Generates `n` header sets in one call.
+
+		Every header of the specs is drawn as one column with its `generate_batch`, and the user agents are drawn
+		with one `generate_user_agents` call per drawn (os, engine, browser) combination and shuffled. The sets have the distribution of `generate`.
+
+		Args:
+			n (int): The number of header sets.
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			list[dict[str, str]]: The header sets, with hyphenated keys.
+		"""
+		rng = get_rng(rng)
+	
+		columns = {name: spec.generate_batch(n, rng) for name, spec in self.specs.items()}
+		user_agents = []
+	
+		for (os, engine, browser), count in Counter(rng.choices(self.combinations, cum_weights=self.cum_weights, k=n)).items():
+			user_agents += generate_user_agents(count, os=os, browser=browser, rng=rng, weights=self.weights)
+	
+		rng.shuffle(user_agents)
+		columns["User-Agent"] = user_agents
+	
+		return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+header_profiles = {
+	"realistic": HeaderProfile(
+			specs={
+				"Accept": AcceptHeaderSpec(),
+				"Accept-Encoding": AcceptEncodingHeaderSpec(),
+				"Accept-Charset": AcceptCharsetHeaderSpec(),
+				"Accept-Language": AcceptLanguageHeaderSpec()
+			}
+	),
+	"chromium": HeaderProfile(
+			specs={
+				"Accept": FixedHeaderSpec(
+						"text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
+				),
+				"Accept-Encoding": FixedHeaderSpec("gzip, deflate, br, zstd"),
+				"Accept-Language": BrowserAcceptLanguageHeaderSpec()
+			},
+			browsers=UserAgentSupportedParts.blink_browsers,
+			platforms=["Windows", "Macintosh", "Linux", "Android"]
+	),
+	"firefox": HeaderProfile(
+			specs={
+				"Accept": FixedHeaderSpec("text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"),
+				"Accept-Encoding": FixedHeaderSpec("gzip, deflate, br, zstd"),
+				"Accept-Language": BrowserAcceptLanguageHeaderSpec(spread=True)
+			},
+			browsers=UserAgentSupportedParts.gecko_browsers,
+			platforms=["Windows", "Macintosh", "Linux", "Android"]
+	),
+	"safari": HeaderProfile(
+			specs={
+				"Accept": FixedHeaderSpec("text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"),
+				"Accept-Encoding": FixedHeaderSpec("gzip, deflate, br"),
+				"Accept-Language": BrowserAcceptLanguageHeaderSpec(max_len=2)
+			},
+			browsers=UserAgentSupportedParts.apple_webkit_browsers,
+			platforms=["Macintosh", "IOS"]
+	)
+}
+
+
+def get_header_profile(profile: Union[str, HeaderProfile]) -> HeaderProfile:
+	"""
+	Resolves a profile name to its `HeaderProfile`.
+
+	Args:
+		profile (Union[str, HeaderProfile]): The name of a profile in `header_profiles` or a `HeaderProfile`, which is returned as it is.
+
+	Returns:
+		HeaderProfile: The profile.
+
+	Raises:
+		ValueError: If `profile` is not the name of a profile in `header_profiles`.
+	"""
+	if isinstance(profile, str):
+		if profile not in header_profiles:
+			raise ValueError(f"Unknown header profile '{profile}'. Available profiles: {', '.join(header_profiles)}.")
+	
+		return header_profiles[profile]
+	
+	return profile
+
+
+def generate_request_headers(
+		profile: Union[str, HeaderProfile] = "realistic",
+		rng: Optional[random.Random] = None
+) -> dict[str, str]:
+	"""
+	Generates a whole request header set in one call.
+
+	All headers are drawn from one random generator with the precompiled specs and pools of the profile, and the keys are
+	already hyphenated like `reformat_headers` would make them. The "realistic" profile has the distribution of
+	the five realistic generators. The "chromium", "firefox" and "safari" profiles pair a user agent of those browsers
+	on the platforms they run on with the exact Accept and Accept-Encoding strings they send on navigation, an Accept-Language
+	with a primary language and strictly descending qualities, and no Accept-Charset, which current browsers do not send.
+
+	Args:
+		profile (Union[str, HeaderProfile]): The name of a profile in `header_profiles` or a `HeaderProfile`. Defaults to "realistic".
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		dict[str, str]: The header set with hyphenated keys.
+
+	Raises:
+		ValueError: If `profile` is not the name of a profile in `header_profiles`.
+	"""
+	return get_header_profile(profile).generate(rng)
+
+
+def generate_request_headers_batch(
+		n: int,
+		profile: Union[str, HeaderProfile] = "realistic",
+		rng: Optional[random.Random] = None
+) -> list[dict[str, str]]:
+	"""
+	Generates `n` whole request header sets in one call with `HeaderProfile.generate_batch`.
+
+	Args:
+		n (int): The number of header sets.
+		profile (Union[str, HeaderProfile]): The name of a profile in `header_profiles` or a `HeaderProfile`. Defaults to "realistic".
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		list[dict[str, str]]: The header sets with hyphenated keys.
+
+	Raises:
+		ValueError: If `profile` is not the name of a profile in `header_profiles`.
+	"""
+	return get_header_profile(profile).generate_batch(n, rng)
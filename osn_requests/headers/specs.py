@@ -0,0 +1,272 @@
+import random
+from osn_requests.headers.candidates import CandidatePool
+from typing import (
+	Optional,
+	Union
+)
+from osn_requests.headers.types import (
+	QualityItem,
+	necessary_quality_values
+)
+from osn_requests.headers.functions import (
+	build_start_quality_items,
+	generate_quality_headers_batch,
+	generate_quality_items,
+	get_rng,
+	join_quality_items,
+	sort_quality_items
+)
+
+
+class QualityHeaderSpec:
+	"""
+	Precompiled arguments of a quality-value header generator.
+
+	The necessary values are validated and converted to QualityItem items once, the candidate pool without them is built once,
+	and the range of the number of random candidates is checked once. `generate` then only draws the length, the candidates
+	and their qualities and joins the string, so a spec suits callers that generate the same header with the same arguments
+	on every request. The header classes (e.g. `AcceptHeaderSpec`) fill in the pool, wildcard and quality range of their header.
+
+	Attributes:
+		start_items (list[QualityItem]): The necessary items put into every header, empty if `include_necessary` was False.
+		pool (CandidatePool): The candidates that can be drawn, without the necessary items.
+		lengths (range): The possible numbers of random candidates.
+		wildcard_item (QualityItem): The wildcard item appended with quality 0.1 to every header.
+		min_quality (float): The lower bound of the random quality values.
+		sort (bool): If True, items are grouped by descending quality and shuffled within each group. If False, all items are shuffled.
+	"""
+	
+	def __init__(
+			self,
+			pool: CandidatePool,
+			wildcard: str,
+			min_quality: float,
+			sort: bool,
+			necessary: necessary_quality_values = None,
+			fixed_len: Optional[int] = None,
+			max_len: Optional[int] = None,
+			min_len: int = 0,
+			include_necessary: bool = True
+	):
+		"""
+		Initializes a new instance of `QualityHeaderSpec`.
+
+		Args:
+			pool (CandidatePool): The pool to draw candidates from.
+			wildcard (str): The name of the wildcard item appended with quality 0.1 to every header.
+			min_quality (float): The lower bound of the random quality values.
+			sort (bool): If True, items are grouped by descending quality and shuffled within each group. If False, all items are shuffled.
+			necessary (necessary_quality_values): Values that must be included in every header. Defaults to None.
+			fixed_len (Optional[int]): If provided, every header gets exactly this many random candidates (or all available ones).
+			max_len (Optional[int]): The maximum number of random candidates. Used if `fixed_len` is None. Defaults to the number of available candidates.
+			min_len (int): The minimum number of random candidates. Used if `fixed_len` is None. Defaults to 0.
+			include_necessary (bool): Put the necessary values into every header if True, only exclude them from the random candidates otherwise. Defaults to True.
+
+		Raises:
+			ValueError: If `necessary` is not a supported value, or `min_len` is greater than the maximum number of candidates.
+		"""
+		necessary_items = build_start_quality_items(necessary)
+		self.start_items = necessary_items if include_necessary else []
+	
+		excluded_indexes = pool.get_excluded_indexes(necessary_items)
+		self.pool = CandidatePool(
+				value
+				for index, value in enumerate(pool.values)
+				if index not in excluded_indexes
+		)
+	
+		if fixed_len is None:
+			max_choices = len(self.pool) if max_len is None else min(max_len, len(self.pool))
+	
+			if min_len > max_choices:
+				raise ValueError(f"min_len ({min_len}) is greater than the number of available candidates ({max_choices}).")
+	
+			self.lengths = range(min_len, max_choices + 1)
+		else:
+			num_choices = min(fixed_len, len(self.pool))
+			self.lengths = range(num_choices, num_choices + 1)
+	
+		self.wildcard_item = QualityItem(wildcard, 1)
+		self.min_quality = min_quality
+		self.sort = sort
+	
+	def generate(self, rng: Optional[random.Random] = None) -> str:
+		"""
+		Generates one header string.
+
+		Args:
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			str: The generated header string.
+		"""
+		rng = get_rng(rng)
+	
+		items = self.start_items + generate_quality_items(
+				rng.sample(self.pool.values, k=rng.choice(self.lengths)),
+				self.min_quality,
+				rng
+		)
+	
+		if self.sort:
+			items = sort_quality_items(items, rng=rng)
+		else:
+			rng.shuffle(items)
+	
+		items.append(self.wildcard_item)
+	
+		return join_quality_items(items)
+	
+	def generate_batch(self, n: int, rng: Optional[random.Random] = None) -> list[str]:
+		"""
+		Generates `n` header strings in one call with `generate_quality_headers_batch`.
+
+		Args:
+			n (int): The number of headers to generate.
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			list[str]: The generated header strings.
+		"""
+		return generate_quality_headers_batch(
+				n=n,
+				pool=self.pool,
+				start_values=self.start_items,
+				excluded_indexes=set(),
+				wildcard=self.wildcard_item.name,
+				min_quality=self.min_quality,
+				sort=self.sort,
+				max_len=self.lengths.stop - 1,
+				min_len=self.lengths.start,
+				rng=rng
+		)
+
+
+class FixedHeaderSpec:
+	"""
+	A header that always has the same value, e.g. the Accept header a browser sends on navigation.
+
+	It has the `generate` and `generate_batch` methods of `QualityHeaderSpec`, so it can be used in a `HeaderProfile`.
+
+	Attributes:
+		value (str): The header value.
+	"""
+	
+	def __init__(self, value: str):
+		"""
+		Initializes a new instance of `FixedHeaderSpec`.
+
+		Args:
+			value (str): The header value.
+		"""
+		self.value = value
+	
+	def generate(self, rng: Optional[random.Random] = None) -> str:
+		"""
+		Returns the header value.
+
+		Args:
+			rng (Optional[random.Random]): Not used. Accepted for the interface of `QualityHeaderSpec`.
+
+		Returns:
+			str: The header value.
+		"""
+		return self.value
+	
+	def generate_batch(self, n: int, rng: Optional[random.Random] = None) -> list[str]:
+		"""
+		Returns the header value `n` times.
+
+		Args:
+			n (int): The number of headers.
+			rng (Optional[random.Random]): Not used. Accepted for the interface of `QualityHeaderSpec`.
+
+		Returns:
+			list[str]: The header value `n` times.
+		"""
+		return [self.value] * n
+
+
+class PreferenceHeaderSpec:
+	"""
+	Precompiled arguments of a browser-style preference list header, e.g. "de,en;q=0.9,fr;q=0.8".
+
+	The values are distinct random pool values. The first one has no quality, and the ones after it have strictly descending qualities:
+	1.0 - 0.1 * n for the n-th one, as Chromium and Safari send them, or, with `spread`, 1.0 - n / length rounded to one decimal,
+	as Firefox sends them. The items are joined without spaces, like browsers do. The quality suffixes of every length are built once.
+
+	Attributes:
+		pool (CandidatePool): The values that can be drawn.
+		lengths (range): The possible numbers of values.
+		suffixes (dict[int, list[str]]): The quality suffixes of every possible length.
+	"""
+	
+	def __init__(self, pool: CandidatePool, max_len: int, min_len: int = 1, spread: bool = False):
+		"""
+		Initializes a new instance of `PreferenceHeaderSpec`.
+
+		Args:
+			pool (CandidatePool): The pool to draw values from.
+			max_len (int): The maximum number of values per header, at most 10 and the size of the pool.
+			min_len (int): The minimum number of values per header. Defaults to 1.
+			spread (bool): Spread the qualities over (0, 1) like Firefox if True, step them down by 0.1 like Chromium and Safari if False. Defaults to False.
+
+		Raises:
+			ValueError: If the lengths are not 1 <= `min_len` <= `max_len` <= min(10, size of the pool).
+		"""
+		if not 1 <= min_len <= max_len <= min(10, len(pool)):
+			raise ValueError(
+					f"min_len ({min_len}) and max_len ({max_len}) must satisfy 1 <= min_len <= max_len <= {min(10, len(pool))}."
+			)
+	
+		self.pool = pool
+		self.lengths = range(min_len, max_len + 1)
+		self.suffixes: dict[int, list[str]] = {}
+	
+		for length in self.lengths:
+			buckets = [int((1.0 - index / length) * 10 + 0.5) if spread else 10 - index for index in range(length)]
+			self.suffixes[length] = [""] + [f";q=0.{bucket}" for bucket in buckets[1:]]
+	
+	def join(self, values: list[str]) -> str:
+		"""
+		Joins drawn values with their quality suffixes.
+
+		Args:
+			values (list[str]): The values in order of preference.
+
+		Returns:
+			str: The header string.
+		"""
+		return ",".join([value + suffix for value, suffix in zip(values, self.suffixes[len(values)])])
+	
+	def generate(self, rng: Optional[random.Random] = None) -> str:
+		"""
+		Generates one header string.
+
+		Args:
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			str: The generated header string.
+		"""
+		rng = get_rng(rng)
+	
+		return self.join(rng.sample(self.pool.values, k=rng.choice(self.lengths)))
+	
+	def generate_batch(self, n: int, rng: Optional[random.Random] = None) -> list[str]:
+		"""
+		Generates `n` header strings, with all lengths and values drawn in one pass by `CandidatePool.sample_batch`.
+
+		Args:
+			n (int): The number of headers to generate.
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			list[str]: The generated header strings.
+		"""
+		rng = get_rng(rng)
+	
+		return [self.join(values) for values in self.pool.sample_batch(rng.choices(self.lengths, k=n), set(), rng)]
+
+
+header_spec = Union[QualityHeaderSpec, FixedHeaderSpec, PreferenceHeaderSpec]
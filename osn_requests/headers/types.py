@@ -1,4 +1,5 @@
 from typing import (
+	NamedTuple,
 	Optional,
 	TypedDict,
 	Union
@@ -19,5 +20,20 @@ class QualityValue(TypedDict):
 	quality: Optional[float]
 
 
-necessary_quality_value = Union[str, QualityValue]
+class QualityItem(NamedTuple):
+	"""
+	Compact, tuple-backed form of a QualityValue used while a header is assembled.
+
+	The quality is stored as a numeric bucket, the number of tenths it is printed with, so grouping and sorting compare integers
+	and the "; q=0.x" suffix of an item is a lookup in a precomputed table instead of a float formatting call.
+
+	Attributes:
+	   name (str): The name of the item, such as a mime type, charset, or language code.
+	   bucket (int): The quality in tenths, from 0 (q=0.0) to 10 (q=1.0), or 11 if the item has no quality. A higher bucket sorts first.
+	"""
+	name: str
+	bucket: int
+
+
+necessary_quality_value = Union[str, QualityValue, QualityItem]
 necessary_quality_values = Optional[Union[necessary_quality_value, list[necessary_quality_value]]]
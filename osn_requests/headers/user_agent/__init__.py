@@ -1,22 +1,113 @@
+import random
+from typing import Optional
+from osn_requests.headers.functions import get_rng
 from osn_requests.headers.user_agent.os_ua_generation import generate_random_os_ua
-from osn_requests.headers.user_agent.engine_ua_generation import generate_random_engine_ua
-from osn_requests.headers.user_agent.browser_ua_generation import generate_random_browser_ua
+from osn_requests.headers.user_agent.browser_ua_generation import generate_random_browser_versions
 from osn_requests.headers.user_agent.mozilla_ua_generation import generate_random_mozilla_ua
+from osn_requests.headers.user_agent.space import UserAgentSpace
+from osn_requests.headers.user_agent.batch import generate_user_agents
+from osn_requests.headers.user_agent.weights import (
+	UserAgentWeights,
+	market_share_user_agent_weights
+)
+from osn_requests.headers.user_agent.data import (
+	UserAgentSupportedParts,
+	UserAgentTemplates
+)
+from osn_requests.headers.user_agent.data_types import (
+	supported_ua_browsers,
+	supported_ua_engines,
+	supported_ua_platforms
+)
+from osn_requests.headers.user_agent.engine_ua_generation import (
+	format_engine_version,
+	generate_random_engine_version
+)
 
 
-def generate_random_user_agent_header() -> str:
+user_agent_templates = {
+	(engine, browser): f"{{mozilla}} ({{os}}) {UserAgentTemplates.engines[engine]} {UserAgentTemplates.browsers[browser]}".format
+	for engine in UserAgentSupportedParts.engine
+	for browser in UserAgentSupportedParts.browser
+}
+
+
+def generate_random_user_agent_header(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a complete random user agent header string.
 
 	This function combines the Mozilla, OS, Engine, and Browser user agent parts
-	to generate a complete user agent string.
+	to generate a complete user agent string. The engine and browser generators exchange structured versions,
+	and the string is assembled once from the precompiled template of the engine and browser combination.
+
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the OS, engine, browser, version and device choices, e.g. `market_share_user_agent_weights`. Defaults to None, which means uniform choices.
+
+	Returns:
+		str: Complete user agent string.
+	"""
+	os_ua, used_os = generate_random_os_ua(rng=rng, weights=weights)
+	used_engine, engine_version = generate_random_engine_version(platform=used_os, rng=rng, weights=weights)
+	used_browser, browser_versions = generate_random_browser_versions(
+			engine=used_engine,
+			apple_webkit_version=None if used_engine == "Gecko" else engine_version,
+			rng=rng,
+			weights=weights
+	)
+	
+	return user_agent_templates[(used_engine, used_browser)](
+			mozilla=generate_random_mozilla_ua(),
+			os=os_ua,
+			engine_version=format_engine_version(used_engine, engine_version),
+			**browser_versions
+	)
+
+
+def generate_user_agent_header_from_parts(
+		os: supported_ua_platforms,
+		engine: supported_ua_engines,
+		browser: supported_ua_browsers,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
+	"""
+	Generates a random user agent header string of a given platform, engine and browser combination.
+
+	The versions and devices are drawn like in `generate_random_user_agent_header`, so drawing the combination from
+	`get_user_agent_combinations` first gives the same distribution, restricted to the listed combinations.
+
+	Args:
+		os (supported_ua_platforms): The platform.
+		engine (supported_ua_engines): The engine. Must be supported on the platform (only AppleWebKit on iOS).
+		browser (supported_ua_browsers): The browser. Must be a browser of the engine.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the version and device choices. Defaults to None, which means uniform choices.
 
 	Returns:
 		str: Complete user agent string.
+
+	Raises:
+		UnsupportedOSError: If the platform is not supported.
+		UnsupportedEngineError: If the engine is not supported.
+		UnsupportedBrowserError: If the browser is not supported.
 	"""
-	mozilla_ua = generate_random_mozilla_ua()
-	os_ua, used_os = generate_random_os_ua()
-	engine_ua, used_engine = generate_random_engine_ua(platform=used_os)
-	browser_ua, used_browser = generate_random_browser_ua(engine=used_engine, engine_ua=engine_ua)
+	os_ua, _ = generate_random_os_ua(os_to_generate=os, rng=rng, weights=weights)
+	_, engine_version = generate_random_engine_version(engine_to_generate=engine, platform=os, rng=rng, weights=weights)
+	_, browser_versions = generate_random_browser_versions(
+			browser_to_generate=browser,
+			engine=engine,
+			apple_webkit_version=None if engine == "Gecko" else engine_version,
+			rng=rng,
+			weights=weights
+	)
 	
-	return f"{mozilla_ua} ({os_ua}) {engine_ua} {browser_ua}"
+	return user_agent_templates[(engine, browser)](
+			mozilla=generate_random_mozilla_ua(),
+			os=os_ua,
+			engine_version=format_engine_version(engine, engine_version),
+			**browser_versions
+	)
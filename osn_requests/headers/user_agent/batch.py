@@ -0,0 +1,406 @@
+import random
+from string import Formatter
+from functools import lru_cache
+from itertools import repeat
+from collections import Counter
+from osn_requests.headers.functions import get_rng
+from osn_requests.headers.user_agent.mozilla_ua_generation import generate_random_mozilla_ua
+from osn_requests.headers.user_agent.browser_ua_generation import generate_safari_version
+from typing import (
+	Optional,
+	Sequence,
+	Union
+)
+from osn_requests.headers.user_agent.data_types import (
+	supported_ua_browsers,
+	supported_ua_engines,
+	supported_ua_platforms
+)
+from osn_requests.headers.user_agent.errors import (
+	UnsupportedBrowserError,
+	UnsupportedOSError
+)
+from osn_requests.headers.user_agent.weights import (
+	UserAgentWeights,
+	choose_weighted_many
+)
+from osn_requests.headers.user_agent.engine_ua_generation import (
+	format_engine_version,
+	get_gecko_days
+)
+from osn_requests.headers.user_agent.data import (
+	UserAgentBrowser,
+	UserAgentEngine,
+	UserAgentOS,
+	UserAgentSupportedParts,
+	UserAgentTemplates
+)
+from osn_requests.headers.user_agent.os_ua_generation import (
+	format_android_ua,
+	format_ios_ua,
+	format_linux_ua,
+	format_mac_ua,
+	format_windows_ua
+)
+
+
+@lru_cache(maxsize=None)
+def get_positional_template(engine: supported_ua_engines, browser: supported_ua_browsers) -> tuple[str, tuple[str, ...]]:
+	"""
+	Converts the user agent template of an engine and browser combination into a positional format string.
+
+	A positional template can be filled with `map(template.format, *columns)`, one column per field, without building
+	a keyword dictionary per user agent.
+
+	Args:
+		engine (supported_ua_engines): The engine.
+		browser (supported_ua_browsers): The browser.
+
+	Returns:
+		tuple[str, tuple[str, ...]]: The format string with "{}" fields and the field names in order.
+	"""
+	template = f"{{mozilla}} ({{os}}) {UserAgentTemplates.engines[engine]} {UserAgentTemplates.browsers[browser]}"
+	parts = []
+	fields = []
+	
+	for literal_text, field_name, _, _ in Formatter().parse(template):
+		parts.append(literal_text.replace("{", "{{").replace("}", "}}"))
+	
+		if field_name is not None:
+			parts.append("{}")
+			fields.append(field_name)
+	
+	return "".join(parts), tuple(fields)
+
+
+def get_user_agent_combinations(
+		os: Optional[supported_ua_platforms] = None,
+		browser: Optional[supported_ua_browsers] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> tuple[list[tuple[str, str, str]], list[float]]:
+	"""
+	Lists the (os, engine, browser) combinations of `generate_random_user_agent_header` with their probabilities.
+
+	The probabilities follow the scalar path: the OS is chosen first, the engine given the OS (always AppleWebKit for iOS)
+	and the browser given the engine. Combinations with probability 0 and combinations that do not match `os` or `browser` are left out,
+	which conditions the distribution on the filters.
+
+	Args:
+		os (Optional[supported_ua_platforms]): Only keep combinations with this platform. Defaults to None.
+		browser (Optional[supported_ua_browsers]): Only keep combinations with this browser. Defaults to None.
+		weights (Optional[UserAgentWeights]): Weights for the OS, engine and browser choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		tuple[list[tuple[str, str, str]], list[float]]: The combinations and their (unnormalized) probabilities.
+	"""
+	weights = weights if weights is not None else UserAgentWeights()
+	engine_browsers = {
+		"AppleWebKit": UserAgentSupportedParts.apple_webkit_browsers,
+		"Gecko": UserAgentSupportedParts.gecko_browsers,
+		"Blink": UserAgentSupportedParts.blink_browsers
+	}
+	
+	combinations = []
+	probabilities = []
+	
+	os_weights = weights.get_weights("os", UserAgentSupportedParts.os)
+	os_total = sum(os_weights)
+	
+	for os_name, os_weight in zip(UserAgentSupportedParts.os, os_weights):
+		engines = ["AppleWebKit"] if os_name == "IOS" else UserAgentSupportedParts.engine
+		engine_weights = [1.0] if os_name == "IOS" else weights.get_weights("engine", engines)
+		engine_total = sum(engine_weights)
+	
+		for engine, engine_weight in zip(engines, engine_weights):
+			browsers = engine_browsers[engine]
+			browser_weights = weights.get_weights("browser", browsers)
+			browser_total = sum(browser_weights)
+	
+			for browser_name, browser_weight in zip(browsers, browser_weights):
+				if not (os_weight and engine_weight and browser_weight):
+					continue
+	
+				if (os is None or os_name == os) and (browser is None or browser_name == browser):
+					combinations.append((os_name, engine, browser_name))
+					probabilities.append(
+							os_weight / os_total * engine_weight / engine_total * browser_weight / browser_total
+					)
+	
+	return combinations, probabilities
+
+
+def generate_os_uas(
+		os: supported_ua_platforms,
+		k: int,
+		rng: random.Random,
+		weights: Optional[UserAgentWeights] = None
+) -> list[str]:
+	"""
+	Generates `k` platform user agent strings of one OS, with the distributions of the scalar OS generators.
+
+	Args:
+		os (supported_ua_platforms): The platform.
+		k (int): The number of strings.
+		rng (random.Random): The random generator to use.
+		weights (Optional[UserAgentWeights]): Weights for the version and device choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		list[str]: The platform strings.
+
+	Raises:
+		UnsupportedOSError: If the OS is not supported.
+	"""
+	if os == "Windows":
+		return list(
+				map(
+						format_windows_ua,
+						choose_weighted_many("windows_versions", UserAgentOS.windows_versions, k, rng, weights),
+						choose_weighted_many("windows_architectures", UserAgentOS.windows_architectures, k, rng, weights)
+				)
+		)
+	elif os == "Macintosh":
+		cpus = rng.choices(["Intel", "Apple Silicon"], k=k)
+		intel_count = cpus.count("Intel")
+	
+		intel_versions = iter(
+				choose_weighted_many("mac_os_intel_versions", UserAgentOS.mac_os_intel_versions, intel_count, rng, weights)
+		)
+		apple_silicon_versions = iter(
+				choose_weighted_many(
+						"mac_os_apple_silicon_versions",
+						UserAgentOS.mac_os_apple_silicon_versions,
+						k - intel_count,
+						rng,
+						weights
+				)
+		)
+	
+		return [
+			format_mac_ua(cpu, next(intel_versions) if cpu == "Intel" else next(apple_silicon_versions))
+			for cpu in cpus
+		]
+	elif os == "Linux":
+		return list(
+				map(
+						format_linux_ua,
+						rng.choices(["X11", None], k=k),
+						choose_weighted_many("linux_distributions", UserAgentOS.linux_distributions, k, rng, weights),
+						choose_weighted_many("linux_architectures", UserAgentOS.linux_architectures, k, rng, weights)
+				)
+		)
+	elif os == "Android":
+		return list(
+				map(
+						format_android_ua,
+						rng.choices(["Linux", "Mobile", None], k=k),
+						choose_weighted_many("android_versions", UserAgentOS.android_versions, k, rng, weights),
+						choose_weighted_many("android_devices", UserAgentOS.android_devices, k, rng, weights)
+				)
+		)
+	elif os == "IOS":
+		return [
+			format_ios_ua(ios_version, device, os_prefix)
+			for ios_version, (device, os_prefix) in zip(
+					choose_weighted_many("ios_versions", UserAgentOS.ios_versions, k, rng, weights),
+					choose_weighted_many("ios_devices", UserAgentOS.ios_devices, k, rng, weights)
+			)
+		]
+	else:
+		raise UnsupportedOSError(os)
+
+
+def generate_engine_versions(
+		engine: supported_ua_engines,
+		k: int,
+		rng: random.Random,
+		weights: Optional[UserAgentWeights] = None
+) -> list[tuple[int, ...]]:
+	"""
+	Generates `k` structured engine versions, with the distributions of `generate_random_engine_version`.
+
+	Args:
+		engine (supported_ua_engines): The engine.
+		k (int): The number of versions.
+		rng (random.Random): The random generator to use.
+		weights (Optional[UserAgentWeights]): Weights for the major AppleWebKit version. Defaults to None, which means uniform choices.
+
+	Returns:
+		list[tuple[int, ...]]: AppleWebKit version parts, or (year, month, day) for Gecko.
+	"""
+	if engine == "Gecko":
+		years = rng.choices(UserAgentEngine.gecko_versions[0], k=k)
+		months = rng.choices(UserAgentEngine.gecko_versions[1], k=k)
+		day_ranges = [get_gecko_days(year, month) for year, month in zip(years, months)]
+		day_columns = {
+			day_range: iter(rng.choices(day_range, k=count))
+			for day_range, count in Counter(day_ranges).items()
+		}
+	
+		return [
+			(year, month, next(day_columns[day_range]))
+			for year, month, day_range in zip(years, months, day_ranges)
+		]
+	
+	major_versions, *minor_versions = UserAgentEngine.apple_webkit_versions
+	
+	return list(
+			zip(
+					choose_weighted_many("apple_webkit_versions", major_versions, k, rng, weights),
+					*(rng.choices(part, k=k) for part in minor_versions)
+			)
+	)
+
+
+def generate_browser_versions(
+		parts: list[Union[int, Sequence[int]]],
+		k: int,
+		rng: random.Random,
+		weights: Optional[UserAgentWeights] = None,
+		table_name: Optional[str] = None
+) -> list[str]:
+	"""
+	Generates `k` browser version strings from version parts, with the distribution of `create_browser_version_from_parts`.
+
+	Every part is drawn for all versions at once and the columns are joined with one positional format string.
+
+	Args:
+		parts (list[Union[int, Sequence[int]]]): The version parts, e.g. `UserAgentBrowser.chrome_versions`.
+		k (int): The number of versions.
+		rng (random.Random): The random generator to use.
+		weights (Optional[UserAgentWeights]): Weights for the first (major) part. Defaults to None, which means uniform choices.
+		table_name (Optional[str]): The name of the weight table for the first part. Defaults to None.
+
+	Returns:
+		list[str]: The version strings.
+	"""
+	columns = []
+	
+	for index, part in enumerate(parts):
+		if isinstance(part, int):
+			columns.append(repeat(part, k))
+		elif index == 0 and table_name is not None:
+			columns.append(choose_weighted_many(table_name, part, k, rng, weights))
+		else:
+			columns.append(rng.choices(part, k=k))
+	
+	return list(map(".".join(["{}"] * len(parts)).format, *columns))
+
+
+def generate_safari_versions(apple_webkit_versions: list[tuple[int, ...]], rng: random.Random) -> list[str]:
+	"""
+	Generates Safari version strings derived from AppleWebKit versions, with the distribution of `generate_safari_version`.
+
+	`add_safari_version` walks the version parts from the major one: a part that follows a changed part is redrawn from
+	`UserAgentBrowser.safari_versions` and the walk stops there with a coin flip, and any other part is raised to a random value between
+	itself and its maximum. Here the walk is done one part at a time for all versions, so every part is drawn as a column:
+	one `random.choices` call for the redrawn parts and their coin flips, and one list of `random.random` draws for the raised parts.
+
+	Args:
+		apple_webkit_versions (list[tuple[int, ...]]): The AppleWebKit version parts of the engines.
+		rng (random.Random): The random generator to use.
+
+	Returns:
+		list[str]: The Safari versions, in the order of `apple_webkit_versions`.
+	"""
+	draw = rng.random
+	columns = [list(column) for column in zip(*apple_webkit_versions)]
+	changed = [False] * len(apple_webkit_versions)
+	rows = list(range(len(apple_webkit_versions)))
+	
+	for column, possible_version in zip(columns, UserAgentBrowser.safari_versions):
+		max_version = possible_version[-1] if isinstance(possible_version, range) and possible_version.step > 0 else max(possible_version)
+		changed_rows = [row for row in rows if changed[row]]
+		raised_rows = [row for row in rows if not changed[row]]
+	
+		for row, version in zip(changed_rows, rng.choices(possible_version, k=len(changed_rows))):
+			column[row] = version
+	
+		for row, fraction in zip(raised_rows, [draw() for _ in raised_rows]):
+			version = column[row] + int(fraction * (max_version - column[row] + 1))
+			changed[row] = version != column[row]
+			column[row] = version
+	
+		stops = rng.choices([True, False], k=len(changed_rows))
+		rows = [row for row, stop in zip(changed_rows, stops) if not stop] + raised_rows
+	
+	return list(map(".".join(["{}"] * len(columns)).format, *columns))
+
+
+def generate_user_agents(
+		n: int,
+		os: Optional[supported_ua_platforms] = None,
+		browser: Optional[supported_ua_browsers] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> list[str]:
+	"""
+	Generates `n` random user agent strings at once.
+
+	The (os, engine, browser) combination of every user agent is drawn with one `random.choices` call. Then, for every combination,
+	each version component is drawn for all its user agents as one column (`random.choices` or `AliasTable.sample_many`) and the strings
+	are built with `map` over a positional template. The result is shuffled, so it has the same distribution as `n` independent calls
+	of `generate_random_user_agent_header` (conditioned on `os` and `browser` if they are given). The Safari version, which is derived
+	from the AppleWebKit version, is drawn one version part at a time with `generate_safari_versions`, and the Gecko day is drawn
+	as one column per month length.
+
+	Args:
+		n (int): The number of user agents.
+		os (Optional[supported_ua_platforms]): Only generate user agents of this platform. Defaults to None.
+		browser (Optional[supported_ua_browsers]): Only generate user agents of this browser. Defaults to None.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the OS, engine, browser, version and device choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		list[str]: The user agent strings in random order.
+
+	Raises:
+		ValueError: If `n` is negative or no user agent matches `os` and `browser` (e.g. Firefox on iOS).
+		UnsupportedOSError: If `os` is not supported.
+		UnsupportedBrowserError: If `browser` is not supported.
+	"""
+	if n < 0:
+		raise ValueError(f"n must not be negative, got {n}")
+	
+	if os is not None and os not in UserAgentSupportedParts.os:
+		raise UnsupportedOSError(os)
+	
+	if browser is not None and browser not in UserAgentSupportedParts.browser:
+		raise UnsupportedBrowserError(browser)
+	
+	rng = get_rng(rng)
+	combinations, probabilities = get_user_agent_combinations(os, browser, weights)
+	
+	if not combinations:
+		raise ValueError(f"No user agents can be generated for os={os!r} and browser={browser!r}.")
+	
+	mozilla_ua = generate_random_mozilla_ua()
+	user_agents = []
+	
+	for (os_name, engine, browser_name), count in Counter(rng.choices(combinations, weights=probabilities, k=n)).items():
+		engine_versions = generate_engine_versions(engine, count, rng, weights)
+		template, fields = get_positional_template(engine, browser_name)
+		columns = {
+			"mozilla": repeat(mozilla_ua, count),
+			"os": generate_os_uas(os_name, count, rng, weights),
+			"engine_version": [format_engine_version(engine, version) for version in engine_versions]
+		}
+	
+		for token in UserAgentTemplates.browser_tokens[browser_name]:
+			if token == "safari" and engine == "Gecko":
+				columns[token] = [generate_safari_version(rng=rng) for _ in range(count)]
+			elif token == "safari":
+				columns[token] = generate_safari_versions(engine_versions, rng)
+			else:
+				columns[token] = generate_browser_versions(
+						getattr(UserAgentBrowser, f"{token}_versions"),
+						count,
+						rng,
+						weights,
+						f"{token}_versions"
+				)
+	
+		user_agents.extend(map(template.format, *(columns[field] for field in fields)))
+	
+	rng.shuffle(user_agents)
+	
+	return user_agents
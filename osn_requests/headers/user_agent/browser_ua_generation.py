@@ -1,5 +1,10 @@
 import re
 import random
+from osn_requests.headers.functions import get_rng
+from osn_requests.headers.user_agent.weights import (
+	UserAgentWeights,
+	choose_weighted
+)
 from typing import (
 	Optional,
 	Sequence,
@@ -16,83 +21,155 @@ from osn_requests.headers.user_agent.errors import (
 from osn_requests.headers.user_agent.data import (
 	UserAgentBrowser,
 	UserAgentEngine,
-	UserAgentSupportedParts
+	UserAgentSupportedParts,
+	UserAgentTemplates
 )
 
 
-def create_browser_version_from_parts(parts: list[Union[int, list[int]]], drop_last_zero: bool = False) -> str:
+apple_webkit_version_pattern = re.compile(r"AppleWebKit/(\d+(?:\.\d+)*)")
+
+
+def create_browser_version_from_parts(
+		parts: list[Union[int, Sequence[int]]],
+		drop_last_zero: bool = False,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None,
+		table_name: Optional[str] = None
+) -> str:
 	"""
 	Creates a browser version string from a list of parts.
 
 	This function generates a browser version string by combining a list of integer or range parts.
 	If a part is a range, it selects a random value within that range.
 	It can optionally drop the last part if it is 0 with a certain probability.
+	If `weights` has a table named `table_name`, the first (major) part is chosen with these weights.
 
 	Args:
-		parts (list[Union[int, list[int]]]): List of parts for the version string.
+		parts (list[Union[int, Sequence[int]]]): List of parts for the version string.
 		drop_last_zero (bool): If True, last part can be dropped if it's 0.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+		table_name (Optional[str]): The name of the weight table for the first part, e.g. "chrome_versions". Defaults to None.
 
 	Returns:
 		str: The generated browser version string.
 	"""
-	browser_version = [
-		str(part)
-		if isinstance(part, int)
-		else str(random.choice(part))
-		for part in parts
-	]
+	rng = get_rng(rng)
+	
+	browser_version = []
+	
+	for index, part in enumerate(parts):
+		if isinstance(part, int):
+			browser_version.append(str(part))
+		elif index == 0 and table_name is not None:
+			browser_version.append(str(choose_weighted(table_name, part, rng, weights)))
+		else:
+			browser_version.append(str(rng.choice(part)))
 	
-	if drop_last_zero and browser_version[-1] == 0 and random.choice([True, False]):
+	if drop_last_zero and browser_version[-1] == 0 and rng.choice([True, False]):
 		browser_version.pop(-1)
 	
 	return ".".join(browser_version)
 
 
-def generate_yandex_ua() -> str:
+def generate_yandex_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a Yandex browser user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Yandex browser user agent string.
 	"""
-	yandex_version = create_browser_version_from_parts(UserAgentBrowser.yandex_versions)
+	yandex_version = create_browser_version_from_parts(
+			UserAgentBrowser.yandex_versions,
+			rng=rng,
+			weights=weights,
+			table_name="yandex_versions"
+	)
 	return f"YaBrowser/{yandex_version}"
 
 
-def generate_edge_ua() -> str:
+def generate_edge_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates an Edge browser user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Edge browser user agent string.
 	"""
-	edge_version = create_browser_version_from_parts(UserAgentBrowser.edge_versions)
+	edge_version = create_browser_version_from_parts(
+			UserAgentBrowser.edge_versions,
+			rng=rng,
+			weights=weights,
+			table_name="edge_versions"
+	)
 	return f"Edg/{edge_version}"
 
 
-def generate_opera_ua() -> str:
+def generate_opera_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates an Opera browser user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Opera browser user agent string.
 	"""
-	opera_version = create_browser_version_from_parts(UserAgentBrowser.opera_versions)
+	opera_version = create_browser_version_from_parts(
+			UserAgentBrowser.opera_versions,
+			rng=rng,
+			weights=weights,
+			table_name="opera_versions"
+	)
 	return f"Opera/{opera_version}"
 
 
-def generate_firefox_ua() -> str:
+def generate_firefox_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a Firefox browser user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Firefox browser user agent string.
 	"""
-	firefox_version = create_browser_version_from_parts(UserAgentBrowser.firefox_versions, True)
+	firefox_version = create_browser_version_from_parts(
+			UserAgentBrowser.firefox_versions,
+			True,
+			rng=rng,
+			weights=weights,
+			table_name="firefox_versions"
+	)
 	return f"Firefox/{firefox_version}"
 
 
-def add_safari_version(current_versions: list[str], possible_versions: list[Sequence]) -> list[str]:
+def add_safari_version(
+		current_versions: list[str],
+		possible_versions: list[Sequence],
+		rng: Optional[random.Random] = None
+) -> list[str]:
 	"""
 	Recursively adds or modifies Safari version parts.
 
@@ -103,75 +180,230 @@ def add_safari_version(current_versions: list[str], possible_versions: list[Sequ
 	Args:
 		current_versions (list[str]): A list of current version parts.
 		possible_versions (list[Sequence]): A list of possible version parts at each level.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
 		list[str]: Modified list of version parts.
 	"""
+	rng = get_rng(rng)
+	
 	previous_level_changed = False
 	
 	for i in range(len(possible_versions)):
 		if previous_level_changed:
-			current_versions[i] = str(random.choice(possible_versions[i]))
+			current_versions[i] = str(rng.choice(possible_versions[i]))
 	
-			if random.choice([True, False]):
+			if rng.choice([True, False]):
 				break
 		else:
 			previous_version = current_versions[i]
 	
-			current_versions[i] = str(random.randint(int(current_versions[i]), max(possible_versions[i])))
+			possible_version = possible_versions[i]
+			max_version = possible_version[-1] if isinstance(possible_version, range) and possible_version.step > 0 else max(possible_version)
+	
+			current_versions[i] = str(rng.randint(int(current_versions[i]), max_version))
 	
 			previous_level_changed = previous_version != current_versions[i]
 	
 	return current_versions
 
 
-def generate_safari_ua(engine_ua: Optional[str] = None) -> str:
+def parse_apple_webkit_version(engine_ua: Optional[str]) -> Optional[tuple[int, ...]]:
 	"""
-	Generates a Safari browser user agent string.
+	Extracts the AppleWebKit version from an engine user agent string.
+
+	Args:
+		engine_ua (Optional[str]): The engine user agent string.
+
+	Returns:
+		Optional[tuple[int, ...]]: The version parts, or None if there is no AppleWebKit version in the string.
+	"""
+	if engine_ua is None:
+		return None
+	
+	match = apple_webkit_version_pattern.search(engine_ua)
+	
+	if match is None:
+		return None
+	
+	return tuple(int(part) for part in match.group(1).split("."))
+
 
-	This function generates a Safari user agent string, optionally using an existing AppleWebKit version
-	from a given engine user agent string.
+def generate_safari_version(
+		apple_webkit_version: Optional[Sequence[int]] = None,
+		rng: Optional[random.Random] = None
+) -> str:
+	"""
+	Generates a Safari version string.
+
+	If an AppleWebKit version is given, the Safari version is derived from it with `add_safari_version`.
+	Otherwise, a random version with one to three parts is generated.
 
 	Args:
-		engine_ua (typing.Optional[str]): An optional engine user agent string, from which to extract AppleWebKit version.
+		apple_webkit_version (Optional[Sequence[int]]): The AppleWebKit version parts of the engine. Defaults to None.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
 
 	Returns:
-		str: Safari browser user agent string.
+		str: The Safari version.
 	"""
-	if engine_ua is None or re.search(r"AppleWebKit/(\d+(?:\.\d+)*)", engine_ua) is None:
+	rng = get_rng(rng)
+	
+	if apple_webkit_version is None:
 		version_parts = []
 	
 		for i in range(len(UserAgentEngine.apple_webkit_versions)):
-			version_parts.append(str(random.choice(UserAgentEngine.apple_webkit_versions[i])))
+			version_parts.append(str(rng.choice(UserAgentEngine.apple_webkit_versions[i])))
 	
-			if random.choice([True, False]):
+			if rng.choice([True, False]):
 				break
 	
-		safari_version = ".".join(version_parts)
-	else:
-		webkit_version: list[str] = re.search(r"AppleWebKit/(\d+(?:\.\d+)*)", engine_ua).group(1).split(".")
-		webkit_version = add_safari_version(webkit_version, UserAgentBrowser.safari_versions)
+		return ".".join(version_parts)
 	
-		safari_version = ".".join(webkit_version)
+	webkit_version = add_safari_version(
+			[str(part) for part in apple_webkit_version],
+			UserAgentBrowser.safari_versions,
+			rng=rng
+	)
 	
-	return f"Safari/{safari_version}"
+	return ".".join(webkit_version)
 
 
-def generate_chrome_ua() -> str:
+def generate_safari_ua(
+		engine_ua: Optional[str] = None,
+		rng: Optional[random.Random] = None,
+		apple_webkit_version: Optional[Sequence[int]] = None
+) -> str:
+	"""
+	Generates a Safari browser user agent string.
+
+	This function generates a Safari user agent string, optionally using an existing AppleWebKit version,
+	given either as version parts or inside an engine user agent string.
+
+	Args:
+		engine_ua (typing.Optional[str]): An optional engine user agent string, from which to extract AppleWebKit version.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		apple_webkit_version (Optional[Sequence[int]]): The AppleWebKit version parts. If given, `engine_ua` is not parsed. Defaults to None.
+
+	Returns:
+		str: Safari browser user agent string.
+	"""
+	if apple_webkit_version is None:
+		apple_webkit_version = parse_apple_webkit_version(engine_ua)
+	
+	return f"Safari/{generate_safari_version(apple_webkit_version, rng=rng)}"
+
+
+def generate_chrome_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a Chrome browser user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Chrome browser user agent string.
 	"""
-	chrome_version = create_browser_version_from_parts(UserAgentBrowser.chrome_versions)
+	chrome_version = create_browser_version_from_parts(
+			UserAgentBrowser.chrome_versions,
+			rng=rng,
+			weights=weights,
+			table_name="chrome_versions"
+	)
 	return f"Chrome/{chrome_version}"
 
 
+def generate_browser_token_version(
+		token: str,
+		apple_webkit_version: Optional[Sequence[int]] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
+	"""
+	Generates the version of one browser token of `UserAgentTemplates.browsers`.
+
+	Args:
+		token (str): The version token, e.g. "chrome" or "safari".
+		apple_webkit_version (Optional[Sequence[int]]): The AppleWebKit version parts of the engine, used for "safari". Defaults to None.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		str: The version string of the token.
+	"""
+	if token == "safari":
+		return generate_safari_version(apple_webkit_version, rng=rng)
+	
+	return create_browser_version_from_parts(
+			getattr(UserAgentBrowser, f"{token}_versions"),
+			token == "firefox",
+			rng=rng,
+			weights=weights,
+			table_name=f"{token}_versions"
+	)
+
+
+def generate_random_browser_versions(
+		browser_to_generate: Optional[supported_ua_browsers] = None,
+		engine: Optional[supported_ua_engines] = None,
+		apple_webkit_version: Optional[Sequence[int]] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> tuple[str, dict[str, str]]:
+	"""
+	Chooses a browser and generates the versions of its tokens.
+
+	This is the structured counterpart of `generate_random_browser_ua`: the versions are returned by token name, ready to be
+	filled into `UserAgentTemplates.browsers`, and the AppleWebKit version is taken as numbers instead of being parsed from a string.
+
+	Args:
+		browser_to_generate (Optional[supported_ua_browsers]): The browser to generate. Defaults to None, which means a random browser.
+		engine (Optional[supported_ua_engines]): The engine to base the browser choice on. Defaults to None.
+		apple_webkit_version (Optional[Sequence[int]]): The AppleWebKit version parts of the engine, used for the Safari token. Defaults to None.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		tuple[str, dict[str, str]]: The browser used and the version of every token of its template.
+
+	Raises:
+		UnsupportedBrowserError: If the provided browser_to_generate is not supported.
+		UnsupportedEngineError: If the provided engine is not supported.
+	"""
+	rng = get_rng(rng)
+	
+	if engine is not None and engine not in UserAgentSupportedParts.engine:
+		raise UnsupportedEngineError(engine)
+	
+	if browser_to_generate is None:
+		if engine is None:
+			browser_to_generate = choose_weighted("browser", UserAgentSupportedParts.browser, rng, weights)
+		elif engine == "AppleWebKit":
+			browser_to_generate = choose_weighted("browser", UserAgentSupportedParts.apple_webkit_browsers, rng, weights)
+		elif engine == "Blink":
+			browser_to_generate = choose_weighted("browser", UserAgentSupportedParts.blink_browsers, rng, weights)
+		elif engine == "Gecko":
+			browser_to_generate = choose_weighted("browser", UserAgentSupportedParts.gecko_browsers, rng, weights)
+	
+	if browser_to_generate not in UserAgentTemplates.browser_tokens:
+		raise UnsupportedBrowserError(browser_to_generate)
+	
+	return browser_to_generate, {
+		token: generate_browser_token_version(token, apple_webkit_version, rng=rng, weights=weights)
+		for token in UserAgentTemplates.browser_tokens[browser_to_generate]
+	}
+
+
 def generate_random_browser_ua(
 		browser_to_generate: Optional[supported_ua_browsers] = None,
 		engine: Optional[supported_ua_engines] = None,
-		engine_ua: Optional[str] = None
+		engine_ua: Optional[str] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None,
+		apple_webkit_version: Optional[Sequence[int]] = None
 ) -> tuple[str, str]:
 	"""
 	Generates a random browser user agent string.
@@ -183,6 +415,9 @@ def generate_random_browser_ua(
 		browser_to_generate (Optional[supported_ua_browsers]): The browser for which to generate the user agent. If None, a random browser will be selected.
 		engine (Optional[supported_ua_engines]): The engine to base the browser choice on. This can influence the selection of the browser if `browser_to_generate` is None.
 		engine_ua (Optional[str]): An optional engine user agent string, specifically used for Safari version generation.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+		apple_webkit_version (Optional[Sequence[int]]): The AppleWebKit version parts. If given, `engine_ua` is not parsed. Defaults to None.
 
 	Returns:
 		tuple[str, str]: A tuple containing: the generated user agent string (str), the name of the browser used to generate the user agent (str).
@@ -191,45 +426,15 @@ def generate_random_browser_ua(
 		UnsupportedBrowserError: If the provided browser_to_generate is not supported.
 		UnsupportedEngineError: If the provided engine is not supported.
 	"""
-	if engine is not None and engine not in UserAgentSupportedParts.engine:
-		raise UnsupportedEngineError(engine)
+	if apple_webkit_version is None:
+		apple_webkit_version = parse_apple_webkit_version(engine_ua)
 	
-	if browser_to_generate is None:
-		if engine is None:
-			browser_to_generate = random.choice(UserAgentSupportedParts.browser)
-		elif engine == "AppleWebKit":
-			browser_to_generate = random.choice(UserAgentSupportedParts.apple_webkit_browsers)
-		elif engine == "Blink":
-			browser_to_generate = random.choice(UserAgentSupportedParts.blink_browsers)
-		elif engine == "Gecko":
-			browser_to_generate = random.choice(UserAgentSupportedParts.gecko_browsers)
-	
-	if browser_to_generate == "Chrome":
-		chrome_ua = generate_chrome_ua()
-		safari_ua = generate_safari_ua(engine_ua)
-	
-		return " ".join(list(filter(None, [chrome_ua, safari_ua]))), browser_to_generate
-	elif browser_to_generate == "Firefox":
-		return generate_firefox_ua(), browser_to_generate
-	elif browser_to_generate == "Safari":
-		return generate_safari_ua(engine_ua), browser_to_generate
-	elif browser_to_generate == "Opera":
-		chrome_ua = generate_chrome_ua()
-		opera_ua = generate_opera_ua()
-		safari_ua = generate_safari_ua(engine_ua)
-	
-		return " ".join(list(filter(None, [chrome_ua, opera_ua, safari_ua]))), browser_to_generate
-	elif browser_to_generate == "Edge":
-		chrome_ua = generate_chrome_ua()
-		edge_ua = generate_edge_ua()
-		safari_ua = generate_safari_ua(engine_ua)
-	
-		return " ".join(list(filter(None, [chrome_ua, edge_ua, safari_ua]))), browser_to_generate
-	elif browser_to_generate == "Yandex":
-		chrome_ua = generate_chrome_ua()
-		yandex_ua = generate_yandex_ua()
-		safari_ua = generate_safari_ua(engine_ua)
-	
-		return " ".join(list(filter(None, [chrome_ua, yandex_ua, safari_ua]))), browser_to_generate
-	else:
-		raise UnsupportedBrowserError(browser_to_generate)
+	browser, versions = generate_random_browser_versions(
+			browser_to_generate,
+			engine,
+			apple_webkit_version,
+			rng=rng,
+			weights=weights
+	)
+	
+	return UserAgentTemplates.browsers[browser].format_map(versions), browser
@@ -1,4 +1,12 @@
-from typing import Literal, Union
+import importlib
+from typing import (
+	Any,
+	Literal,
+	Optional,
+	Sequence,
+	TypedDict,
+	Union
+)
 
 
 supported_ua_platforms = Union[Literal["Windows", "Macintosh", "Linux", "Android", "IOS"], str]
@@ -7,3 +15,101 @@ supported_ua_browsers = Union[
 	Literal["Chrome", "Firefox", "Safari", "Opera", "Edge", "YandexBrowser"],
 	str
 ]
+
+
+class ParsedUserAgent(TypedDict):
+	"""
+	Type definition for the classification of a user agent string.
+
+	Attributes:
+	   os (Optional[supported_ua_platforms]): The platform, or None if no supported platform was found.
+	   os_version (Optional[str]): The platform version with dots as separators (e.g. "10.0", "14", "17.4.1"). None for Linux and unknown platforms.
+	   engine (Optional[supported_ua_engines]): The engine. AppleWebKit strings of Chromium-based browsers are reported as "Blink".
+	   engine_version (Optional[str]): The AppleWebKit version or the Gecko build date.
+	   browser (Optional[supported_ua_browsers]): The browser, or None if no supported browser was found.
+	   browser_version (Optional[str]): The version of the browser's own token (e.g. "Edg/..." for Edge).
+	"""
+	os: Optional[supported_ua_platforms]
+	os_version: Optional[str]
+	engine: Optional[supported_ua_engines]
+	engine_version: Optional[str]
+	browser: Optional[supported_ua_browsers]
+	browser_version: Optional[str]
+
+
+class ChainedRanges(Sequence[int]):
+	"""
+	Read-only sequence of integers made of several ranges, e.g. 0 followed by 3000-5999.
+
+	Only the ranges are stored, so a sequence of thousands of version numbers costs a few objects instead of one int object per number,
+	and `random.choice` still picks every number with the same probability.
+
+	Attributes:
+		ranges (tuple[range, ...]): The ranges, in order.
+	"""
+	
+	def __init__(self, *ranges: range):
+		"""
+		Initializes a new instance of `ChainedRanges`.
+
+		Args:
+			*ranges (range): The ranges to chain.
+		"""
+		self.ranges = ranges
+		self._length = sum(len(range_) for range_ in ranges)
+	
+	def __len__(self) -> int:
+		return self._length
+	
+	def __getitem__(self, index: Union[int, slice]) -> Union[int, list[int]]:
+		if isinstance(index, slice):
+			return [self[i] for i in range(*index.indices(self._length))]
+	
+		if index < 0:
+			index += self._length
+	
+		if not 0 <= index < self._length:
+			raise IndexError("ChainedRanges index out of range")
+	
+		for range_ in self.ranges:
+			if index < len(range_):
+				return range_[index]
+	
+			index -= len(range_)
+	
+		raise IndexError("ChainedRanges index out of range")
+	
+	def __repr__(self) -> str:
+		return f"ChainedRanges({', '.join(map(repr, self.ranges))})"
+
+
+class LazyTable:
+	"""
+	Class attribute descriptor that imports a data table from another module on first access.
+
+	The table is looked up in the module under the attribute name. After the first access the descriptor replaces itself with the table
+	on the owner class, so later accesses are plain attribute lookups.
+
+	Attributes:
+		module_name (str): The full name of the module that holds the table.
+		name (Optional[str]): The name of the attribute, set when the owner class is created.
+	"""
+	
+	def __init__(self, module_name: str):
+		"""
+		Initializes a new instance of `LazyTable`.
+
+		Args:
+			module_name (str): The full name of the module that holds the table.
+		"""
+		self.module_name = module_name
+		self.name: Optional[str] = None
+	
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.name = name
+	
+	def __get__(self, instance: Any, owner: type) -> Any:
+		table = getattr(importlib.import_module(self.module_name), self.name)
+		type.__setattr__(owner, self.name, table)
+	
+		return table
@@ -1,8 +1,18 @@
 import random
-from typing import Optional
+from osn_requests.headers.functions import get_rng
+from typing import (
+	Optional,
+	Sequence,
+	Union
+)
+from osn_requests.headers.user_agent.weights import (
+	UserAgentWeights,
+	choose_weighted
+)
 from osn_requests.headers.user_agent.data import (
 	UserAgentEngine,
-	UserAgentSupportedParts
+	UserAgentSupportedParts,
+	UserAgentTemplates
 )
 from osn_requests.headers.user_agent.errors import (
 	UnsupportedEngineError,
@@ -14,44 +24,195 @@ from osn_requests.headers.user_agent.data_types import (
 )
 
 
-def generate_random_gecko_ua() -> str:
+def get_gecko_days(year: int, month: int) -> range:
 	"""
-	Generates a random Gecko engine user agent string.
+	Returns the days that can be used in a Gecko build date of a given month.
+
+	Args:
+		year (int): The year of the build date.
+		month (int): The month of the build date.
 
 	Returns:
-		str: Gecko engine user agent string.
+		range: The possible days, taken from `UserAgentEngine.gecko_versions`.
 	"""
-	year = random.choice(UserAgentEngine.gecko_versions[0])
-	month = random.choice(UserAgentEngine.gecko_versions[1])
-	
 	if month in [1, 3, 5, 7, 8, 10, 12]:
-		day = random.choice(UserAgentEngine.gecko_versions[2][0])
+		return UserAgentEngine.gecko_versions[2][0]
 	elif month in [4, 6, 9, 11]:
-		day = random.choice(UserAgentEngine.gecko_versions[2][1])
+		return UserAgentEngine.gecko_versions[2][1]
 	elif year % 4 == 0:
-		day = random.choice(UserAgentEngine.gecko_versions[2][2])
+		return UserAgentEngine.gecko_versions[2][2]
 	else:
-		day = random.choice(UserAgentEngine.gecko_versions[2][3])
+		return UserAgentEngine.gecko_versions[2][3]
+
+
+def format_gecko_ua(year: int, month: int, day: int) -> str:
+	"""
+	Formats a Gecko engine user agent string from a build date.
+
+	Args:
+		year (int): The year of the build date.
+		month (int): The month of the build date.
+		day (int): The day of the build date.
+
+	Returns:
+		str: Gecko engine user agent string.
+	"""
+	return f"Gecko/{year}{month:02d}{day:02d}"
+
+
+def format_apple_webkit_ua(version_parts: Sequence[Union[int, str]]) -> str:
+	"""
+	Formats an AppleWebKit engine user agent string from its version parts.
+
+	Args:
+		version_parts (Sequence[Union[int, str]]): The version numbers, e.g. (537, 36).
+
+	Returns:
+		str: AppleWebKit engine user agent string.
+	"""
+	return f"AppleWebKit/{'.'.join(map(str, version_parts))} (KHTML, like Gecko)"
+
+
+def format_engine_version(engine: supported_ua_engines, engine_version: Sequence[int]) -> str:
+	"""
+	Formats a structured engine version for the `engine_version` field of `UserAgentTemplates.engines`.
+
+	Args:
+		engine (supported_ua_engines): The engine the version belongs to.
+		engine_version (Sequence[int]): The version parts, or (year, month, day) for Gecko.
+
+	Returns:
+		str: The version string, e.g. "537.36.1" or "20230115".
+	"""
+	if engine == "Gecko":
+		year, month, day = engine_version
+		return f"{year}{month:02d}{day:02d}"
+	
+	return ".".join(map(str, engine_version))
+
+
+def generate_gecko_version(rng: Optional[random.Random] = None) -> tuple[int, int, int]:
+	"""
+	Generates a random Gecko build date.
+
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		tuple[int, int, int]: The (year, month, day) of the build date.
+	"""
+	rng = get_rng(rng)
 	
-	gecko_version = f"{year}{month:02d}{day:02d}"
-	return f"Gecko/{gecko_version}"
+	year = rng.choice(UserAgentEngine.gecko_versions[0])
+	month = rng.choice(UserAgentEngine.gecko_versions[1])
+	day = rng.choice(get_gecko_days(year, month))
+	
+	return year, month, day
 
 
-def generate_random_apple_webkit_ua() -> str:
+def generate_random_gecko_ua(rng: Optional[random.Random] = None) -> str:
+	"""
+	Generates a random Gecko engine user agent string.
+
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+	Returns:
+		str: Gecko engine user agent string.
+	"""
+	return format_gecko_ua(*generate_gecko_version(rng=rng))
+
+
+def generate_apple_webkit_version(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> tuple[int, ...]:
+	"""
+	Generates a random AppleWebKit version.
+
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		tuple[int, ...]: The version parts.
+	"""
+	rng = get_rng(rng)
+	
+	major_versions, *minor_versions = UserAgentEngine.apple_webkit_versions
+	
+	return (
+		choose_weighted("apple_webkit_versions", major_versions, rng, weights),
+		*(rng.choice(part) for part in minor_versions)
+	)
+
+
+def generate_random_apple_webkit_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a random AppleWebKit engine user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: AppleWebKit engine user agent string.
 	"""
-	version_parts = [str(random.choice(part)) for part in UserAgentEngine.apple_webkit_versions]
+	return format_apple_webkit_ua(generate_apple_webkit_version(rng=rng, weights=weights))
+
+
+def generate_random_engine_version(
+		engine_to_generate: Optional[supported_ua_engines] = None,
+		platform: Optional[supported_ua_platforms] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> tuple[str, tuple[int, ...]]:
+	"""
+	Chooses an engine and generates a structured version of it.
+
+	This is the structured counterpart of `generate_random_engine_ua`: the version is returned as numbers, so it can be passed on
+	to the browser generators and formatted only once when the user agent is assembled.
+
+	Args:
+		engine_to_generate (typing.Optional[supported_ua_engines]): The engine to generate. Defaults to None, which means a random engine.
+		platform (typing.Optional[supported_ua_platforms]): The platform on which to base the engine choice.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
+	Returns:
+		tuple[str, tuple[int, ...]]: The engine used and its version parts, or (year, month, day) for Gecko.
+
+	Raises:
+		UnsupportedEngineError: If the provided engine_to_generate is not supported.
+		UnsupportedOSError: If the provided platform is not supported.
+	"""
+	rng = get_rng(rng)
+	
+	if platform is not None and platform not in UserAgentSupportedParts.os:
+		raise UnsupportedOSError(platform)
 	
-	return f"AppleWebKit/{'.'.join(version_parts)} (KHTML, like Gecko)"
+	if engine_to_generate is None:
+		if platform == "IOS":
+			engine_to_generate = "AppleWebKit"
+		else:
+			engine_to_generate = choose_weighted("engine", UserAgentSupportedParts.engine, rng, weights)
+	
+	if engine_to_generate == "AppleWebKit" or engine_to_generate == "Blink":
+		return engine_to_generate, generate_apple_webkit_version(rng=rng, weights=weights)
+	elif engine_to_generate == "Gecko":
+		return engine_to_generate, generate_gecko_version(rng=rng)
+	else:
+		raise UnsupportedEngineError(engine_to_generate)
 
 
 def generate_random_engine_ua(
 		engine_to_generate: Optional[supported_ua_engines] = None,
-		platform: Optional[supported_ua_platforms] = None
+		platform: Optional[supported_ua_platforms] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
 ) -> tuple[str, str]:
 	"""
 	Generates a random engine user agent string based on the given engine and platform.
@@ -62,6 +223,8 @@ def generate_random_engine_ua(
 	Args:
 		engine_to_generate (typing.Optional[supported_ua_engines]): The engine for which to generate the user agent.
 		platform (typing.Optional[supported_ua_platforms]): The platform on which to base the engine choice.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
 
 	Returns:
 		tuple[str, str]: A tuple containing the generated user agent string and the engine used.
@@ -70,17 +233,6 @@ def generate_random_engine_ua(
 		UnsupportedEngineError: If the provided engine_to_generate is not supported.
 		UnsupportedOSError: If the provided platform is not supported.
 	"""
-	if platform is not None and platform not in UserAgentSupportedParts.os:
-		raise UnsupportedOSError(platform)
+	engine, engine_version = generate_random_engine_version(engine_to_generate, platform, rng=rng, weights=weights)
 	
-	if engine_to_generate is None:
-		engine_to_generate = "AppleWebKit" if platform == "IOS" else random.choice(UserAgentSupportedParts.engine)
-	
-	if engine_to_generate == "AppleWebKit":
-		return generate_random_apple_webkit_ua(), engine_to_generate
-	elif engine_to_generate == "Gecko":
-		return generate_random_gecko_ua(), engine_to_generate
-	elif engine_to_generate == "Blink":
-		return generate_random_apple_webkit_ua(), engine_to_generate
-	else:
-		raise UnsupportedEngineError(engine_to_generate)
+	return UserAgentTemplates.engines[engine].format(engine_version=format_engine_version(engine, engine_version)), engine
@@ -1,6 +1,11 @@
 import random
 from typing import Optional
+from osn_requests.headers.functions import get_rng
 from osn_requests.headers.user_agent.errors import UnsupportedOSError
+from osn_requests.headers.user_agent.weights import (
+	UserAgentWeights,
+	choose_weighted
+)
 from osn_requests.headers.user_agent.data_types import supported_ua_platforms
 from osn_requests.headers.user_agent.data import (
 	UserAgentOS,
@@ -8,80 +13,211 @@ from osn_requests.headers.user_agent.data import (
 )
 
 
-def generate_ios_ua() -> str:
+def format_ios_ua(ios_version: str, device: str, os_prefix: str) -> str:
+	"""
+	Formats an iOS platform user agent string from its parts.
+
+	Args:
+		ios_version (str): The iOS version, e.g. "17_4_1".
+		device (str): The device name, e.g. "iPhone".
+		os_prefix (str): The OS prefix of the device, e.g. "CPU iPhone OS".
+
+	Returns:
+		str: iOS platform user agent string.
+	"""
+	return f"{device}; {os_prefix} {ios_version} like Mac OS X"
+
+
+def format_android_ua(android_type: Optional[str], android_version: str, device: str) -> str:
+	"""
+	Formats an Android platform user agent string from its parts.
+
+	Args:
+		android_type (Optional[str]): "Linux" for a "Linux; " prefix, "Mobile" for a "; Mobile" suffix after the version, or None.
+		android_version (str): The Android version.
+		device (str): The device name.
+
+	Returns:
+		str: Android platform user agent string.
+	"""
+	return f"{'Linux; ' if android_type == 'Linux' else ''}Android {android_version}{'; Mobile' if android_type == 'Mobile' else ''}; {device}"
+
+
+def format_linux_ua(
+		prefix: Optional[str],
+		linux_distribution: Optional[str],
+		linux_architecture: str
+) -> str:
+	"""
+	Formats a Linux platform user agent string from its parts.
+
+	Args:
+		prefix (Optional[str]): The window system prefix ("X11") or None.
+		linux_distribution (Optional[str]): The distribution name or None.
+		linux_architecture (str): The CPU architecture.
+
+	Returns:
+		str: Linux platform user agent string.
+	"""
+	return "; ".join(
+			list(filter(None, [prefix, linux_distribution, f"Linux {linux_architecture}"]))
+	)
+
+
+def format_mac_ua(cpu: str, macos_version: str) -> str:
+	"""
+	Formats a Macintosh platform user agent string from its parts.
+
+	Args:
+		cpu (str): The CPU family, "Intel" or "Apple Silicon".
+		macos_version (str): The macOS version.
+
+	Returns:
+		str: Macintosh platform user agent string.
+	"""
+	return f"Macintosh; {cpu} Mac OS X {macos_version}"
+
+
+def format_windows_ua(windows_version: str, windows_architecture: str) -> str:
+	"""
+	Formats a Windows platform user agent string from its parts.
+
+	Args:
+		windows_version (str): The Windows NT version.
+		windows_architecture (str): The architecture token.
+
+	Returns:
+		str: Windows platform user agent string.
+	"""
+	return f"Windows {windows_version}; {windows_architecture}"
+
+
+def generate_ios_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a random iOS platform user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: iOS platform user agent string.
 	"""
-	ios_version = random.choice(UserAgentOS.ios_versions)
-	device, os_prefix = random.choice(UserAgentOS.ios_devices)
+	rng = get_rng(rng)
 	
-	return f"{device}; {os_prefix} {ios_version} like Mac OS X"
+	ios_version = choose_weighted("ios_versions", UserAgentOS.ios_versions, rng, weights)
+	device, os_prefix = choose_weighted("ios_devices", UserAgentOS.ios_devices, rng, weights)
+	
+	return format_ios_ua(ios_version, device, os_prefix)
 
 
-def generate_android_ua() -> str:
+def generate_android_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a random Android platform user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Android platform user agent string.
 	"""
-	android_type = random.choice(["Linux", "Mobile", None])
-	android_version = random.choice(UserAgentOS.android_versions)
-	device = random.choice(UserAgentOS.android_devices)
+	rng = get_rng(rng)
 	
-	return f"{'Linux; ' if android_type == 'Linux' else ''}Android {android_version}{'; Mobile' if android_type == 'Mobile' else ''}; {device}"
+	android_type = rng.choice(["Linux", "Mobile", None])
+	android_version = choose_weighted("android_versions", UserAgentOS.android_versions, rng, weights)
+	device = choose_weighted("android_devices", UserAgentOS.android_devices, rng, weights)
+	
+	return format_android_ua(android_type, android_version, device)
 
 
-def generate_linux_ua() -> str:
+def generate_linux_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a random Linux platform user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Linux platform user agent string.
 	"""
-	prefix = random.choice(["X11", None])
-	linux_distribution = random.choice(UserAgentOS.linux_distributions)
-	linux_architecture = random.choice(UserAgentOS.linux_architectures)
+	rng = get_rng(rng)
 	
-	return "; ".join(
-			list(filter(None, [prefix, linux_distribution, f"Linux {linux_architecture}"]))
-	)
+	prefix = rng.choice(["X11", None])
+	linux_distribution = choose_weighted("linux_distributions", UserAgentOS.linux_distributions, rng, weights)
+	linux_architecture = choose_weighted("linux_architectures", UserAgentOS.linux_architectures, rng, weights)
+	
+	return format_linux_ua(prefix, linux_distribution, linux_architecture)
 
 
-def generate_mac_ua() -> str:
+def generate_mac_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a random Macintosh platform user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Macintosh platform user agent string.
 	"""
-	cpu = random.choice(["Intel", "Apple Silicon"])
-	macos_version = random.choice(
-			UserAgentOS.mac_os_intel_versions
-			if cpu == "Intel"
-			else UserAgentOS.mac_os_apple_silicon_versions
-	)
+	rng = get_rng(rng)
 	
-	return f"Macintosh; {cpu} Mac OS X {macos_version}"
+	cpu = rng.choice(["Intel", "Apple Silicon"])
+	
+	if cpu == "Intel":
+		macos_version = choose_weighted("mac_os_intel_versions", UserAgentOS.mac_os_intel_versions, rng, weights)
+	else:
+		macos_version = choose_weighted(
+				"mac_os_apple_silicon_versions",
+				UserAgentOS.mac_os_apple_silicon_versions,
+				rng,
+				weights
+		)
+	
+	return format_mac_ua(cpu, macos_version)
 
 
-def generate_windows_ua() -> str:
+def generate_windows_ua(
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> str:
 	"""
 	Generates a random Windows platform user agent string.
 
+	Args:
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
+
 	Returns:
 		str: Windows platform user agent string.
 	"""
-	windows_version = random.choice(UserAgentOS.windows_versions)
-	windows_architecture = random.choice(UserAgentOS.windows_architectures)
+	rng = get_rng(rng)
 	
-	return f"Windows {windows_version}; {windows_architecture}"
+	windows_version = choose_weighted("windows_versions", UserAgentOS.windows_versions, rng, weights)
+	windows_architecture = choose_weighted("windows_architectures", UserAgentOS.windows_architectures, rng, weights)
+	
+	return format_windows_ua(windows_version, windows_architecture)
 
 
-def generate_random_os_ua(os_to_generate: Optional[supported_ua_platforms] = None) -> tuple[str, str]:
+def generate_random_os_ua(
+		os_to_generate: Optional[supported_ua_platforms] = None,
+		rng: Optional[random.Random] = None,
+		weights: Optional[UserAgentWeights] = None
+) -> tuple[str, str]:
 	"""
 	Generates a random OS user agent string based on the given OS.
 
@@ -89,6 +225,8 @@ def generate_random_os_ua(os_to_generate: Optional[supported_ua_platforms] = Non
 
 	Args:
 		os_to_generate (typing.Optional[supported_ua_platforms]): The OS for which to generate the user agent.
+		rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+		weights (Optional[UserAgentWeights]): Weights for the random choices. Defaults to None, which means uniform choices.
 
 	Returns:
 		tuple[str, str]: A tuple containing the generated user agent string and the OS used.
@@ -96,18 +234,20 @@ def generate_random_os_ua(os_to_generate: Optional[supported_ua_platforms] = Non
 	Raises:
 		UnsupportedOSError: If the provided os_to_generate is not supported.
 	"""
+	rng = get_rng(rng)
+	
 	if os_to_generate is None:
-		os_to_generate = random.choice(UserAgentSupportedParts.os)
+		os_to_generate = choose_weighted("os", UserAgentSupportedParts.os, rng, weights)
 	
 	if os_to_generate == "Windows":
-		return generate_windows_ua(), os_to_generate
+		return generate_windows_ua(rng=rng, weights=weights), os_to_generate
 	elif os_to_generate == "Macintosh":
-		return generate_mac_ua(), os_to_generate
+		return generate_mac_ua(rng=rng, weights=weights), os_to_generate
 	elif os_to_generate == "Linux":
-		return generate_linux_ua(), os_to_generate
+		return generate_linux_ua(rng=rng, weights=weights), os_to_generate
 	elif os_to_generate == "Android":
-		return generate_android_ua(), os_to_generate
+		return generate_android_ua(rng=rng, weights=weights), os_to_generate
 	elif os_to_generate == "IOS":
-		return generate_ios_ua(), os_to_generate
+		return generate_ios_ua(rng=rng, weights=weights), os_to_generate
 	else:
 		raise UnsupportedOSError(os_to_generate)
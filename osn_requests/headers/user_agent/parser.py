@@ -0,0 +1,172 @@
+import re
+from string import Formatter
+from functools import lru_cache
+from typing import Iterable
+from osn_requests.headers.user_agent.data_types import ParsedUserAgent
+from osn_requests.headers.user_agent.data import (
+	UserAgentOS,
+	UserAgentSupportedParts,
+	UserAgentTemplates
+)
+
+
+browser_token_aliases = {"OPR": "opera", "CriOS": "chrome", "FxiOS": "firefox", "EdgiOS": "edge", "Version": "version"}
+browser_version_tokens = {"Safari": "version"}
+os_priorities = {"Android": 0, "IOS": 1, "Windows": 2, "Macintosh": 3, "Linux": 4}
+
+
+def get_browser_token_names() -> dict[str, str]:
+	"""
+	Maps the product names used in browser tokens to the version tokens of `UserAgentTemplates.browser_tokens`.
+
+	The names are read from the literal text of `UserAgentTemplates.browsers` (e.g. "Edg/{edge}" gives "Edg" -> "edge"),
+	so the parser recognises exactly what the generators produce, plus the aliases in `browser_token_aliases` used by real browsers.
+
+	Returns:
+		dict[str, str]: The version token of every product name.
+	"""
+	names = {}
+	
+	for template in UserAgentTemplates.browsers.values():
+		for literal_text, field_name, _, _ in Formatter().parse(template):
+			if field_name is not None:
+				names[literal_text.strip().rstrip("/")] = field_name
+	
+	names.update(browser_token_aliases)
+	
+	return names
+
+
+def build_user_agent_pattern(browser_token_names: Iterable[str]) -> re.Pattern:
+	"""
+	Builds the combined regular expression that finds all platform, engine and browser tokens of a user agent in one scan.
+
+	Every alternative is a named group (the platform or engine name, or "browser") with an inner `<name>_version` group,
+	so `match.lastgroup` tells which token was found.
+
+	Args:
+		browser_token_names (Iterable[str]): The product names of the browser tokens.
+
+	Returns:
+		re.Pattern: The compiled expression.
+	"""
+	ios_devices = "|".join(re.escape(device) for device, _ in UserAgentOS.ios_devices)
+	ios_prefixes = "|".join(
+			sorted({re.escape(os_prefix) for _, os_prefix in UserAgentOS.ios_devices}, key=len, reverse=True)
+	)
+	browsers = "|".join(sorted(map(re.escape, browser_token_names), key=len, reverse=True))
+	
+	return re.compile(
+			"|".join(
+					[
+						rf"(?P<IOS>(?:{ios_devices}); (?:{ios_prefixes}) (?P<IOS_version>[\d_]+) like Mac OS X)",
+						r"(?P<Android>Android (?P<Android_version>[^;)]+))",
+						r"(?P<Windows>Windows NT (?P<Windows_version>[\d.]+))",
+						r"(?P<Macintosh>Mac OS X (?P<Macintosh_version>[\d_.]+))",
+						r"(?P<Linux>\bLinux\b)",
+						r"(?P<AppleWebKit>AppleWebKit/(?P<AppleWebKit_version>[\d.]+))",
+						r"(?P<Gecko>Gecko/(?P<Gecko_version>\d+))",
+						rf"(?P<browser>\b(?P<browser_name>{browsers})/(?P<browser_version>[\d.]+))"
+					]
+			)
+	)
+
+
+browser_token_names = get_browser_token_names()
+user_agent_pattern = build_user_agent_pattern(browser_token_names)
+browser_priorities = [
+	browser
+	for browser, tokens in sorted(
+			UserAgentTemplates.browser_tokens.items(),
+			key=lambda item: (item[0] == "Safari", -len(item[1]))
+	)
+]
+
+
+def parse_user_agent(user_agent: str) -> ParsedUserAgent:
+	"""
+	Classifies a user agent string into platform, engine and browser with their versions.
+
+	All tokens are found in a single `finditer` scan of `user_agent_pattern`. The platform is the most specific one found
+	(e.g. Android wins over the "Linux" token of Android user agents). The browser is the first one in `browser_priorities`
+	whose own token is present: browsers with more template tokens come first and Safari, whose token most user agents carry, comes last
+	(e.g. "Chrome/... Edg/... Safari/..." and "EdgiOS/... Safari/..." are Edge, "CriOS/... Safari/..." is Chrome).
+	The version of a browser is read from its own token, or from the token in `browser_version_tokens` if present
+	(e.g. "Version/17.0 ... Safari/604.1" is Safari 17.0). On iOS, where every browser uses WebKit, the engine stays AppleWebKit.
+
+	Args:
+		user_agent (str): The user agent string.
+
+	Returns:
+		ParsedUserAgent: The classification. Parts that were not recognised are None.
+	"""
+	os = os_version = engine = engine_version = None
+	os_rank = len(os_priorities)
+	versions: dict[str, str] = {}
+	
+	for match in user_agent_pattern.finditer(user_agent):
+		kind = match.lastgroup
+	
+		if kind == "browser":
+			versions.setdefault(browser_token_names[match.group("browser_name")], match.group("browser_version"))
+		elif kind in os_priorities:
+			if os_priorities[kind] < os_rank:
+				os, os_rank = kind, os_priorities[kind]
+				os_version = None if kind == "Linux" else match.group(f"{kind}_version").replace("_", ".")
+		elif engine is None:
+			engine, engine_version = kind, match.group(f"{kind}_version")
+	
+	browser = browser_version = None
+	
+	for candidate in browser_priorities:
+		token = candidate.lower()
+	
+		if token in versions:
+			browser = candidate
+			browser_version = versions.get(browser_version_tokens.get(candidate, token), versions[token])
+			break
+	
+	if engine == "AppleWebKit" and browser in UserAgentSupportedParts.blink_browsers and os != "IOS":
+		engine = "Blink"
+	
+	return ParsedUserAgent(
+			os=os,
+			os_version=os_version,
+			engine=engine,
+			engine_version=engine_version,
+			browser=browser,
+			browser_version=browser_version
+	)
+
+
+@lru_cache(maxsize=65536)
+def parse_user_agent_cached(user_agent: str) -> ParsedUserAgent:
+	"""
+	Classifies a user agent string, keeping the results of the 65536 most recently used strings.
+
+	Repeated strings cost one cache lookup. The same dictionary is returned for every call with the same string, so it must not be modified.
+
+	Args:
+		user_agent (str): The user agent string.
+
+	Returns:
+		ParsedUserAgent: The classification, shared with the cache.
+	"""
+	return parse_user_agent(user_agent)
+
+
+def parse_user_agents(user_agents: Iterable[str], cached: bool = True) -> list[ParsedUserAgent]:
+	"""
+	Classifies many user agent strings.
+
+	Args:
+		user_agents (Iterable[str]): The user agent strings.
+		cached (bool): Use `parse_user_agent_cached`, which suits traffic with repeated strings. Set it to False for streams
+			of mostly distinct strings, where the cache would only be churned. Defaults to True.
+
+	Returns:
+		list[ParsedUserAgent]: The classifications in input order. With `cached`, repeated strings share one dictionary.
+	"""
+	parse = parse_user_agent_cached if cached else parse_user_agent
+	
+	return [parse(user_agent) for user_agent in user_agents]
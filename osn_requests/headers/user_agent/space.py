@@ -0,0 +1,411 @@
+import random
+from math import prod
+from bisect import bisect_right
+from functools import lru_cache, partial
+from dataclasses import dataclass
+from osn_requests.headers.functions import get_rng
+from osn_requests.headers.user_agent.mozilla_ua_generation import generate_random_mozilla_ua
+from typing import (
+	Any,
+	Callable,
+	Iterable,
+	Optional,
+	Sequence,
+	Union
+)
+from osn_requests.headers.user_agent.data_types import (
+	supported_ua_browsers,
+	supported_ua_platforms
+)
+from osn_requests.headers.user_agent.errors import (
+	UnsupportedBrowserError,
+	UnsupportedOSError
+)
+from osn_requests.headers.user_agent.data import (
+	UserAgentBrowser,
+	UserAgentEngine,
+	UserAgentOS,
+	UserAgentSupportedParts
+)
+from osn_requests.headers.user_agent.engine_ua_generation import (
+	format_apple_webkit_ua,
+	format_gecko_ua,
+	get_gecko_days
+)
+from osn_requests.headers.user_agent.os_ua_generation import (
+	format_android_ua,
+	format_ios_ua,
+	format_linux_ua,
+	format_mac_ua,
+	format_windows_ua
+)
+
+
+@dataclass(frozen=True)
+class UserAgentSpacePart:
+	"""
+	One variant of an OS, engine or browser part of a `UserAgentSpace`.
+
+	Attributes:
+		name (str): The OS, engine or browser name.
+		tables (tuple[Sequence[Any], ...]): The value tables of the variant. Every table is one digit of the mixed-radix index.
+		format (Callable[[Sequence[Any]], str]): Builds the part string from one value of every table.
+	"""
+	name: str
+	tables: tuple[Sequence[Any], ...]
+	format: Callable[[Sequence[Any]], str]
+
+
+def get_version_tables(parts: list[Union[int, Sequence[int]]]) -> tuple[Sequence[int], ...]:
+	"""
+	Converts browser version parts into value tables. Fixed parts become tables with a single value.
+
+	Args:
+		parts (list[Union[int, Sequence[int]]]): The version parts, e.g. `UserAgentBrowser.chrome_versions`.
+
+	Returns:
+		tuple[Sequence[int], ...]: One table per version part.
+	"""
+	return tuple((part,) if isinstance(part, int) else part for part in parts)
+
+
+def format_browser_ua(values: Sequence[Any], tokens: tuple[tuple[str, int], ...]) -> str:
+	"""
+	Formats the product tokens of a browser, e.g. "Chrome/124.0.6367.91 Edg/124.0.3000.19".
+
+	Args:
+		values (Sequence[Any]): The version numbers of all tokens, in order.
+		tokens (tuple[tuple[str, int], ...]): The token names with the number of version parts of each.
+
+	Returns:
+		str: The browser tokens separated by spaces. Empty if there are no tokens.
+	"""
+	formatted_tokens = []
+	start = 0
+	
+	for token, count in tokens:
+		formatted_tokens.append(f"{token}/{'.'.join(map(str, values[start:start + count]))}")
+		start += count
+	
+	return " ".join(formatted_tokens)
+
+
+@lru_cache(maxsize=1)
+def get_gecko_dates() -> tuple[tuple[int, int, int], ...]:
+	"""
+	Lists all Gecko build dates that `generate_random_gecko_ua` can produce.
+
+	Returns:
+		tuple[tuple[int, int, int], ...]: (year, month, day) tuples.
+	"""
+	return tuple(
+			(year, month, day)
+			for year in UserAgentEngine.gecko_versions[0]
+			for month in UserAgentEngine.gecko_versions[1]
+			for day in get_gecko_days(year, month)
+	)
+
+
+def get_os_space_parts() -> list[UserAgentSpacePart]:
+	"""
+	Builds the OS variants of the user agent space from `UserAgentOS`.
+
+	Returns:
+		list[UserAgentSpacePart]: One variant per OS, and one per CPU family for Macintosh.
+	"""
+	return [
+		UserAgentSpacePart(
+				"Windows",
+				(tuple(UserAgentOS.windows_versions), tuple(UserAgentOS.windows_architectures)),
+				lambda values: format_windows_ua(*values)
+		),
+		UserAgentSpacePart(
+				"Macintosh",
+				(("Intel",), UserAgentOS.mac_os_intel_versions),
+				lambda values: format_mac_ua(*values)
+		),
+		UserAgentSpacePart(
+				"Macintosh",
+				(("Apple Silicon",), UserAgentOS.mac_os_apple_silicon_versions),
+				lambda values: format_mac_ua(*values)
+		),
+		UserAgentSpacePart(
+				"Linux",
+				(
+					("X11", None),
+					tuple(UserAgentOS.linux_distributions),
+					tuple(UserAgentOS.linux_architectures)
+				),
+				lambda values: format_linux_ua(*values)
+		),
+		UserAgentSpacePart(
+				"Android",
+				(("Linux", "Mobile", None), tuple(UserAgentOS.android_versions), UserAgentOS.android_devices),
+				lambda values: format_android_ua(*values)
+		),
+		UserAgentSpacePart(
+				"IOS",
+				(UserAgentOS.ios_versions, tuple(UserAgentOS.ios_devices)),
+				lambda values: format_ios_ua(values[0], *values[1])
+		)
+	]
+
+
+def get_engine_space_parts() -> dict[str, UserAgentSpacePart]:
+	"""
+	Builds the engine variants of the user agent space from `UserAgentEngine`.
+
+	Returns:
+		dict[str, UserAgentSpacePart]: The variant of every engine.
+	"""
+	apple_webkit_tables = tuple(UserAgentEngine.apple_webkit_versions)
+	
+	return {
+		"AppleWebKit": UserAgentSpacePart("AppleWebKit", apple_webkit_tables, format_apple_webkit_ua),
+		"Gecko": UserAgentSpacePart("Gecko", (get_gecko_dates(),), lambda values: format_gecko_ua(*values[0])),
+		"Blink": UserAgentSpacePart("Blink", apple_webkit_tables, format_apple_webkit_ua)
+	}
+
+
+def get_browser_space_parts() -> dict[str, UserAgentSpacePart]:
+	"""
+	Builds the browser variants of the user agent space from `UserAgentBrowser`.
+
+	The trailing "Safari/..." token is not part of the browser variants, it is added by the space from the engine version.
+
+	Returns:
+		dict[str, UserAgentSpacePart]: The variant of every browser.
+	"""
+	chrome_tables = get_version_tables(UserAgentBrowser.chrome_versions)
+	browser_tokens = {
+		"Chrome": [("Chrome", chrome_tables)],
+		"Firefox": [("Firefox", get_version_tables(UserAgentBrowser.firefox_versions))],
+		"Safari": [],
+		"Opera": [("Chrome", chrome_tables), ("Opera", get_version_tables(UserAgentBrowser.opera_versions))],
+		"Edge": [("Chrome", chrome_tables), ("Edg", get_version_tables(UserAgentBrowser.edge_versions))],
+		"Yandex": [("Chrome", chrome_tables), ("YaBrowser", get_version_tables(UserAgentBrowser.yandex_versions))]
+	}
+	
+	return {
+		browser: UserAgentSpacePart(
+				browser,
+				tuple(table for _, tables in tokens for table in tables),
+				partial(format_browser_ua, tokens=tuple((token, len(tables)) for token, tables in tokens))
+		)
+		for browser, tokens in browser_tokens.items()
+	}
+
+
+class UserAgentSpaceBlock:
+	"""
+	The user agents of one OS, engine and browser combination, addressed by a mixed-radix index.
+
+	Every value table of the three parts is one digit; the radix of a digit is the length of its table. An index in `range(size)`
+	is split into digits with repeated `divmod`, so decoding costs one division per table.
+
+	Attributes:
+		os (UserAgentSpacePart): The OS variant.
+		engine (UserAgentSpacePart): The engine variant.
+		browser (UserAgentSpacePart): The browser variant.
+		tables (tuple[Sequence[Any], ...]): The value tables of the OS, engine and browser, in this order.
+		size (int): The number of user agents in the block.
+	"""
+	
+	def __init__(
+			self,
+			os: UserAgentSpacePart,
+			engine: UserAgentSpacePart,
+			browser: UserAgentSpacePart
+	):
+		"""
+		Initializes a new instance of `UserAgentSpaceBlock`.
+
+		Args:
+			os (UserAgentSpacePart): The OS variant.
+			engine (UserAgentSpacePart): The engine variant.
+			browser (UserAgentSpacePart): The browser variant.
+		"""
+		self.os = os
+		self.engine = engine
+		self.browser = browser
+		self.tables = os.tables + engine.tables + browser.tables
+		self.size = prod(len(table) for table in self.tables)
+	
+		self._os_end = len(os.tables)
+		self._engine_end = self._os_end + len(engine.tables)
+	
+	def decode(self, index: int) -> str:
+		"""
+		Builds the user agent with the given index in the block.
+
+		Args:
+			index (int): The index, from 0 to `size - 1`.
+
+		Returns:
+			str: The user agent string.
+		"""
+		values = []
+	
+		for table in self.tables:
+			index, digit = divmod(index, len(table))
+			values.append(table[digit])
+	
+		engine_values = values[self._os_end:self._engine_end]
+	
+		os_ua = self.os.format(values[:self._os_end])
+		engine_ua = self.engine.format(engine_values)
+		browser_tokens = [self.browser.format(values[self._engine_end:])]
+	
+		if self.engine.name != "Gecko":
+			browser_tokens.append(f"Safari/{'.'.join(map(str, engine_values))}")
+	
+		return f"{generate_random_mozilla_ua()} ({os_ua}) {engine_ua} {' '.join(filter(None, browser_tokens))}"
+
+
+class UserAgentSpace:
+	"""
+	The set of all user agents that can be built from `UserAgentOS`, `UserAgentEngine` and `UserAgentBrowser`, addressed by integers.
+
+	The space is a concatenation of `UserAgentSpaceBlock`s, one per compatible OS, engine and browser combination (iOS only uses AppleWebKit
+	with Safari; AppleWebKit goes with Safari, Gecko with Firefox and Blink with Chrome, Opera, Edge and Yandex). Every integer in `range(size)`
+	decodes to exactly one user agent and different integers decode to different user agents, so `k` distinct user agents are `k` distinct integers.
+	The Safari token always repeats the AppleWebKit version.
+
+	The size is far beyond `sys.maxsize`, so it is exposed as `size` instead of `len()`.
+
+	Attributes:
+		blocks (tuple[UserAgentSpaceBlock, ...]): The blocks of the space.
+		offsets (tuple[int, ...]): The index of the first user agent of every block.
+		size (int): The number of user agents in the space.
+	"""
+	
+	def __init__(
+			self,
+			platforms: Optional[Iterable[supported_ua_platforms]] = None,
+			browsers: Optional[Iterable[supported_ua_browsers]] = None
+	):
+		"""
+		Initializes a new instance of `UserAgentSpace`.
+
+		Args:
+			platforms (Optional[Iterable[supported_ua_platforms]]): The platforms to include. Defaults to None, which means all platforms.
+			browsers (Optional[Iterable[supported_ua_browsers]]): The browsers to include. Defaults to None, which means all browsers.
+
+		Raises:
+			UnsupportedOSError: If a platform is not supported.
+			UnsupportedBrowserError: If a browser is not supported.
+			ValueError: If no user agent matches the platforms and browsers.
+		"""
+		platforms = UserAgentSupportedParts.os if platforms is None else list(platforms)
+		browsers = UserAgentSupportedParts.browser if browsers is None else list(browsers)
+	
+		for platform in platforms:
+			if platform not in UserAgentSupportedParts.os:
+				raise UnsupportedOSError(platform)
+	
+		for browser in browsers:
+			if browser not in UserAgentSupportedParts.browser:
+				raise UnsupportedBrowserError(browser)
+	
+		engine_parts = get_engine_space_parts()
+		browser_parts = get_browser_space_parts()
+		engine_browsers = {
+			"AppleWebKit": UserAgentSupportedParts.apple_webkit_browsers,
+			"Gecko": UserAgentSupportedParts.gecko_browsers,
+			"Blink": UserAgentSupportedParts.blink_browsers
+		}
+	
+		blocks = []
+	
+		for os_part in get_os_space_parts():
+			if os_part.name not in platforms:
+				continue
+	
+			engines = ["AppleWebKit"] if os_part.name == "IOS" else UserAgentSupportedParts.engine
+	
+			for engine in engines:
+				for browser in engine_browsers[engine]:
+					if browser in browsers:
+						blocks.append(UserAgentSpaceBlock(os_part, engine_parts[engine], browser_parts[browser]))
+	
+		if not blocks:
+			raise ValueError("No user agents match the given platforms and browsers.")
+	
+		offsets = [0]
+	
+		for block in blocks[:-1]:
+			offsets.append(offsets[-1] + block.size)
+	
+		self.blocks = tuple(blocks)
+		self.offsets = tuple(offsets)
+		self.size = offsets[-1] + blocks[-1].size
+	
+	def decode(self, index: int) -> str:
+		"""
+		Builds the user agent with the given index.
+
+		Args:
+			index (int): The index, from 0 to `size - 1`.
+
+		Returns:
+			str: The user agent string.
+
+		Raises:
+			IndexError: If the index is out of range.
+		"""
+		if not 0 <= index < self.size:
+			raise IndexError(f"User agent index {index} is out of range [0, {self.size}).")
+	
+		block_index = bisect_right(self.offsets, index) - 1
+	
+		return self.blocks[block_index].decode(index - self.offsets[block_index])
+	
+	def __getitem__(self, index: int) -> str:
+		return self.decode(index)
+	
+	def sample_indexes(self, k: int, rng: Optional[random.Random] = None) -> list[int]:
+		"""
+		Draws `k` distinct indexes uniformly at random (Floyd's algorithm).
+
+		The draw takes `k` random numbers whatever the size of the space, without rejections.
+
+		Args:
+			k (int): The number of indexes to draw.
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			list[int]: The indexes in random order.
+
+		Raises:
+			ValueError: If `k` is negative or larger than `size`.
+		"""
+		if not 0 <= k <= self.size:
+			raise ValueError(f"k must be between 0 and {self.size}, got {k}")
+	
+		rng = get_rng(rng)
+		selected: set[int] = set()
+	
+		for upper in range(self.size - k, self.size):
+			index = rng.randrange(upper + 1)
+			selected.add(upper if index in selected else index)
+	
+		indexes = sorted(selected)
+		rng.shuffle(indexes)
+	
+		return indexes
+	
+	def sample(self, k: int, rng: Optional[random.Random] = None) -> list[str]:
+		"""
+		Draws `k` distinct user agents uniformly at random from the space.
+
+		Args:
+			k (int): The number of user agents to draw.
+			rng (Optional[random.Random]): The random generator to use. Defaults to None, which means the random generator of the current thread.
+
+		Returns:
+			list[str]: The user agents in random order.
+
+		Raises:
+			ValueError: If `k` is negative or larger than `size`.
+		"""
+		return [self.decode(index) for index in self.sample_indexes(k, rng=rng)]
@@ -0,0 +1,286 @@
+import random
+from array import array
+from typing import (
+	Any,
+	Callable,
+	Optional,
+	Sequence,
+	Union
+)
+
+
+weight_table = Union[dict[Any, float], Callable[[Any], float]]
+
+
+class AliasTable:
+	"""
+	Precompiled table for O(1) sampling from a discrete weighted distribution (Vose's alias method).
+
+	Building the table takes O(n). Every draw then costs one random number, one index and one comparison,
+	whatever the number of values and the shape of the weights.
+
+	Attributes:
+		values (tuple[Any, ...]): The values that are sampled.
+	"""
+	
+	def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+		"""
+		Initializes a new instance of `AliasTable`.
+
+		Args:
+			values (Sequence[Any]): The values to sample from.
+			weights (Sequence[float]): A non-negative weight for every value. They do not have to sum to 1.
+
+		Raises:
+			ValueError: If the lengths differ, a weight is negative or all weights are zero.
+		"""
+		if len(values) != len(weights):
+			raise ValueError(f"Got {len(values)} values but {len(weights)} weights.")
+	
+		if any(weight < 0 for weight in weights):
+			raise ValueError("Weights must not be negative.")
+	
+		total = sum(weights)
+	
+		if total <= 0:
+			raise ValueError("At least one weight must be positive.")
+	
+		count = len(values)
+		scaled = [weight * count / total for weight in weights]
+		small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+		large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+	
+		self.values = tuple(values)
+		self._probabilities = array("d", [1.0]) * count
+		self._aliases = array("L", range(count))
+	
+		while small and large:
+			small_index = small.pop()
+			large_index = large.pop()
+	
+			self._probabilities[small_index] = scaled[small_index]
+			self._aliases[small_index] = large_index
+	
+			scaled[large_index] += scaled[small_index] - 1.0
+			(small if scaled[large_index] < 1.0 else large).append(large_index)
+	
+	def __len__(self) -> int:
+		return len(self.values)
+	
+	def sample(self, rng: random.Random) -> Any:
+		"""
+		Draws one value.
+
+		Args:
+			rng (random.Random): The random generator to draw with.
+
+		Returns:
+			Any: The drawn value.
+		"""
+		position = rng.random() * len(self.values)
+		index = int(position)
+	
+		if position - index < self._probabilities[index]:
+			return self.values[index]
+	
+		return self.values[self._aliases[index]]
+	
+	def sample_many(self, k: int, rng: random.Random) -> list[Any]:
+		"""
+		Draws `k` values independently.
+
+		Args:
+			k (int): The number of values to draw.
+			rng (random.Random): The random generator to draw with.
+
+		Returns:
+			list[Any]: The drawn values.
+		"""
+		values = self.values
+		probabilities = self._probabilities
+		aliases = self._aliases
+		count = len(values)
+		draw = rng.random
+		result = []
+	
+		for _ in range(k):
+			position = draw() * count
+			index = int(position)
+			result.append(values[index] if position - index < probabilities[index] else values[aliases[index]])
+	
+		return result
+
+
+class UserAgentWeights:
+	"""
+	User-supplied weights for the random choices made by the user agent generators.
+
+	Weights are given per table name. The names are "os", "engine" and "browser" for the supported parts, the attribute names
+	of `UserAgentOS` (e.g. "windows_versions", "android_devices", "ios_devices") for platform details, and the attribute names of
+	`UserAgentBrowser` and `UserAgentEngine` (e.g. "chrome_versions", "apple_webkit_versions") for versions, where the weights apply
+	to the first (major) version number.
+
+	A weight table is either a dictionary from value to weight, where values that are not listed get weight 0, or a function that
+	returns the weight of a value. Tables without weights keep the uniform choice. The weights of a table are compiled into an `AliasTable`
+	on first use for every set of values it is applied to (e.g. the browsers of one engine), so weighted choices cost O(1).
+
+	Attributes:
+		tables (dict[str, weight_table]): The weight tables by table name.
+	"""
+	
+	def __init__(self, tables: Optional[dict[str, weight_table]] = None):
+		"""
+		Initializes a new instance of `UserAgentWeights`.
+
+		Args:
+			tables (Optional[dict[str, weight_table]]): The weight tables by table name. Defaults to None.
+		"""
+		self.tables = tables if tables is not None else {}
+		self._alias_tables: dict[tuple[str, int], tuple[Sequence[Any], AliasTable]] = {}
+	
+	def get_weights(self, name: str, values: Sequence[Any]) -> list[float]:
+		"""
+		Returns the weight of every value of a table.
+
+		Args:
+			name (str): The table name.
+			values (Sequence[Any]): The values to weigh.
+
+		Returns:
+			list[float]: The weights in the order of `values`. All 1.0 if the table has no weights.
+		"""
+		table = self.tables.get(name)
+	
+		if table is None:
+			return [1.0] * len(values)
+	
+		if callable(table):
+			return [float(table(value)) for value in values]
+	
+		return [float(table.get(value, 0.0)) for value in values]
+	
+	def get_alias_table(self, name: str, values: Sequence[Any]) -> AliasTable:
+		"""
+		Returns the compiled alias table of a weight table for a set of values.
+
+		Args:
+			name (str): The table name.
+			values (Sequence[Any]): The values the weights are applied to.
+
+		Returns:
+			AliasTable: The compiled table.
+
+		Raises:
+			ValueError: If all values get weight 0 or a weight is negative.
+		"""
+		key = (name, id(values))
+		cached = self._alias_tables.get(key)
+	
+		if cached is not None and cached[0] is values:
+			return cached[1]
+	
+		alias_table = AliasTable(values, self.get_weights(name, values))
+		self._alias_tables[key] = (values, alias_table)
+	
+		return alias_table
+	
+	def choose(self, name: str, values: Sequence[Any], rng: random.Random) -> Any:
+		"""
+		Chooses one value of a table, weighted if the table has weights and uniformly otherwise.
+
+		Args:
+			name (str): The table name.
+			values (Sequence[Any]): The values to choose from.
+			rng (random.Random): The random generator to use.
+
+		Returns:
+			Any: The chosen value.
+		"""
+		if name not in self.tables:
+			return rng.choice(values)
+	
+		return self.get_alias_table(name, values).sample(rng)
+	
+	def choose_many(self, name: str, values: Sequence[Any], k: int, rng: random.Random) -> list[Any]:
+		"""
+		Chooses `k` values of a table independently, weighted if the table has weights and uniformly otherwise.
+
+		Args:
+			name (str): The table name.
+			values (Sequence[Any]): The values to choose from.
+			k (int): The number of values to choose.
+			rng (random.Random): The random generator to use.
+
+		Returns:
+			list[Any]: The chosen values.
+		"""
+		if name not in self.tables:
+			return rng.choices(values, k=k)
+	
+		return self.get_alias_table(name, values).sample_many(k, rng)
+
+
+def choose_weighted(
+		name: str,
+		values: Sequence[Any],
+		rng: random.Random,
+		weights: Optional[UserAgentWeights] = None
+) -> Any:
+	"""
+	Chooses one value of a user agent data table.
+
+	Args:
+		name (str): The table name, see `UserAgentWeights`.
+		values (Sequence[Any]): The values to choose from.
+		rng (random.Random): The random generator to use.
+		weights (Optional[UserAgentWeights]): The weights to apply. Defaults to None, which means a uniform choice.
+
+	Returns:
+		Any: The chosen value.
+	"""
+	if weights is None:
+		return rng.choice(values)
+	
+	return weights.choose(name, values, rng)
+
+
+def choose_weighted_many(
+		name: str,
+		values: Sequence[Any],
+		k: int,
+		rng: random.Random,
+		weights: Optional[UserAgentWeights] = None
+) -> list[Any]:
+	"""
+	Chooses `k` values of a user agent data table independently.
+
+	Args:
+		name (str): The table name, see `UserAgentWeights`.
+		values (Sequence[Any]): The values to choose from.
+		k (int): The number of values to choose.
+		rng (random.Random): The random generator to use.
+		weights (Optional[UserAgentWeights]): The weights to apply. Defaults to None, which means uniform choices.
+
+	Returns:
+		list[Any]: The chosen values.
+	"""
+	if weights is None:
+		return rng.choices(values, k=k)
+	
+	return weights.choose_many(name, values, k, rng)
+
+
+market_share_user_agent_weights = UserAgentWeights(
+		{
+			"os": {"Windows": 45, "Android": 30, "IOS": 14, "Macintosh": 8, "Linux": 3},
+			"engine": {"Blink": 72, "AppleWebKit": 22, "Gecko": 6},
+			"browser": {"Chrome": 65, "Safari": 19, "Edge": 6, "Firefox": 4, "Opera": 3, "Yandex": 1},
+			"windows_versions": {"NT 10.0": 92, "NT 6.3": 2, "NT 6.1": 6},
+			"windows_architectures": {"Win64; x64": 90, "WOW64": 6, "Win32": 4},
+			"chrome_versions": lambda major: 0.75 ** (132 - major) if major >= 120 else 0.0,
+			"edge_versions": lambda major: 0.75 ** (132 - major) if major >= 120 else 0.0,
+			"opera_versions": lambda major: 0.75 ** (116 - major) if major >= 105 else 0.0,
+			"firefox_versions": lambda major: 0.75 ** (135 - major) if major >= 115 else 0.0,
+			"yandex_versions": lambda major: 0.75 ** (24 - major) if major >= 20 else 0.0
+		}
+)
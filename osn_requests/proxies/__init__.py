@@ -0,0 +1,133 @@
+import requests
+from osn_requests import get_req
+from osn_requests.types import Proxy
+from osn_requests.proxies.store import ProxyStore
+from osn_requests.proxies.cache import ProxyListCache
+from osn_requests.proxies.functions import get_proxy_link
+from osn_requests.proxies.sources import (
+	JSONProxySource,
+	ProxySource,
+	fetch_proxy_sources
+)
+from typing import (
+	Callable,
+	Optional,
+	Sequence,
+	Union
+)
+from osn_requests.headers.profiles import generate_request_headers
+
+
+def create_filter_function(parameters: Optional[Union[list[str], str]]) -> Callable[[str], bool]:
+	"""
+	Creates a filter function based on provided parameters.
+
+	This function generates a callable filter that checks if a given string matches any of the provided parameters.
+	It supports filtering against a single string, a list of strings, or no filter at all (None).
+
+	Args:
+		parameters (Optional[Union[list[str], str]]): The parameters to filter against. Can be:
+			- None: Returns a function that always returns True (no filtering).
+			- str: Returns a function that checks if the input string is equal to this parameter.
+			- list[str]: Returns a function that checks if the input string is present in this list.
+
+	Returns:
+		Callable[[str], bool]: A function that takes a string as input and returns True if it matches the filter criteria, False otherwise.
+
+	Raises:
+		TypeError: If the `parameters` argument is not None, str, or list[str].
+	"""
+	if isinstance(parameters, list):
+		return lambda x: any(parameter == x for parameter in parameters)
+	elif isinstance(parameters, str):
+		return lambda x: parameters == x
+	elif parameters is None:
+		return lambda x: True
+	else:
+		raise TypeError(f"Expected None, str or list[str], got {type(parameters)}")
+
+
+def generate_free_proxies_headers() -> dict[str, str]:
+	"""
+	Generates random realistic request headers for downloading the free proxy list.
+
+	Returns:
+		dict[str, str]: Request headers with random Accept, Accept-Encoding, Accept-Charset, Accept-Language and User-Agent values, with hyphenated keys.
+	"""
+	return generate_request_headers()
+
+
+free_proxies_source = JSONProxySource(
+		location="https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/all/data.json",
+		name="proxifly",
+		headers_factory=generate_free_proxies_headers
+)
+
+
+def parse_free_proxies_response(
+		response: requests.Response,
+		protocol_filter: Optional[Union[str, list[str]]] = None,
+		country_filter: Optional[Union[str, list[str]]] = None
+) -> list[Proxy]:
+	"""
+	Parses the free proxy list document into Proxy dictionaries while it is being downloaded.
+
+	The JSON array is parsed incrementally by `free_proxies_source`, and the filters are applied to every record as soon as it is parsed.
+	Only the four `Proxy` fields of the matching records are kept, so the memory used is proportional to the filtered result rather than to the upstream document.
+
+	Args:
+		response (requests.Response): The response with the proxifly JSON document. It should be requested with `stream=True`.
+		protocol_filter (Optional[Union[str, list[str]]]): Filters proxies by protocol. If None, no protocol filtering is applied.
+		country_filter (Optional[Union[str, list[str]]]): Filters proxies by country. If None, no country filtering is applied.
+
+	Returns:
+		list[Proxy]: The proxies from the document that match the filters.
+	"""
+	protocol_filter_function = create_filter_function(protocol_filter)
+	country_filter_function = create_filter_function(country_filter)
+	
+	return [
+		proxy
+		for proxy in free_proxies_source.parse(response.iter_content(chunk_size=65536))
+		if protocol_filter_function(proxy["protocol"])
+		and country_filter_function(proxy["country"])
+	]
+
+
+free_proxies_cache = ProxyListCache(
+		url=free_proxies_source.location,
+		parse_response=parse_free_proxies_response,
+		headers_factory=generate_free_proxies_headers
+)
+
+
+def get_free_proxies(
+		protocol_filter: Optional[Union[str, list[str]]] = None,
+		country_filter: Optional[Union[str, list[str]]] = None,
+		use_cache: bool = True,
+		sources: Optional[Sequence[ProxySource]] = None
+) -> list[Proxy]:
+	"""
+	Fetches a list of free proxies, optionally filtered by protocol and country.
+
+	This function retrieves a list of free proxies from a public API. It allows filtering the proxies based on the protocol they support (e.g., 'http', 'https') and the country of origin.
+	By default, the downloaded list is kept in `free_proxies_cache` as an indexed `ProxyStore`, so repeated calls within its TTL (and concurrent calls from several threads) share one download,
+	and the filters are answered from the store indexes instead of scanning the whole list.
+
+	Args:
+		protocol_filter (Optional[Union[str, list[str]]]): Filters proxies by protocol. Can be a single protocol string or a list of protocol strings. If None, no protocol filtering is applied.
+		country_filter (Optional[Union[str, list[str]]]): Filters proxies by country. Can be a single country code (ISO) or a list of country codes. If None, no country filtering is applied.
+		use_cache (bool): Whether to use the in-process cache. If False, the list is always downloaded again. Defaults to True.
+		sources (Optional[Sequence[ProxySource]]): Proxy sources to use instead of the default proxifly list. They are fetched concurrently with `fetch_proxy_sources`, merged and deduplicated, and are not cached. Only the proxies are returned; call `fetch_proxy_sources` directly to get the per-source reports with timings, counts and errors. Defaults to None.
+
+	Returns:
+		list[Proxy]: A list of Proxy dictionaries that match the specified filters. Each dictionary contains proxy details (protocol, ip, port, country).
+	"""
+	if sources is not None:
+		return ProxyStore(fetch_proxy_sources(sources)[0]).query(protocols=protocol_filter, countries=country_filter)
+	
+	if use_cache:
+		return free_proxies_cache.get().query(protocols=protocol_filter, countries=country_filter)
+	
+	with get_req(url=free_proxies_cache.url, headers=generate_free_proxies_headers(), stream=True) as response:
+		return parse_free_proxies_response(response, protocol_filter, country_filter)
@@ -0,0 +1,165 @@
+import time
+import requests
+import threading
+from osn_requests import get_req
+from osn_requests.proxies.store import ProxyStore
+from osn_requests.types import (
+	Proxy,
+	RequestHeaders
+)
+from typing import (
+	Callable,
+	Optional
+)
+
+
+class ProxyListCache:
+	"""
+	In-process cache of a proxy list downloaded from a URL.
+
+	The downloaded list is kept as an indexed `ProxyStore` for `ttl` seconds. After that it is refreshed with a conditional request (`If-None-Match` and `If-Modified-Since`),
+	so an unchanged upstream document costs a single 304 response. Only one refresh runs at a time: callers that find no data wait for the
+	running download, while callers that find stale data get it immediately and the refresh is done in a background thread.
+
+	Attributes:
+		url (str): The URL of the proxy list.
+		ttl (float): Time in seconds during which the cached list is served without a refresh.
+		timeout (float): Timeout in seconds for the download.
+		last_error (Optional[Exception]): The error raised by the last failed background refresh, or None.
+	"""
+	
+	def __init__(
+			self,
+			url: str,
+			parse_response: Callable[[requests.Response], list[Proxy]],
+			headers_factory: Optional[Callable[[], RequestHeaders]] = None,
+			ttl: float = 300.0,
+			timeout: float = 30.0
+	):
+		"""
+		Initializes a new instance of `ProxyListCache`.
+
+		Args:
+			url (str): The URL of the proxy list.
+			parse_response (Callable[[requests.Response], list[Proxy]]): A function that turns a successful response into a list of proxies.
+			headers_factory (Optional[Callable[[], RequestHeaders]]): A function that returns the request headers for every download. Defaults to None.
+			ttl (float): Time in seconds during which the cached list is served without a refresh. Defaults to 300.0.
+			timeout (float): Timeout in seconds for the download. Defaults to 30.0.
+		"""
+		self.url = url
+		self.ttl = ttl
+		self.timeout = timeout
+		self.last_error: Optional[Exception] = None
+	
+		self._parse_response = parse_response
+		self._headers_factory = headers_factory
+		self._store: Optional[ProxyStore] = None
+		self._etag: Optional[str] = None
+		self._last_modified: Optional[str] = None
+		self._fetched_at = 0.0
+		self._refresh_lock = threading.Lock()
+	
+	def is_fresh(self) -> bool:
+		"""
+		Checks whether the cached list is younger than `ttl`.
+
+		Returns:
+			bool: True if a list is cached and does not need a refresh, False otherwise.
+		"""
+		return self._store is not None and time.monotonic() - self._fetched_at < self.ttl
+	
+	def fetch(self) -> None:
+		"""
+		Downloads the proxy list with a conditional request and updates the cache.
+
+		A 304 response only extends the lifetime of the cached list.
+
+		Raises:
+			requests.HTTPError: If the server responds with an error status.
+		"""
+		headers = RequestHeaders() if self._headers_factory is None else self._headers_factory()
+	
+		if self._store is not None:
+			if self._etag is not None:
+				headers["If_None_Match"] = self._etag
+	
+			if self._last_modified is not None:
+				headers["If_Modified_Since"] = self._last_modified
+	
+		response = get_req(url=self.url, headers=headers, timeout=self.timeout, stream=True)
+	
+		try:
+			if response.status_code == 304 and self._store is not None:
+				self._fetched_at = time.monotonic()
+				return
+	
+			response.raise_for_status()
+	
+			store = ProxyStore(self._parse_response(response))
+		finally:
+			response.close()
+	
+		self._etag = response.headers.get("ETag")
+		self._last_modified = response.headers.get("Last-Modified")
+		self._store = store
+		self._fetched_at = time.monotonic()
+	
+	def refresh_in_background(self) -> None:
+		"""
+		Starts a background refresh unless one is already running.
+		"""
+		if not self._refresh_lock.acquire(blocking=False):
+			return
+	
+		try:
+			threading.Thread(target=self.background_refresh, daemon=True).start()
+		except RuntimeError:
+			self._refresh_lock.release()
+	
+	def background_refresh(self) -> None:
+		"""
+		Refreshes the cache and releases the refresh lock acquired by `refresh_in_background`.
+
+		Errors are stored in `last_error`, and the stale list keeps being served.
+		"""
+		try:
+			self.fetch()
+			self.last_error = None
+		except Exception as error:
+			self.last_error = error
+		finally:
+			self._refresh_lock.release()
+	
+	def get(self) -> ProxyStore:
+		"""
+		Returns the cached proxy store, downloading or refreshing it if needed.
+
+		Returns:
+			ProxyStore: The cached proxy store. It must not be modified by the caller.
+
+		Raises:
+			requests.RequestException: If there is no cached list yet and the download fails.
+		"""
+		store = self._store
+	
+		if store is not None:
+			if not self.is_fresh():
+				self.refresh_in_background()
+	
+			return store
+	
+		with self._refresh_lock:
+			if self._store is None:
+				self.fetch()
+	
+			return self._store
+	
+	def clear(self) -> None:
+		"""
+		Drops the cached list and its validators, so the next `get` downloads the list again.
+		"""
+		with self._refresh_lock:
+			self._store = None
+			self._etag = None
+			self._last_modified = None
+			self._fetched_at = 0.0
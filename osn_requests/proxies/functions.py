@@ -0,0 +1,58 @@
+from osn_requests.proxies.types import proxy_key
+from osn_requests.types import (
+	Proxy,
+	RequestProxy
+)
+
+
+def get_proxy_link(proxy: Proxy) -> str:
+	"""
+	Constructs a proxy link string from a Proxy dictionary.
+
+	This function takes a Proxy dictionary and formats it into a string that can be used as a proxy URL in requests libraries.
+
+	Args:
+		proxy (Proxy): A dictionary containing proxy details.
+
+	Returns:
+		str: A string representing the proxy link in the format 'protocol://ip:port'.
+	"""
+	return f"{proxy['protocol']}://{proxy['ip']}:{proxy['port']}"
+
+
+def get_request_proxy(proxy: Proxy, remote_dns: bool = True) -> RequestProxy:
+	"""
+	Builds a `proxies` argument for `get_req` that routes all traffic through a single proxy.
+
+	The request library selects a proxy by the scheme of the requested URL, so the proxy link is set for both 'http' and 'https' URLs.
+	SOCKS5 proxies are linked with the 'socks5h' scheme by default, so host names are resolved by the proxy and no DNS query leaks
+	from the local machine. SOCKS4 has no host name support in the base protocol, so SOCKS4 links always carry resolved addresses.
+
+	Args:
+		proxy (Proxy): A dictionary containing proxy details.
+		remote_dns (bool): Whether a SOCKS5 proxy should resolve host names itself. Defaults to True.
+
+	Returns:
+		RequestProxy: A dictionary mapping 'http' and 'https' to the proxy link.
+	"""
+	proxy_link = get_proxy_link(proxy)
+	
+	if remote_dns and proxy["protocol"].lower() == "socks5":
+		proxy_link = f"socks5h://{proxy['ip']}:{proxy['port']}"
+	
+	return RequestProxy(http=proxy_link, https=proxy_link)
+
+
+def get_proxy_key(proxy: Proxy) -> proxy_key:
+	"""
+	Builds a hashable identity key for a proxy.
+
+	Two proxies with the same protocol, IP address and port are considered to be the same proxy server, regardless of the reported country.
+
+	Args:
+		proxy (Proxy): A dictionary containing proxy details.
+
+	Returns:
+		proxy_key: A tuple of (protocol, ip, port).
+	"""
+	return proxy["protocol"], proxy["ip"], str(proxy["port"])
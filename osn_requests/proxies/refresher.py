@@ -0,0 +1,180 @@
+import time
+import atexit
+import threading
+from osn_requests.types import Proxy
+from osn_requests.proxies import get_free_proxies
+from osn_requests.proxies.validation import ProxyValidator
+from osn_requests.proxies.sources import (
+	ProxySource,
+	fetch_proxy_sources
+)
+from typing import (
+	Callable,
+	Iterable,
+	Optional,
+	Sequence
+)
+
+
+class ProxyRefresher:
+	"""
+	Keeps a proxy pool up to date from a background thread.
+
+	The pool is re-fetched every `interval` seconds. If a `ProxyValidator` is given, the fetched proxies are validated and the pool
+	contains only live proxies ranked by latency; since the validator remembers its results, only new or stale entries are probed again.
+
+	Every refresh builds a new tuple and publishes it with a single reference assignment. Readers get the current pool from `pool`
+	without any lock and always see either the previous or the next complete pool, never a half-built one.
+
+	The worker thread is a daemon thread; at interpreter exit it is asked to stop and given a second to finish.
+
+	Attributes:
+		interval (float): Time in seconds between refreshes.
+		validator (Optional[ProxyValidator]): The validator applied to fetched proxies.
+		last_error (Optional[Exception]): The error raised by the last failed refresh, or None.
+		updated_at (Optional[float]): Unix timestamp of the last successful refresh, or None.
+	"""
+	
+	def __init__(
+			self,
+			fetch: Optional[Callable[[], Iterable[Proxy]]] = None,
+			sources: Optional[Sequence[ProxySource]] = None,
+			interval: float = 300.0,
+			validator: Optional[ProxyValidator] = None
+	):
+		"""
+		Initializes a new instance of `ProxyRefresher`.
+
+		Args:
+			fetch (Optional[Callable[[], Iterable[Proxy]]]): A function that returns the current proxies. Defaults to None.
+			sources (Optional[Sequence[ProxySource]]): Sources fetched with `fetch_proxy_sources` if `fetch` is None. Defaults to None.
+			interval (float): Time in seconds between refreshes. Defaults to 300.0.
+			validator (Optional[ProxyValidator]): A validator applied to the fetched proxies. Defaults to None.
+
+		Raises:
+			ValueError: If both `fetch` and `sources` are given.
+		"""
+		if fetch is not None and sources is not None:
+			raise ValueError("Pass either fetch or sources, not both.")
+	
+		if fetch is None:
+			if sources is None:
+				fetch = lambda: get_free_proxies(use_cache=False)
+			else:
+				fetch = lambda: fetch_proxy_sources(sources)[0]
+	
+		self.interval = interval
+		self.validator = validator
+		self.last_error: Optional[Exception] = None
+		self.updated_at: Optional[float] = None
+	
+		self._fetch = fetch
+		self._pool: tuple[Proxy, ...] = ()
+		self._ready = threading.Event()
+		self._stop_event = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+	
+	@property
+	def pool(self) -> tuple[Proxy, ...]:
+		"""
+		The current proxy pool.
+
+		Returns:
+			tuple[Proxy, ...]: The last published pool. Empty until the first successful refresh.
+		"""
+		return self._pool
+	
+	@property
+	def is_running(self) -> bool:
+		"""
+		Whether the background thread is running.
+
+		Returns:
+			bool: True if the refresher was started and not stopped yet.
+		"""
+		return self._thread is not None and self._thread.is_alive()
+	
+	def refresh(self) -> tuple[Proxy, ...]:
+		"""
+		Fetches (and validates) the proxies and publishes the new pool.
+
+		Returns:
+			tuple[Proxy, ...]: The published pool.
+		"""
+		proxies = list(self._fetch())
+	
+		if self.validator is not None:
+			proxies = [result["proxy"] for result in self.validator.validate(proxies)]
+	
+		pool = tuple(proxies)
+	
+		self._pool = pool
+		self.updated_at = time.time()
+		self._ready.set()
+	
+		return pool
+	
+	def run(self) -> None:
+		"""
+		The body of the background thread: refreshes the pool until `stop` is called.
+
+		Errors are stored in `last_error` and the previous pool stays published.
+		"""
+		while not self._stop_event.is_set():
+			try:
+				self.refresh()
+				self.last_error = None
+			except Exception as error:
+				self.last_error = error
+	
+			self._stop_event.wait(self.interval)
+	
+	def start(self) -> "ProxyRefresher":
+		"""
+		Starts the background thread. The first refresh starts immediately.
+
+		Returns:
+			ProxyRefresher: The refresher itself.
+		"""
+		if self.is_running:
+			return self
+	
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self.run, name="ProxyRefresher", daemon=True)
+		self._thread.start()
+	
+		atexit.register(self.stop, 1.0)
+	
+		return self
+	
+	def wait_ready(self, timeout: Optional[float] = None) -> bool:
+		"""
+		Waits until the first pool is published.
+
+		Args:
+			timeout (Optional[float]): Maximum time to wait in seconds. Defaults to None, which means to wait forever.
+
+		Returns:
+			bool: True if a pool was published, False if the timeout expired.
+		"""
+		return self._ready.wait(timeout)
+	
+	def stop(self, timeout: Optional[float] = None) -> None:
+		"""
+		Stops the background thread and waits for it to finish the current refresh.
+
+		Args:
+			timeout (Optional[float]): Maximum time to wait in seconds. Defaults to None, which means to wait forever.
+		"""
+		self._stop_event.set()
+	
+		if self._thread is not None and self._thread is not threading.current_thread():
+			self._thread.join(timeout)
+	
+		atexit.unregister(self.stop)
+	
+	def __enter__(self) -> "ProxyRefresher":
+		return self.start()
+	
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.stop()
@@ -0,0 +1,348 @@
+import time
+import heapq
+import random
+import requests
+import threading
+from array import array
+from osn_requests import get_req
+from osn_requests.proxies.types import proxy_key
+from typing import (
+	Any,
+	Hashable,
+	Iterable,
+	Optional
+)
+from osn_requests.types import (
+	Proxy,
+	RequestProxy
+)
+from osn_requests.proxies.functions import (
+	get_proxy_key,
+	get_request_proxy
+)
+
+
+class ProxyRotator:
+	"""
+	Picks proxies from a pool, preferring healthy and fast ones.
+
+	Health is tracked per proxy in flat arrays: number of attempts and successes, an exponentially weighted moving average (EWMA)
+	of the request latency and the current streak of failures. A proxy is scored as its smoothed success rate divided by its
+	latency EWMA, and selection uses power-of-two-choices: two random available proxies are drawn and the better one wins.
+	This is O(1) per pick and never needs to rebuild a weight table after a report.
+
+	A failing proxy is put into quarantine for `base_quarantine * 2 ** (failure_streak - 1)` seconds (capped by `max_quarantine`)
+	and is not selected until the quarantine ends. A logical session can be pinned to one proxy, which stays assigned until it gets quarantined.
+
+	The rotator is thread-safe.
+
+	Attributes:
+		proxies (list[Proxy]): The deduplicated proxies in the pool. Index positions match the health arrays.
+		ewma_alpha (float): Weight of the newest latency sample in the latency EWMA.
+		base_quarantine (float): Quarantine time in seconds after the first failure in a row.
+		max_quarantine (float): Maximum quarantine time in seconds.
+		http_session (Optional[requests.Session]): The session used by `get_req`, which keeps one connection pool per proxy.
+	"""
+	
+	def __init__(
+			self,
+			proxies: Iterable[Proxy],
+			ewma_alpha: float = 0.3,
+			base_quarantine: float = 30.0,
+			max_quarantine: float = 3600.0,
+			initial_latency: float = 1.0,
+			rng: Optional[random.Random] = None,
+			http_session: Optional[requests.Session] = None
+	):
+		"""
+		Initializes a new instance of `ProxyRotator`.
+
+		Args:
+			proxies (Iterable[Proxy]): Proxies to rotate. Duplicates (same protocol, IP and port) are dropped.
+			ewma_alpha (float): Weight of the newest latency sample in the latency EWMA, between 0 and 1. Defaults to 0.3.
+			base_quarantine (float): Quarantine time in seconds after the first failure in a row. Defaults to 30.0.
+			max_quarantine (float): Maximum quarantine time in seconds. Defaults to 3600.0.
+			initial_latency (float): Latency in seconds assumed for proxies that were never used. Defaults to 1.0.
+			rng (Optional[random.Random]): Random generator used for selection. Defaults to a new `random.Random` instance.
+			http_session (Optional[requests.Session]): A session for `get_req`, so connections to each proxy are reused. Defaults to None.
+
+		Raises:
+			ValueError: If `proxies` is empty.
+		"""
+		self.proxies: list[Proxy] = []
+		self._indexes: dict[proxy_key, int] = {}
+	
+		for proxy in proxies:
+			key = get_proxy_key(proxy)
+	
+			if key not in self._indexes:
+				self._indexes[key] = len(self.proxies)
+				self.proxies.append(proxy)
+	
+		if not self.proxies:
+			raise ValueError("ProxyRotator needs at least one proxy.")
+	
+		self.ewma_alpha = ewma_alpha
+		self.base_quarantine = base_quarantine
+		self.max_quarantine = max_quarantine
+		self.http_session = http_session
+	
+		proxies_count = len(self.proxies)
+	
+		self._attempts = array("L", [0]) * proxies_count
+		self._successes = array("L", [0]) * proxies_count
+		self._failure_streaks = array("L", [0]) * proxies_count
+		self._latencies = array("d", [initial_latency]) * proxies_count
+		self._quarantined_until = array("d", [0.0]) * proxies_count
+	
+		self._available = array("L", range(proxies_count))
+		self._available_positions = array("l", range(proxies_count))
+		self._quarantine_heap: list[tuple[float, int]] = []
+	
+		self._sessions: dict[Hashable, int] = {}
+		self._lock = threading.Lock()
+		self._random = rng if rng is not None else random.Random()
+	
+	def __len__(self) -> int:
+		return len(self.proxies)
+	
+	def get_score(self, index: int) -> float:
+		"""
+		Calculates the selection score of a proxy.
+
+		Args:
+			index (int): The index of the proxy in `proxies`.
+
+		Returns:
+			float: The Laplace-smoothed success rate divided by the latency EWMA. Higher is better.
+		"""
+		success_rate = (self._successes[index] + 1) / (self._attempts[index] + 2)
+	
+		return success_rate / max(self._latencies[index], 1e-6)
+	
+	def get_stats(self, proxy: Proxy) -> dict[str, Any]:
+		"""
+		Returns the health statistics of a proxy.
+
+		Args:
+			proxy (Proxy): A proxy from the pool.
+
+		Returns:
+			dict[str, Any]: A dictionary with 'attempts', 'successes', 'success_rate', 'latency', 'failure_streak' and 'quarantined_until'.
+
+		Raises:
+			KeyError: If the proxy is not in the pool.
+		"""
+		index = self._indexes[get_proxy_key(proxy)]
+	
+		with self._lock:
+			attempts = self._attempts[index]
+	
+			return {
+				"attempts": attempts,
+				"successes": self._successes[index],
+				"success_rate": self._successes[index] / attempts if attempts else None,
+				"latency": self._latencies[index],
+				"failure_streak": self._failure_streaks[index],
+				"quarantined_until": self._quarantined_until[index],
+			}
+	
+	def release_expired(self, now: float) -> None:
+		"""
+		Moves proxies whose quarantine has ended back to the available set. Must be called with the lock held.
+
+		Args:
+			now (float): The current monotonic time.
+		"""
+		while self._quarantine_heap and self._quarantine_heap[0][0] <= now:
+			until, index = heapq.heappop(self._quarantine_heap)
+	
+			if self._quarantined_until[index] == until and self._available_positions[index] < 0:
+				self._available_positions[index] = len(self._available)
+				self._available.append(index)
+	
+	def quarantine(self, index: int, now: float) -> None:
+		"""
+		Removes a proxy from the available set for its backoff period. Must be called with the lock held.
+
+		Args:
+			index (int): The index of the proxy in `proxies`.
+			now (float): The current monotonic time.
+		"""
+		until = now + min(self.base_quarantine * 2 ** (self._failure_streaks[index] - 1), self.max_quarantine)
+		self._quarantined_until[index] = until
+		heapq.heappush(self._quarantine_heap, (until, index))
+	
+		position = self._available_positions[index]
+	
+		if position >= 0:
+			last_index = self._available[-1]
+			self._available[position] = last_index
+			self._available_positions[last_index] = position
+			self._available.pop()
+			self._available_positions[index] = -1
+	
+	def release(self, index: int) -> None:
+		"""
+		Ends the quarantine of a proxy and moves it back to the available set. Must be called with the lock held.
+
+		The heap entry of the ended quarantine is left in place and skipped by `release_expired`, because its time no longer matches.
+
+		Args:
+			index (int): The index of the proxy in `proxies`.
+		"""
+		self._quarantined_until[index] = 0.0
+	
+		if self._available_positions[index] < 0:
+			self._available_positions[index] = len(self._available)
+			self._available.append(index)
+	
+	def choose_index(self, now: float) -> int:
+		"""
+		Selects a proxy index with power-of-two-choices. Must be called with the lock held.
+
+		The two candidates are always different proxies. If every proxy is quarantined, the one whose quarantine ends first is returned,
+		after dropping heap entries of quarantines that were ended or extended since they were pushed.
+
+		Args:
+			now (float): The current monotonic time.
+
+		Returns:
+			int: The index of the selected proxy in `proxies`.
+		"""
+		self.release_expired(now)
+	
+		available_count = len(self._available)
+	
+		if available_count == 0:
+			while self._quarantined_until[self._quarantine_heap[0][1]] != self._quarantine_heap[0][0]:
+				heapq.heappop(self._quarantine_heap)
+	
+			return self._quarantine_heap[0][1]
+	
+		first_position = self._random.randrange(available_count)
+		first = self._available[first_position]
+	
+		if available_count == 1:
+			return first
+	
+		second_position = self._random.randrange(available_count - 1)
+		second = self._available[second_position + (second_position >= first_position)]
+	
+		return first if self.get_score(first) >= self.get_score(second) else second
+	
+	def choose(self, session: Optional[Hashable] = None) -> Proxy:
+		"""
+		Selects a proxy from the pool.
+
+		Args:
+			session (Optional[Hashable]): A logical session key. If given, the session keeps the same proxy until that proxy is quarantined. Defaults to None.
+
+		Returns:
+			Proxy: The selected proxy.
+		"""
+		with self._lock:
+			now = time.monotonic()
+	
+			if session is not None:
+				index = self._sessions.get(session)
+	
+				if index is not None and self._quarantined_until[index] <= now:
+					return self.proxies[index]
+	
+			index = self.choose_index(now)
+	
+			if session is not None:
+				self._sessions[session] = index
+	
+			return self.proxies[index]
+	
+	def get_request_proxy(self, session: Optional[Hashable] = None) -> RequestProxy:
+		"""
+		Selects a proxy and returns it in the form accepted by the `proxies` argument of `get_req`.
+
+		Args:
+			session (Optional[Hashable]): A logical session key to pin the proxy to. Defaults to None.
+
+		Returns:
+			RequestProxy: A dictionary mapping 'http' and 'https' to the selected proxy link.
+		"""
+		return get_request_proxy(self.choose(session))
+	
+	def release_session(self, session: Hashable) -> None:
+		"""
+		Unpins a logical session from its proxy.
+
+		Args:
+			session (Hashable): The session key.
+		"""
+		with self._lock:
+			self._sessions.pop(session, None)
+	
+	def report_success(self, proxy: Proxy, latency: float) -> None:
+		"""
+		Records a successful request through a proxy.
+
+		A proxy that is still quarantined (it was handed out because every proxy was quarantined) is released from quarantine.
+
+		Args:
+			proxy (Proxy): The proxy that was used.
+			latency (float): The request latency in seconds.
+
+		Raises:
+			KeyError: If the proxy is not in the pool.
+		"""
+		index = self._indexes[get_proxy_key(proxy)]
+	
+		with self._lock:
+			self._attempts[index] += 1
+			self._successes[index] += 1
+			self._failure_streaks[index] = 0
+			self._latencies[index] += self.ewma_alpha * (latency - self._latencies[index])
+	
+			if self._quarantined_until[index] > 0.0:
+				self.release(index)
+	
+	def report_failure(self, proxy: Proxy) -> None:
+		"""
+		Records a failed request through a proxy and puts the proxy into quarantine.
+
+		Args:
+			proxy (Proxy): The proxy that was used.
+
+		Raises:
+			KeyError: If the proxy is not in the pool.
+		"""
+		index = self._indexes[get_proxy_key(proxy)]
+	
+		with self._lock:
+			self._attempts[index] += 1
+			self._failure_streaks[index] += 1
+			self.quarantine(index, time.monotonic())
+	
+	def get_req(self, url: str, session: Optional[Hashable] = None, **kwargs: Any) -> requests.Response:
+		"""
+		Sends a GET request with `get_req` through a selected proxy and reports the outcome.
+
+		Connection errors and timeouts are reported as failures and re-raised. Any received response, whatever its status code, counts as a success.
+
+		Args:
+			url (str): The URL to request.
+			session (Optional[Hashable]): A logical session key to pin the proxy to. Defaults to None.
+			**kwargs (Any): Other arguments passed to `get_req`, except `proxies` and `session`.
+
+		Returns:
+			requests.Response: The response object from the requests library.
+		"""
+		proxy = self.choose(session)
+		start = time.perf_counter()
+	
+		try:
+			response = get_req(url=url, proxies=get_request_proxy(proxy), session=self.http_session, **kwargs)
+		except requests.RequestException:
+			self.report_failure(proxy)
+			raise
+	
+		self.report_success(proxy, time.perf_counter() - start)
+	
+		return response
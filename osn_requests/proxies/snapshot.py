@@ -0,0 +1,283 @@
+import os
+import mmap
+import struct
+import pathlib
+import ipaddress
+from osn_requests.types import Proxy
+from typing import (
+	Iterable,
+	Iterator,
+	Optional,
+	Union
+)
+from osn_requests.proxies.store import (
+	ProxyStore,
+	no_country_code
+)
+
+
+SNAPSHOT_MAGIC = b"OSNP"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_READABLE_VERSIONS = (1, 2)
+SNAPSHOT_HEADER = struct.Struct("<4sBBxxIHH")
+
+
+def get_record_struct(ip_size: int) -> struct.Struct:
+	"""
+	Returns the fixed-width record layout for a given IP address width.
+
+	A record is the packed IP address (big-endian), a 2-byte port, a 1-byte protocol code and a 2-byte country code.
+
+	Args:
+		ip_size (int): The width of the IP address in bytes, 4 or 16.
+
+	Returns:
+		struct.Struct: The record layout.
+	"""
+	return struct.Struct(f"<{ip_size}sHBH")
+
+
+def pack_string_table(values: list[str]) -> bytes:
+	"""
+	Packs a list of short strings as length-prefixed UTF-8.
+
+	Args:
+		values (list[str]): The strings to pack. Each one must be shorter than 256 bytes in UTF-8.
+
+	Returns:
+		bytes: The packed table.
+	"""
+	packed = bytearray()
+	
+	for value in values:
+		encoded = value.encode("utf-8")
+		packed.append(len(encoded))
+		packed += encoded
+	
+	return bytes(packed)
+
+
+def save_proxy_snapshot(proxies: Iterable[Proxy], path: Union[str, pathlib.Path]) -> None:
+	"""
+	Saves proxies to a compact binary snapshot file.
+
+	All records have the same width: 4 bytes for the IP address if every address is IPv4, 16 bytes otherwise, 2 bytes for the port,
+	and small integer codes for the protocol and the country, whose names are stored once in tables in the file header.
+	Index 0 of the country table is reserved for a missing (None) country, like `no_country_code` of `ProxyStore`, so None is read back as None.
+	The file is written to a temporary path and then renamed, so readers never see a half-written snapshot.
+	If writing fails, the temporary file is removed.
+
+	Args:
+		proxies (Iterable[Proxy]): The proxies to save, e.g. a list of Proxy dictionaries or a `ProxyStore`.
+		path (Union[str, pathlib.Path]): The path of the snapshot file.
+
+	Raises:
+		ValueError: If an IP address is not a valid IPv4 or IPv6 address, a port is out of range, or there are more than 256 distinct protocols or 65534 distinct countries.
+	"""
+	protocols: dict[str, int] = {}
+	countries: dict[Optional[str], int] = {None: no_country_code}
+	rows = []
+	
+	for proxy in proxies:
+		rows.append(
+				(
+					ipaddress.ip_address(proxy["ip"]),
+					int(proxy["port"]),
+					protocols.setdefault(proxy["protocol"], len(protocols)),
+					countries.setdefault(proxy["country"], len(countries))
+				)
+		)
+	
+	if len(protocols) > 256 or len(countries) > 65535:
+		raise ValueError("Too many distinct protocols or countries for a snapshot.")
+	
+	ip_size = 4 if all(ip.version == 4 for ip, port, protocol, country in rows) else 16
+	record_struct = get_record_struct(ip_size)
+	
+	path = pathlib.Path(path)
+	temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+	
+	try:
+		with open(temporary_path, "wb") as file:
+			file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, ip_size, len(rows), len(protocols), len(countries)))
+			file.write(pack_string_table(list(protocols)))
+			file.write(pack_string_table(["" if country is None else country for country in countries]))
+	
+			for ip, port, protocol, country in rows:
+				if ip_size == 16 and ip.version == 4:
+					ip = ipaddress.IPv6Address(f"::ffff:{ip}")
+	
+				file.write(record_struct.pack(ip.packed, port, protocol, country))
+	
+		os.replace(temporary_path, path)
+	except BaseException:
+		temporary_path.unlink(missing_ok=True)
+		raise
+
+
+class ProxySnapshot:
+	"""
+	Read-only, memory-mapped view of a proxy snapshot file.
+
+	Opening a snapshot only parses the header and the protocol and country tables; records are decoded on access straight from the mapping.
+	The pages are shared through the operating system page cache, so many worker processes can open the same snapshot without a private copy.
+
+	Attributes:
+		path (pathlib.Path): The path of the snapshot file.
+		protocols (list[str]): The protocol table of the snapshot.
+		countries (list[Optional[str]]): The country table of the snapshot. Index 0 is None, the code of a missing country.
+	"""
+	
+	def __init__(self, path: Union[str, pathlib.Path]):
+		"""
+		Initializes a new instance of `ProxySnapshot` by mapping a snapshot file.
+
+		Args:
+			path (Union[str, pathlib.Path]): The path of the snapshot file.
+
+		Raises:
+			ValueError: If the file is not a supported proxy snapshot.
+		"""
+		self.path = pathlib.Path(path)
+	
+		with open(self.path, "rb") as file:
+			self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+	
+		try:
+			magic, version, ip_size, count, protocols_count, countries_count = SNAPSHOT_HEADER.unpack_from(self._mmap, 0)
+	
+			if magic != SNAPSHOT_MAGIC or version not in SNAPSHOT_READABLE_VERSIONS or ip_size not in [4, 16]:
+				raise ValueError(f"{self.path} is not a supported proxy snapshot.")
+	
+			offset = SNAPSHOT_HEADER.size
+			self.protocols, offset = self.read_string_table(offset, protocols_count)
+			self.countries, offset = self.read_string_table(offset, countries_count)
+	
+			if version >= 2:
+				self.countries[no_country_code] = None
+	
+			self._ip_size = ip_size
+			self._count = count
+			self._records_offset = offset
+			self._record_struct = get_record_struct(ip_size)
+	
+			if len(self._mmap) < offset + count * self._record_struct.size:
+				raise ValueError(f"{self.path} is truncated.")
+		except (ValueError, struct.error, IndexError):
+			self._mmap.close()
+			raise
+	
+	def read_string_table(self, offset: int, count: int) -> tuple[list[str], int]:
+		"""
+		Reads a length-prefixed string table from the mapping.
+
+		Args:
+			offset (int): The offset of the table.
+			count (int): The number of strings in the table.
+
+		Returns:
+			tuple[list[str], int]: The strings and the offset right after the table.
+		"""
+		values = []
+	
+		for _ in range(count):
+			length = self._mmap[offset]
+			values.append(self._mmap[offset + 1:offset + 1 + length].decode("utf-8"))
+			offset += 1 + length
+	
+		return values, offset
+	
+	def __len__(self) -> int:
+		return self._count
+	
+	def __getitem__(self, index: int) -> Proxy:
+		"""
+		Decodes a single record.
+
+		Args:
+			index (int): The record index. Negative indexes count from the end.
+
+		Returns:
+			Proxy: A new Proxy dictionary with the port as a string.
+
+		Raises:
+			IndexError: If the index is out of range.
+		"""
+		if index < 0:
+			index += self._count
+	
+		if not 0 <= index < self._count:
+			raise IndexError("Snapshot index out of range.")
+	
+		packed_ip, port, protocol, country = self._record_struct.unpack_from(
+				self._mmap,
+				self._records_offset + index * self._record_struct.size
+		)
+	
+		return self.build_proxy(packed_ip, port, protocol, country)
+	
+	def __iter__(self) -> Iterator[Proxy]:
+		record_struct = self._record_struct
+	
+		for offset in range(self._records_offset, self._records_offset + self._count * record_struct.size, record_struct.size):
+			yield self.build_proxy(*record_struct.unpack_from(self._mmap, offset))
+	
+	def __enter__(self) -> "ProxySnapshot":
+		return self
+	
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.close()
+	
+	def build_proxy(self, packed_ip: bytes, port: int, protocol: int, country: int) -> Proxy:
+		"""
+		Builds a Proxy dictionary from the fields of a record.
+
+		Args:
+			packed_ip (bytes): The packed IP address.
+			port (int): The port.
+			protocol (int): The protocol code.
+			country (int): The country code.
+
+		Returns:
+			Proxy: A new Proxy dictionary.
+		"""
+		if self._ip_size == 4:
+			ip = ipaddress.IPv4Address(packed_ip)
+		else:
+			ip = ipaddress.IPv6Address(packed_ip)
+			ip = ip.ipv4_mapped or ip
+	
+		return Proxy(
+				protocol=self.protocols[protocol],
+				ip=str(ip),
+				port=str(port),
+				country=self.countries[country]
+		)
+	
+	def to_store(self) -> ProxyStore:
+		"""
+		Loads the snapshot into an indexed `ProxyStore`.
+
+		Returns:
+			ProxyStore: A new store with all proxies of the snapshot.
+		"""
+		return ProxyStore(self)
+	
+	def close(self) -> None:
+		"""
+		Unmaps the snapshot file.
+		"""
+		self._mmap.close()
+
+
+def load_proxy_snapshot(path: Union[str, pathlib.Path]) -> ProxySnapshot:
+	"""
+	Opens a proxy snapshot file as a memory-mapped, read-only sequence of proxies.
+
+	Args:
+		path (Union[str, pathlib.Path]): The path of the snapshot file.
+
+	Returns:
+		ProxySnapshot: The opened snapshot. Close it, or use it as a context manager, when it is no longer needed.
+	"""
+	return ProxySnapshot(path)
@@ -0,0 +1,483 @@
+import csv
+import time
+import codecs
+import pathlib
+import ipaddress
+from abc import ABC, abstractmethod
+from osn_requests import get_req
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+from concurrent.futures import ThreadPoolExecutor
+from osn_requests.proxies.streaming import iter_json_array
+from osn_requests.proxies.functions import get_proxy_key
+from osn_requests.proxies.types import ProxySourceReport
+from osn_requests.types import (
+	Proxy,
+	RequestHeaders
+)
+from typing import (
+	Any,
+	Callable,
+	Iterable,
+	Iterator,
+	Optional,
+	Sequence,
+	Union
+)
+
+
+def iter_lines(chunks: Iterable[Union[bytes, str]]) -> Iterator[str]:
+	"""
+	Splits a stream of UTF-8 chunks into lines without reading the whole stream first.
+
+	Args:
+		chunks (Iterable[Union[bytes, str]]): Parts of a text document.
+
+	Returns:
+		Iterator[str]: An iterator over the lines, without line endings.
+	"""
+	text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+	tail = ""
+	
+	for chunk in chunks:
+		lines = (tail + (text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)).splitlines(keepends=True)
+		tail = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+	
+		for line in lines:
+			yield line.rstrip("\r\n")
+	
+	tail += text_decoder.decode(b"", final=True)
+	
+	if tail:
+		yield tail
+
+
+def build_proxy(protocol: Any, ip: Any, port: Any, country: Any) -> Optional[Proxy]:
+	"""
+	Builds a Proxy dictionary from the fields of a source record, if they describe a valid proxy.
+
+	Args:
+		protocol (Any): The protocol field. Must be a non-empty string.
+		ip (Any): The IP address field. Must be a valid IPv4 or IPv6 address; surrounding brackets and whitespace are removed.
+		port (Any): The port field. Must be an integer or a string of digits in the range 0-65535.
+		country (Any): The country field. Must be a string or None.
+
+	Returns:
+		Optional[Proxy]: The proxy, or None if a field is not valid.
+	"""
+	if not isinstance(protocol, str) or not protocol or not isinstance(ip, str) or not (country is None or isinstance(country, str)):
+		return None
+	
+	ip = ip.strip().strip("[]")
+	port = str(port).strip() if isinstance(port, (int, str)) and not isinstance(port, bool) else ""
+	
+	if not port.isascii() or not port.isdigit() or int(port) > 65535:
+		return None
+	
+	try:
+		ipaddress.ip_address(ip)
+	except ValueError:
+		return None
+	
+	return Proxy(protocol=protocol, ip=ip, port=port, country=country)
+
+
+def get_local_path(location: Union[str, pathlib.Path]) -> Optional[pathlib.Path]:
+	"""
+	Returns the local file path of a source location, if it is one.
+
+	Args:
+		location (Union[str, pathlib.Path]): A path, a 'file://' URL or an 'http(s)://' URL.
+
+	Returns:
+		Optional[pathlib.Path]: The local path, or None if the location is a remote URL.
+	"""
+	if isinstance(location, pathlib.Path):
+		return location
+	
+	split_location = urlsplit(location)
+	
+	if split_location.scheme in ["http", "https"]:
+		return None
+	elif split_location.scheme == "file":
+		return pathlib.Path(url2pathname(split_location.path))
+	
+	return pathlib.Path(location)
+
+
+class ProxySource(ABC):
+	"""
+	Base class for a source of proxies.
+
+	A source reads a document from a URL or a local file chunk by chunk and converts it into Proxy dictionaries.
+	Subclasses implement `parse_records` for a specific document format and check every record with `build_proxy`,
+	so records with a missing or invalid IP address or port are skipped and counted instead of reaching a `ProxyStore`.
+
+	Attributes:
+		location (Union[str, pathlib.Path]): The URL, 'file://' URL or local path of the document.
+		name (str): The name used in reports. Defaults to the location.
+		timeout (float): Timeout in seconds for remote downloads.
+	"""
+	
+	def __init__(
+			self,
+			location: Union[str, pathlib.Path],
+			name: Optional[str] = None,
+			timeout: float = 30.0,
+			headers_factory: Optional[Callable[[], RequestHeaders]] = None
+	):
+		"""
+		Initializes a new instance of `ProxySource`.
+
+		Args:
+			location (Union[str, pathlib.Path]): The URL, 'file://' URL or local path of the document.
+			name (Optional[str]): The name used in reports. Defaults to None, which means the location is used.
+			timeout (float): Timeout in seconds for remote downloads. Defaults to 30.0.
+			headers_factory (Optional[Callable[[], RequestHeaders]]): A function that returns the request headers for every download. Defaults to None.
+		"""
+		self.location = location
+		self.name = str(location) if name is None else name
+		self.timeout = timeout
+	
+		self._headers_factory = headers_factory
+	
+	@abstractmethod
+	def parse_records(self, chunks: Iterable[bytes]) -> Iterator[Optional[Proxy]]:
+		"""
+		Converts the records of a document into proxies.
+
+		Args:
+			chunks (Iterable[bytes]): Parts of the document.
+
+		Returns:
+			Iterator[Optional[Proxy]]: An iterator with the proxy of every record, or None for a record that is not a valid proxy.
+		"""
+		raise NotImplementedError
+	
+	def parse(self, chunks: Iterable[bytes]) -> Iterator[Proxy]:
+		"""
+		Converts the chunks of a document into proxies, skipping invalid records.
+
+		Args:
+			chunks (Iterable[bytes]): Parts of the document.
+
+		Returns:
+			Iterator[Proxy]: An iterator over the valid proxies.
+		"""
+		return (proxy for proxy in self.parse_records(chunks) if proxy is not None)
+	
+	@staticmethod
+	def collect(records: Iterable[Optional[Proxy]]) -> tuple[list[Proxy], int]:
+		"""
+		Splits parsed records into the valid proxies and the number of invalid records.
+
+		Args:
+			records (Iterable[Optional[Proxy]]): The records, as yielded by `parse_records`.
+
+		Returns:
+			tuple[list[Proxy], int]: The valid proxies and the number of invalid records.
+		"""
+		proxies = []
+		invalid_count = 0
+	
+		for proxy in records:
+			if proxy is None:
+				invalid_count += 1
+			else:
+				proxies.append(proxy)
+	
+		return proxies, invalid_count
+	
+	def fetch_records(self) -> tuple[list[Proxy], int]:
+		"""
+		Reads the document and returns its valid proxies and the number of skipped invalid records.
+
+		Returns:
+			tuple[list[Proxy], int]: All valid proxies of the document and the number of invalid records.
+
+		Raises:
+			OSError: If a local file cannot be read.
+			requests.RequestException: If a remote document cannot be downloaded.
+		"""
+		local_path = get_local_path(self.location)
+	
+		if local_path is not None:
+			with open(local_path, "rb") as file:
+				return self.collect(self.parse_records(iter(lambda: file.read(65536), b"")))
+	
+		headers = None if self._headers_factory is None else self._headers_factory()
+	
+		with get_req(url=self.location, headers=headers, timeout=self.timeout, stream=True) as response:
+			response.raise_for_status()
+	
+			return self.collect(self.parse_records(response.iter_content(chunk_size=65536)))
+	
+	def fetch(self) -> list[Proxy]:
+		"""
+		Reads the document and returns its valid proxies.
+
+		Returns:
+			list[Proxy]: All valid proxies of the document.
+
+		Raises:
+			OSError: If a local file cannot be read.
+			requests.RequestException: If a remote document cannot be downloaded.
+		"""
+		return self.fetch_records()[0]
+
+
+class JSONProxySource(ProxySource):
+	"""
+	Source of proxies stored as a JSON array of objects, such as the proxifly list.
+
+	Fields are addressed by dotted paths, so nested values like 'geolocation.country' can be used.
+	The array is parsed incrementally, and only the four `Proxy` fields are kept from every object. Objects without a valid IP address or port are skipped.
+	"""
+	
+	def __init__(
+			self,
+			location: Union[str, pathlib.Path],
+			name: Optional[str] = None,
+			timeout: float = 30.0,
+			headers_factory: Optional[Callable[[], RequestHeaders]] = None,
+			protocol_field: Optional[str] = "protocol",
+			ip_field: str = "ip",
+			port_field: str = "port",
+			country_field: Optional[str] = "geolocation.country",
+			default_protocol: str = "http",
+			default_country: str = ""
+	):
+		"""
+		Initializes a new instance of `JSONProxySource`.
+
+		Args:
+			location (Union[str, pathlib.Path]): The URL, 'file://' URL or local path of the document.
+			name (Optional[str]): The name used in reports. Defaults to None, which means the location is used.
+			timeout (float): Timeout in seconds for remote downloads. Defaults to 30.0.
+			headers_factory (Optional[Callable[[], RequestHeaders]]): A function that returns the request headers for every download. Defaults to None.
+			protocol_field (Optional[str]): Dotted path of the protocol. If None, `default_protocol` is used. Defaults to "protocol".
+			ip_field (str): Dotted path of the IP address. Defaults to "ip".
+			port_field (str): Dotted path of the port. Defaults to "port".
+			country_field (Optional[str]): Dotted path of the country code. If None, `default_country` is used. Defaults to "geolocation.country".
+			default_protocol (str): Protocol used when the field is missing. Defaults to "http".
+			default_country (str): Country used when the field is missing. Defaults to "".
+		"""
+		super().__init__(location=location, name=name, timeout=timeout, headers_factory=headers_factory)
+	
+		self.protocol_path = None if protocol_field is None else protocol_field.split(".")
+		self.ip_path = ip_field.split(".")
+		self.port_path = port_field.split(".")
+		self.country_path = None if country_field is None else country_field.split(".")
+		self.default_protocol = default_protocol
+		self.default_country = default_country
+	
+	@staticmethod
+	def get_field(record: Any, path: Optional[list[str]], default: Any = None) -> Any:
+		"""
+		Reads a value from nested objects by a list of keys.
+
+		Args:
+			record (Any): The parsed JSON object.
+			path (Optional[list[str]]): The keys to follow. If None, `default` is returned.
+			default (Any): The value returned when the path is missing. Defaults to None.
+
+		Returns:
+			Any: The found value or `default`.
+		"""
+		if path is None:
+			return default
+	
+		for key in path:
+			if not isinstance(record, dict) or key not in record:
+				return default
+	
+			record = record[key]
+	
+		return default if record is None else record
+	
+	def parse_records(self, chunks: Iterable[bytes]) -> Iterator[Optional[Proxy]]:
+		for record in iter_json_array(chunks):
+			yield build_proxy(
+					protocol=self.get_field(record, self.protocol_path, self.default_protocol),
+					ip=self.get_field(record, self.ip_path),
+					port=self.get_field(record, self.port_path),
+					country=self.get_field(record, self.country_path, self.default_country)
+			)
+
+
+class TextProxySource(ProxySource):
+	"""
+	Source of proxies stored as plain text, one 'ip:port' or 'protocol://ip:port' entry per line.
+
+	Empty lines and lines starting with '#' are skipped. Lines without a valid IP address and port are skipped as invalid records.
+	"""
+	
+	def __init__(
+			self,
+			location: Union[str, pathlib.Path],
+			name: Optional[str] = None,
+			timeout: float = 30.0,
+			headers_factory: Optional[Callable[[], RequestHeaders]] = None,
+			protocol: str = "http",
+			country: str = ""
+	):
+		"""
+		Initializes a new instance of `TextProxySource`.
+
+		Args:
+			location (Union[str, pathlib.Path]): The URL, 'file://' URL or local path of the document.
+			name (Optional[str]): The name used in reports. Defaults to None, which means the location is used.
+			timeout (float): Timeout in seconds for remote downloads. Defaults to 30.0.
+			headers_factory (Optional[Callable[[], RequestHeaders]]): A function that returns the request headers for every download. Defaults to None.
+			protocol (str): Protocol of entries without a 'protocol://' prefix. Defaults to "http".
+			country (str): Country assigned to all entries. Defaults to "".
+		"""
+		super().__init__(location=location, name=name, timeout=timeout, headers_factory=headers_factory)
+	
+		self.protocol = protocol
+		self.country = country
+	
+	def parse_records(self, chunks: Iterable[bytes]) -> Iterator[Optional[Proxy]]:
+		for line in iter_lines(chunks):
+			line = line.strip()
+	
+			if not line or line.startswith("#"):
+				continue
+	
+			protocol, separator, address = line.partition("://")
+	
+			if not separator:
+				protocol, address = self.protocol, line
+	
+			ip, separator, port = address.rpartition(":")
+	
+			yield build_proxy(protocol=protocol, ip=ip, port=port, country=self.country) if separator else None
+
+
+class CSVProxySource(ProxySource):
+	"""
+	Source of proxies stored as CSV with a header row.
+
+	Rows without a valid IP address or port are skipped as invalid records.
+	"""
+	
+	def __init__(
+			self,
+			location: Union[str, pathlib.Path],
+			name: Optional[str] = None,
+			timeout: float = 30.0,
+			headers_factory: Optional[Callable[[], RequestHeaders]] = None,
+			protocol_column: Optional[str] = "protocol",
+			ip_column: str = "ip",
+			port_column: str = "port",
+			country_column: Optional[str] = "country",
+			default_protocol: str = "http",
+			default_country: str = "",
+			delimiter: str = ","
+	):
+		"""
+		Initializes a new instance of `CSVProxySource`.
+
+		Args:
+			location (Union[str, pathlib.Path]): The URL, 'file://' URL or local path of the document.
+			name (Optional[str]): The name used in reports. Defaults to None, which means the location is used.
+			timeout (float): Timeout in seconds for remote downloads. Defaults to 30.0.
+			headers_factory (Optional[Callable[[], RequestHeaders]]): A function that returns the request headers for every download. Defaults to None.
+			protocol_column (Optional[str]): Name of the protocol column. If None, `default_protocol` is used. Defaults to "protocol".
+			ip_column (str): Name of the IP address column. Defaults to "ip".
+			port_column (str): Name of the port column. Defaults to "port".
+			country_column (Optional[str]): Name of the country column. If None, `default_country` is used. Defaults to "country".
+			default_protocol (str): Protocol used when the column is missing or empty. Defaults to "http".
+			default_country (str): Country used when the column is missing or empty. Defaults to "".
+			delimiter (str): The CSV delimiter. Defaults to ",".
+		"""
+		super().__init__(location=location, name=name, timeout=timeout, headers_factory=headers_factory)
+	
+		self.protocol_column = protocol_column
+		self.ip_column = ip_column
+		self.port_column = port_column
+		self.country_column = country_column
+		self.default_protocol = default_protocol
+		self.default_country = default_country
+		self.delimiter = delimiter
+	
+	def parse_records(self, chunks: Iterable[bytes]) -> Iterator[Optional[Proxy]]:
+		for row in csv.DictReader(iter_lines(chunks), delimiter=self.delimiter):
+			yield build_proxy(
+					protocol=(row.get(self.protocol_column) if self.protocol_column else None) or self.default_protocol,
+					ip=row.get(self.ip_column),
+					port=row.get(self.port_column),
+					country=(row.get(self.country_column) if self.country_column else None) or self.default_country
+			)
+
+
+def timed_fetch(source: ProxySource) -> tuple[list[Proxy], int, float, Optional[Exception]]:
+	"""
+	Fetches a source and measures how long it took.
+
+	Args:
+		source (ProxySource): The source to fetch.
+
+	Returns:
+		tuple[list[Proxy], int, float, Optional[Exception]]: The fetched proxies (empty on failure), the number of invalid records, the elapsed time in seconds and the raised error, if any.
+	"""
+	start = time.perf_counter()
+	
+	try:
+		proxies, invalid_count = source.fetch_records()
+		return proxies, invalid_count, time.perf_counter() - start, None
+	except Exception as error:
+		return [], 0, time.perf_counter() - start, error
+
+
+def fetch_proxy_sources(
+		sources: Sequence[ProxySource],
+		max_workers: Optional[int] = None
+) -> tuple[list[Proxy], list[ProxySourceReport]]:
+	"""
+	Fetches several proxy sources concurrently and merges their results.
+
+	Every source is fetched in its own worker thread. The results are merged in the order of `sources` and deduplicated
+	by (protocol, ip, port) in a single pass, so the first source that lists a proxy wins. A failing source does not stop
+	the others; its error is reported instead. Invalid records are skipped and counted in the report of their source.
+
+	Args:
+		sources (Sequence[ProxySource]): The sources to fetch.
+		max_workers (Optional[int]): Maximum number of concurrent fetches. Defaults to None, which means one worker per source.
+
+	Returns:
+		tuple[list[Proxy], list[ProxySourceReport]]: The merged unique proxies and a report for every source.
+	"""
+	if not sources:
+		return [], []
+	
+	with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as executor:
+		fetched = list(executor.map(timed_fetch, sources))
+	
+	seen = set()
+	proxies = []
+	reports = []
+	
+	for source, (source_proxies, invalid_count, elapsed, error) in zip(sources, fetched):
+		unique_count = 0
+	
+		for proxy in source_proxies:
+			key = get_proxy_key(proxy)
+	
+			if key not in seen:
+				seen.add(key)
+				proxies.append(proxy)
+				unique_count += 1
+	
+		reports.append(
+				ProxySourceReport(
+						name=source.name,
+						count=len(source_proxies),
+						unique_count=unique_count,
+						invalid_count=invalid_count,
+						elapsed=elapsed,
+						error=None if error is None else f"{type(error).__name__}: {error}"
+				)
+		)
+	
+	return proxies, reports
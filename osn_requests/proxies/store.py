@@ -0,0 +1,341 @@
+import ipaddress
+from array import array
+from osn_requests.types import Proxy
+from typing import (
+	Iterable,
+	Iterator,
+	Optional,
+	Union
+)
+
+
+store_filter = Optional[Union[str, Iterable[str]]]
+no_country_code = 0
+
+
+def normalize_store_filter(values: store_filter) -> Optional[list[str]]:
+	"""
+	Converts a `ProxyStore` query filter into a list of values.
+
+	Args:
+		values (store_filter): None, a single string or an iterable of strings.
+
+	Returns:
+		Optional[list[str]]: None if no filter is set, otherwise the list of filter values.
+
+	Raises:
+		TypeError: If `values` is not None, a string or an iterable of strings.
+	"""
+	if values is None:
+		return None
+	elif isinstance(values, str):
+		return [values]
+	
+	try:
+		values = list(values)
+	except TypeError:
+		raise TypeError(f"Expected None, str or an iterable of str, got {type(values)}")
+	
+	if not all(isinstance(value, str) for value in values):
+		raise TypeError("All filter values must be strings.")
+	
+	return values
+
+
+class ProxyStore:
+	"""
+	Columnar, indexed storage for proxies.
+
+	Proxies are stored column by column: IPv4 addresses packed into 32-bit integers, ports as unsigned 16-bit integers,
+	and protocols and countries as small integer codes interned in lookup tables. For every protocol and every country a set
+	of row numbers is kept, so queries combine prebuilt indexes with set operations instead of scanning all rows.
+
+	Addresses that are not IPv4 (IPv6 or host names) are kept as strings in a side table.
+	Proxies are returned as new `Proxy` dictionaries with the port as a string. A missing (None) country is stored
+	under the reserved code `no_country_code` and read back as None.
+
+	Attributes:
+		protocols (list[str]): Interned protocol names. The index of a name is its code. At most 256 protocols fit the code column.
+		countries (list[Optional[str]]): Interned country codes. The index of a country is its code, and index 0 is None. At most 65536 countries fit the code column.
+	"""
+	
+	def __init__(self, proxies: Iterable[Proxy] = ()):
+		"""
+		Initializes a new instance of `ProxyStore`.
+
+		Args:
+			proxies (Iterable[Proxy]): Proxies to add to the store. Defaults to an empty tuple.
+		"""
+		self.protocols: list[str] = []
+		self.countries: list[Optional[str]] = [None]
+	
+		self._ips = array("I")
+		self._ports = array("H")
+		self._protocol_codes = array("B")
+		self._country_codes = array("H")
+		self._other_ips: dict[int, str] = {}
+	
+		self._protocol_codes_by_name: dict[str, int] = {}
+		self._country_codes_by_name: dict[Optional[str], int] = {None: no_country_code}
+		self._rows_by_protocol: list[set[int]] = []
+		self._rows_by_country: list[set[int]] = [set()]
+	
+		self.extend(proxies)
+	
+	def __len__(self) -> int:
+		return len(self._ports)
+	
+	def __getitem__(self, row: int) -> Proxy:
+		"""
+		Returns the proxy stored in a row.
+
+		Args:
+			row (int): The row number.
+
+		Returns:
+			Proxy: A new Proxy dictionary.
+		"""
+		if row < 0:
+			row += len(self)
+	
+		ip = self._other_ips.get(row)
+	
+		return Proxy(
+				protocol=self.protocols[self._protocol_codes[row]],
+				ip=str(ipaddress.IPv4Address(self._ips[row])) if ip is None else ip,
+				port=str(self._ports[row]),
+				country=self.countries[self._country_codes[row]]
+		)
+	
+	def __iter__(self) -> Iterator[Proxy]:
+		return (self[row] for row in range(len(self)))
+	
+	def intern_protocol(self, protocol: str) -> int:
+		"""
+		Returns the code of a protocol, adding it to the lookup table if needed.
+
+		Args:
+			protocol (str): The protocol name.
+
+		Returns:
+			int: The protocol code.
+
+		Raises:
+			ValueError: If the protocol is new and the 256 protocol codes are used up.
+		"""
+		code = self._protocol_codes_by_name.get(protocol)
+	
+		if code is None:
+			code = len(self.protocols)
+	
+			if code > 255:
+				raise ValueError("Too many distinct protocols for a ProxyStore (at most 256).")
+	
+			self.protocols.append(protocol)
+			self._protocol_codes_by_name[protocol] = code
+			self._rows_by_protocol.append(set())
+	
+		return code
+	
+	def intern_country(self, country: Optional[str]) -> int:
+		"""
+		Returns the code of a country, adding it to the lookup table if needed.
+
+		Args:
+			country (Optional[str]): The country code, or None, which always has the code `no_country_code`.
+
+		Returns:
+			int: The internal country code.
+
+		Raises:
+			ValueError: If the country is new and the 65536 country codes are used up.
+		"""
+		code = self._country_codes_by_name.get(country)
+	
+		if code is None:
+			code = len(self.countries)
+	
+			if code > 65535:
+				raise ValueError("Too many distinct countries for a ProxyStore (at most 65536).")
+	
+			self.countries.append(country)
+			self._country_codes_by_name[country] = code
+			self._rows_by_country.append(set())
+	
+		return code
+	
+	def add(self, proxy: Proxy) -> int:
+		"""
+		Adds a proxy to the store.
+
+		Args:
+			proxy (Proxy): The proxy to add.
+
+		Returns:
+			int: The row number of the added proxy.
+
+		Raises:
+			ValueError: If the port is not in the range 0-65535, or the protocol or country tables are full. Nothing is stored in that case.
+		"""
+		port = int(proxy["port"])
+	
+		if not 0 <= port <= 65535:
+			raise ValueError(f"Port must be in range 0-65535, got {port}")
+	
+		try:
+			ip = int(ipaddress.IPv4Address(proxy["ip"]))
+		except ValueError:
+			ip = None
+	
+		row = len(self)
+		protocol_code = self.intern_protocol(proxy["protocol"])
+		country_code = self.intern_country(proxy["country"])
+	
+		if ip is None:
+			self._ips.append(0)
+			self._other_ips[row] = proxy["ip"]
+		else:
+			self._ips.append(ip)
+	
+		self._ports.append(port)
+		self._protocol_codes.append(protocol_code)
+		self._country_codes.append(country_code)
+		self._rows_by_protocol[protocol_code].add(row)
+		self._rows_by_country[country_code].add(row)
+	
+		return row
+	
+	def extend(self, proxies: Iterable[Proxy]) -> None:
+		"""
+		Adds several proxies to the store.
+
+		Args:
+			proxies (Iterable[Proxy]): The proxies to add.
+		"""
+		for proxy in proxies:
+			self.add(proxy)
+	
+	def get_rows_union(self, values: list[str], codes_by_name: dict[str, int], rows_by_code: list[set[int]]) -> set[int]:
+		"""
+		Collects the rows of all given values from an index.
+
+		Args:
+			values (list[str]): The values to look up.
+			codes_by_name (dict[str, int]): The lookup table of the index.
+			rows_by_code (list[set[int]]): The row sets of the index.
+
+		Returns:
+			set[int]: The union of the row sets. Unknown values are ignored.
+		"""
+		codes = {codes_by_name[value] for value in values if value in codes_by_name}
+	
+		if len(codes) == 1:
+			return set(rows_by_code[codes.pop()])
+	
+		return set().union(*(rows_by_code[code] for code in codes))
+	
+	def query_rows(
+			self,
+			protocols: store_filter = None,
+			countries: store_filter = None,
+			exclude_protocols: store_filter = None,
+			exclude_countries: store_filter = None
+	) -> list[int]:
+		"""
+		Finds the rows that match all given filters.
+
+		Args:
+			protocols (store_filter): Protocols to include. If None, all protocols are included.
+			countries (store_filter): Countries to include. If None, all countries are included.
+			exclude_protocols (store_filter): Protocols to exclude. Defaults to None.
+			exclude_countries (store_filter): Countries to exclude. Defaults to None.
+
+		Returns:
+			list[int]: Matching row numbers in insertion order.
+		"""
+		protocols = normalize_store_filter(protocols)
+		countries = normalize_store_filter(countries)
+		exclude_protocols = normalize_store_filter(exclude_protocols)
+		exclude_countries = normalize_store_filter(exclude_countries)
+	
+		rows: Optional[set[int]] = None
+	
+		if protocols is not None:
+			rows = self.get_rows_union(protocols, self._protocol_codes_by_name, self._rows_by_protocol)
+	
+		if countries is not None:
+			country_rows = self.get_rows_union(countries, self._country_codes_by_name, self._rows_by_country)
+			rows = country_rows if rows is None else rows & country_rows
+	
+		if exclude_protocols is None and exclude_countries is None:
+			return list(range(len(self))) if rows is None else sorted(rows)
+	
+		if rows is None:
+			rows = set(range(len(self)))
+	
+		if exclude_protocols is not None:
+			rows -= self.get_rows_union(exclude_protocols, self._protocol_codes_by_name, self._rows_by_protocol)
+	
+		if exclude_countries is not None:
+			rows -= self.get_rows_union(exclude_countries, self._country_codes_by_name, self._rows_by_country)
+	
+		return sorted(rows)
+	
+	def query(
+			self,
+			protocols: store_filter = None,
+			countries: store_filter = None,
+			exclude_protocols: store_filter = None,
+			exclude_countries: store_filter = None
+	) -> list[Proxy]:
+		"""
+		Returns the proxies that match all given filters.
+
+		Filters of the same field are combined with OR, different fields are combined with AND, and exclusions are removed from the result.
+
+		Args:
+			protocols (store_filter): Protocols to include. If None, all protocols are included.
+			countries (store_filter): Countries to include. If None, all countries are included.
+			exclude_protocols (store_filter): Protocols to exclude. Defaults to None.
+			exclude_countries (store_filter): Countries to exclude. Defaults to None.
+
+		Returns:
+			list[Proxy]: New Proxy dictionaries for the matching rows, in insertion order.
+		"""
+		return [
+			self[row]
+			for row in self.query_rows(
+					protocols=protocols,
+					countries=countries,
+					exclude_protocols=exclude_protocols,
+					exclude_countries=exclude_countries
+			)
+		]
+	
+	def count(
+			self,
+			protocols: store_filter = None,
+			countries: store_filter = None,
+			exclude_protocols: store_filter = None,
+			exclude_countries: store_filter = None
+	) -> int:
+		"""
+		Counts the proxies that match all given filters without building Proxy dictionaries.
+
+		Args:
+			protocols (store_filter): Protocols to include. If None, all protocols are included.
+			countries (store_filter): Countries to include. If None, all countries are included.
+			exclude_protocols (store_filter): Protocols to exclude. Defaults to None.
+			exclude_countries (store_filter): Countries to exclude. Defaults to None.
+
+		Returns:
+			int: The number of matching proxies.
+		"""
+		return len(
+				self.query_rows(
+						protocols=protocols,
+						countries=countries,
+						exclude_protocols=exclude_protocols,
+						exclude_countries=exclude_countries
+				)
+		)
@@ -0,0 +1,92 @@
+import re
+import json
+import codecs
+from typing import (
+	Any,
+	Iterable,
+	Iterator,
+	Union
+)
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+	"""
+	Parses a JSON array incrementally and yields its items one by one.
+
+	Chunks can be split at any position, including inside a multibyte UTF-8 character. Only the unparsed tail of the document
+	and the current item are kept in memory, so the memory used by the parser does not depend on the size of the whole document.
+	The array syntax is checked like `json.loads` does: items must be separated by single commas, a comma must be followed
+	by an item and only whitespace may follow the closing bracket, so the remaining chunks are read after it.
+
+	Args:
+		chunks (Iterable[Union[bytes, str]]): Parts of a JSON document whose top-level value is an array, e.g. `response.iter_content(...)`.
+
+	Returns:
+		Iterator[Any]: An iterator over the decoded items of the array.
+
+	Raises:
+		json.JSONDecodeError: If the document is not a valid JSON array.
+	"""
+	decoder = json.JSONDecoder()
+	text_decoder = codecs.getincrementaldecoder("utf-8")()
+	whitespace = re.compile(r"[ \t\n\r]*")
+	
+	buffer = ""
+	array_started = False
+	array_ended = False
+	expecting_item = True
+	item_required = False
+	
+	for chunk in chunks:
+		buffer += text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+		position = 0
+		buffer_length = len(buffer)
+	
+		while True:
+			position = whitespace.match(buffer, position).end()
+	
+			if position == buffer_length:
+				break
+	
+			char = buffer[position]
+	
+			if array_ended:
+				raise json.JSONDecodeError("Extra data", buffer, position)
+	
+			if not array_started:
+				if char != "[":
+					raise json.JSONDecodeError("Expected a JSON array", buffer, position)
+	
+				array_started = True
+				position += 1
+			elif char == "]" and not item_required:
+				array_ended = True
+				position += 1
+			elif not expecting_item:
+				if char != ",":
+					raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+	
+				expecting_item = True
+				item_required = True
+				position += 1
+			elif char in ",]":
+				raise json.JSONDecodeError("Expecting value", buffer, position)
+			else:
+				try:
+					item, end = decoder.raw_decode(buffer, position)
+				except json.JSONDecodeError:
+					break
+	
+				if not isinstance(item, (dict, list, str)) and (end == buffer_length or buffer[end] not in " \t\n\r,]"):
+					break
+	
+				position = end
+				expecting_item = False
+				item_required = False
+	
+				yield item
+	
+		buffer = buffer[position:]
+	
+	if not array_ended:
+		raise json.JSONDecodeError("Unterminated JSON array", buffer, len(buffer))
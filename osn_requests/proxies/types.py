@@ -0,0 +1,52 @@
+from osn_requests.types import Proxy
+from typing import (
+	Optional,
+	TypedDict
+)
+
+
+class ProxyCheckResult(TypedDict):
+	"""
+	Type definition for the result of a single proxy check.
+
+	This TypedDict describes the outcome of probing a proxy server against a test URL, including the timings that are used to rank live proxies.
+
+	Attributes:
+	   proxy (Proxy): The proxy that was checked.
+	   protocol (str): The protocol that was used to talk to the proxy (e.g., 'http', 'https', 'socks4', 'socks5').
+	   success (bool): True if the test URL was reached through the proxy, False otherwise.
+	   connect_latency (Optional[float]): Time in seconds needed to open a TCP connection to the proxy. None if the connection failed.
+	   total_latency (Optional[float]): Time in seconds from the start of the check to the first response line from the test URL. None if the check failed.
+	   checked_at (float): Unix timestamp of the moment the check was finished.
+	   error (Optional[str]): A short description of the failure reason. None if the check succeeded.
+	"""
+	proxy: Proxy
+	protocol: str
+	success: bool
+	connect_latency: Optional[float]
+	total_latency: Optional[float]
+	checked_at: float
+	error: Optional[str]
+
+
+class ProxySourceReport(TypedDict):
+	"""
+	Type definition for the report of a single proxy source fetch.
+
+	Attributes:
+	   name (str): The name of the source.
+	   count (int): Number of valid proxies returned by the source.
+	   unique_count (int): Number of proxies from the source that were not already returned by a previous source.
+	   invalid_count (int): Number of records of the source that were skipped because they are not valid proxies (bad IP address or port).
+	   elapsed (float): Time in seconds spent fetching and parsing the source.
+	   error (Optional[str]): A description of the error if the fetch failed, None otherwise.
+	"""
+	name: str
+	count: int
+	unique_count: int
+	invalid_count: int
+	elapsed: float
+	error: Optional[str]
+
+
+proxy_key = tuple[str, str, str]
@@ -0,0 +1,400 @@
+import time
+import socket
+import struct
+import asyncio
+import ipaddress
+from urllib.parse import urlsplit
+from osn_requests.types import Proxy
+from osn_requests.proxies.functions import get_proxy_key
+from typing import (
+	Iterable,
+	Optional
+)
+from osn_requests.proxies.types import (
+	ProxyCheckResult,
+	proxy_key
+)
+
+
+async def read_http_status(reader: asyncio.StreamReader) -> int:
+	"""
+	Reads an HTTP status line from a stream and returns its status code.
+
+	Args:
+		reader (asyncio.StreamReader): The stream to read the status line from.
+
+	Returns:
+		int: The HTTP status code.
+
+	Raises:
+		ConnectionError: If the received line is not a valid HTTP status line.
+	"""
+	status_line = await reader.readline()
+	parts = status_line.split(maxsplit=2)
+	
+	if len(parts) < 2 or not parts[0].startswith(b"HTTP/") or not parts[1].isdigit():
+		raise ConnectionError("Invalid HTTP response received through proxy.")
+	
+	return int(parts[1])
+
+
+async def open_socks4_tunnel(
+		reader: asyncio.StreamReader,
+		writer: asyncio.StreamWriter,
+		host_ip: str,
+		port: int
+) -> None:
+	"""
+	Performs a SOCKS4 CONNECT handshake over an already opened connection.
+
+	Args:
+		reader (asyncio.StreamReader): The stream connected to the SOCKS4 proxy.
+		writer (asyncio.StreamWriter): The writer connected to the SOCKS4 proxy.
+		host_ip (str): The IPv4 address of the target host. SOCKS4 cannot resolve host names by itself.
+		port (int): The port of the target host.
+
+	Raises:
+		ConnectionError: If the proxy rejects the request.
+	"""
+	writer.write(struct.pack(">BBH", 4, 1, port) + socket.inet_aton(host_ip) + b"\x00")
+	await writer.drain()
+	
+	reply = await reader.readexactly(8)
+	
+	if reply[1] != 0x5A:
+		raise ConnectionError(f"SOCKS4 request rejected with code {reply[1]}.")
+
+
+async def open_socks5_tunnel(
+		reader: asyncio.StreamReader,
+		writer: asyncio.StreamWriter,
+		host: str,
+		port: int
+) -> None:
+	"""
+	Performs a SOCKS5 CONNECT handshake without authentication over an already opened connection.
+
+	The target host name is sent to the proxy as is, so it is resolved on the proxy side.
+
+	Args:
+		reader (asyncio.StreamReader): The stream connected to the SOCKS5 proxy.
+		writer (asyncio.StreamWriter): The writer connected to the SOCKS5 proxy.
+		host (str): The host name or IP address of the target host.
+		port (int): The port of the target host.
+
+	Raises:
+		ConnectionError: If the proxy requires authentication or rejects the request.
+	"""
+	writer.write(b"\x05\x01\x00")
+	await writer.drain()
+	
+	if await reader.readexactly(2) != b"\x05\x00":
+		raise ConnectionError("SOCKS5 proxy requires an unsupported authentication method.")
+	
+	try:
+		address = ipaddress.ip_address(host)
+		address_part = (b"\x01" if address.version == 4 else b"\x04") + address.packed
+	except ValueError:
+		host_bytes = host.encode("idna")
+		address_part = b"\x03" + bytes([len(host_bytes)]) + host_bytes
+	
+	writer.write(b"\x05\x01\x00" + address_part + struct.pack(">H", port))
+	await writer.drain()
+	
+	reply = await reader.readexactly(4)
+	
+	if reply[1] != 0:
+		raise ConnectionError(f"SOCKS5 request rejected with code {reply[1]}.")
+	
+	if reply[3] == 1:
+		await reader.readexactly(4 + 2)
+	elif reply[3] == 4:
+		await reader.readexactly(16 + 2)
+	elif reply[3] == 3:
+		await reader.readexactly((await reader.readexactly(1))[0] + 2)
+	else:
+		raise ConnectionError(f"SOCKS5 proxy replied with unknown address type {reply[3]}.")
+
+
+def get_live_results(results: Iterable[ProxyCheckResult]) -> list[ProxyCheckResult]:
+	"""
+	Filters successful proxy checks and ranks them by latency.
+
+	Args:
+		results (Iterable[ProxyCheckResult]): Proxy check results to rank.
+
+	Returns:
+		list[ProxyCheckResult]: Successful results sorted by total latency, then by connect latency, fastest first.
+	"""
+	return sorted(
+			(result for result in results if result["success"]),
+			key=lambda result: (result["total_latency"], result["connect_latency"])
+	)
+
+
+class ProxyValidator:
+	"""
+	Validates proxies concurrently by probing them against a test URL.
+
+	Every proxy is checked with a raw asyncio connection, so thousands of proxies can be probed at once without a thread per proxy.
+	HTTP and HTTPS proxies are asked for the test URL directly (or with `CONNECT` if the test URL uses HTTPS), SOCKS4 and SOCKS5 proxies
+	are asked to open a tunnel to the test host first.
+
+	Results are remembered between runs, so only proxies that are new or whose last check is older than `max_age` are probed again.
+
+	Attributes:
+		test_url (str): The URL used to check the proxies. It can point to a local server.
+		timeout (float): Maximum time in seconds for a single proxy check.
+		max_concurrency (int): Maximum number of proxies that are checked at the same time.
+		max_age (float): Time in seconds after which a previous check result is considered stale.
+		results (dict[proxy_key, ProxyCheckResult]): Results of the last run, keyed by proxy identity.
+	"""
+	
+	def __init__(
+			self,
+			test_url: str = "http://httpbin.org/get",
+			timeout: float = 10.0,
+			max_concurrency: int = 500,
+			max_age: float = 600.0
+	):
+		"""
+		Initializes a new instance of `ProxyValidator`.
+
+		Args:
+			test_url (str): The URL used to check the proxies. Must use the 'http' or 'https' scheme. Defaults to "http://httpbin.org/get".
+			timeout (float): Maximum time in seconds for a single proxy check. Defaults to 10.0.
+			max_concurrency (int): Maximum number of proxies that are checked at the same time. Defaults to 500.
+			max_age (float): Time in seconds after which a previous check result is considered stale. Defaults to 600.0.
+
+		Raises:
+			ValueError: If `test_url` does not use the 'http' or 'https' scheme or has no host.
+		"""
+		split_url = urlsplit(test_url)
+	
+		if split_url.scheme not in ["http", "https"] or not split_url.hostname:
+			raise ValueError(f"Expected an absolute http or https test URL, got {test_url!r}")
+	
+		self.test_url = test_url
+		self.timeout = timeout
+		self.max_concurrency = max_concurrency
+		self.max_age = max_age
+		self.results: dict[proxy_key, ProxyCheckResult] = {}
+	
+		self._scheme = split_url.scheme
+		self._host = split_url.hostname
+		self._port = split_url.port or (443 if split_url.scheme == "https" else 80)
+		self._host_header = self._host if split_url.port is None else f"{self._host}:{self._port}"
+		self._path = (split_url.path or "/") + (f"?{split_url.query}" if split_url.query else "")
+		self._host_ip: Optional[str] = None
+	
+	async def send_test_request(
+			self,
+			reader: asyncio.StreamReader,
+			writer: asyncio.StreamWriter,
+			through_tunnel: bool
+	) -> int:
+		"""
+		Sends the test request over an opened connection and returns the response status code.
+
+		If the test URL uses HTTPS, the request is a `CONNECT` to the test host for HTTP proxies,
+		and nothing is sent for already established SOCKS tunnels.
+
+		Args:
+			reader (asyncio.StreamReader): The stream connected to the proxy.
+			writer (asyncio.StreamWriter): The writer connected to the proxy.
+			through_tunnel (bool): True if a SOCKS tunnel to the test host is already open.
+
+		Returns:
+			int: The HTTP status code of the response, or 200 for an established HTTPS tunnel.
+		"""
+		if self._scheme == "https":
+			if through_tunnel:
+				return 200
+	
+			request = f"CONNECT {self._host}:{self._port} HTTP/1.1\r\nHost: {self._host}:{self._port}\r\n\r\n"
+		else:
+			target = self._path if through_tunnel else self.test_url
+			request = f"GET {target} HTTP/1.1\r\nHost: {self._host_header}\r\nConnection: close\r\n\r\n"
+	
+		writer.write(request.encode("ascii"))
+		await writer.drain()
+	
+		return await read_http_status(reader)
+	
+	async def probe(self, proxy: Proxy, timings: dict[str, float]) -> int:
+		"""
+		Opens a connection to a proxy and sends the test request through it.
+
+		Args:
+			proxy (Proxy): The proxy to probe.
+			timings (dict[str, float]): A dictionary that receives the 'connect' and 'total' latencies as soon as they are known.
+
+		Returns:
+			int: The HTTP status code returned through the proxy.
+
+		Raises:
+			ConnectionError: If the proxy protocol is not supported or the proxy does not behave as expected.
+			OSError: If the connection to the proxy fails.
+		"""
+		protocol = proxy["protocol"].lower()
+		start = time.perf_counter()
+	
+		reader, writer = await asyncio.open_connection(proxy["ip"], int(proxy["port"]))
+		timings["connect"] = time.perf_counter() - start
+	
+		try:
+			if protocol in ["http", "https"]:
+				status = await self.send_test_request(reader, writer, False)
+			elif protocol == "socks4":
+				if self._host_ip is None:
+					raise ConnectionError(f"Cannot resolve {self._host} to an IPv4 address for SOCKS4.")
+	
+				await open_socks4_tunnel(reader, writer, self._host_ip, self._port)
+				status = await self.send_test_request(reader, writer, True)
+			elif protocol == "socks5":
+				await open_socks5_tunnel(reader, writer, self._host, self._port)
+				status = await self.send_test_request(reader, writer, True)
+			else:
+				raise ConnectionError(f"Unsupported proxy protocol: {protocol}")
+	
+			timings["total"] = time.perf_counter() - start
+	
+			return status
+		finally:
+			writer.close()
+	
+	async def check_proxy(self, proxy: Proxy, semaphore: Optional[asyncio.Semaphore] = None) -> ProxyCheckResult:
+		"""
+		Checks a single proxy and records its latencies.
+
+		Args:
+			proxy (Proxy): The proxy to check.
+			semaphore (Optional[asyncio.Semaphore]): A semaphore limiting the number of concurrent checks. Defaults to None.
+
+		Returns:
+			ProxyCheckResult: The result of the check. A check succeeds if the response status code is below 400.
+		"""
+		timings: dict[str, float] = {}
+		error = None
+	
+		try:
+			if semaphore is None:
+				status = await asyncio.wait_for(self.probe(proxy, timings), self.timeout)
+			else:
+				async with semaphore:
+					status = await asyncio.wait_for(self.probe(proxy, timings), self.timeout)
+	
+			if status >= 400:
+				error = f"Test URL responded with status {status}."
+		except asyncio.TimeoutError:
+			error = "Timed out."
+		except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as exception:
+			error = str(exception) or type(exception).__name__
+	
+		success = error is None
+	
+		return ProxyCheckResult(
+				proxy=proxy,
+				protocol=proxy["protocol"],
+				success=success,
+				connect_latency=timings.get("connect"),
+				total_latency=timings.get("total") if success else None,
+				checked_at=time.time(),
+				error=error
+		)
+	
+	async def resolve_test_host(self) -> None:
+		"""
+		Resolves the test host to an IPv4 address once per run, which is required for SOCKS4 proxies.
+		"""
+		try:
+			address_info = await asyncio.get_running_loop().getaddrinfo(
+					self._host,
+					self._port,
+					family=socket.AF_INET,
+					type=socket.SOCK_STREAM
+			)
+			self._host_ip = address_info[0][4][0]
+		except OSError:
+			self._host_ip = None
+	
+	async def validate_async(self, proxies: Iterable[Proxy]) -> list[ProxyCheckResult]:
+		"""
+		Validates proxies concurrently and returns the live ones ranked by latency.
+
+		Proxies with a result younger than `max_age` from the previous run are not probed again. Duplicate proxies are checked once.
+		After the run, `results` only contains the proxies passed to this call.
+
+		Args:
+			proxies (Iterable[Proxy]): Proxies to validate.
+
+		Returns:
+			list[ProxyCheckResult]: Successful check results sorted by latency, fastest first.
+		"""
+		now = time.time()
+		results: dict[proxy_key, Optional[ProxyCheckResult]] = {}
+		proxies_to_check: list[tuple[proxy_key, Proxy]] = []
+	
+		for proxy in proxies:
+			key = get_proxy_key(proxy)
+	
+			if key in results:
+				continue
+	
+			previous_result = self.results.get(key)
+	
+			if previous_result is not None and now - previous_result["checked_at"] < self.max_age:
+				results[key] = previous_result
+			else:
+				results[key] = None
+				proxies_to_check.append((key, proxy))
+	
+		if any(proxy["protocol"].lower() == "socks4" for key, proxy in proxies_to_check):
+			await self.resolve_test_host()
+	
+		semaphore = asyncio.Semaphore(self.max_concurrency)
+		checked_results = await asyncio.gather(*(self.check_proxy(proxy, semaphore) for key, proxy in proxies_to_check))
+	
+		for (key, proxy), result in zip(proxies_to_check, checked_results):
+			results[key] = result
+	
+		self.results = results
+	
+		return get_live_results(results.values())
+	
+	def validate(self, proxies: Iterable[Proxy]) -> list[ProxyCheckResult]:
+		"""
+		Synchronous wrapper around `validate_async`.
+
+		Must not be called from a running event loop; use `validate_async` there instead.
+
+		Args:
+			proxies (Iterable[Proxy]): Proxies to validate.
+
+		Returns:
+			list[ProxyCheckResult]: Successful check results sorted by latency, fastest first.
+		"""
+		return asyncio.run(self.validate_async(proxies))
+
+
+def validate_proxies(
+		proxies: Iterable[Proxy],
+		test_url: str = "http://httpbin.org/get",
+		timeout: float = 10.0,
+		max_concurrency: int = 500
+) -> list[ProxyCheckResult]:
+	"""
+	Validates proxies once and returns the live ones ranked by latency.
+
+	This is a shortcut for a one-off `ProxyValidator` run. Keep a `ProxyValidator` instance instead to skip proxies that were checked recently.
+
+	Args:
+		proxies (Iterable[Proxy]): Proxies to validate, e.g. the result of `get_free_proxies`.
+		test_url (str): The URL used to check the proxies. Defaults to "http://httpbin.org/get".
+		timeout (float): Maximum time in seconds for a single proxy check. Defaults to 10.0.
+		max_concurrency (int): Maximum number of proxies that are checked at the same time. Defaults to 500.
+
+	Returns:
+		list[ProxyCheckResult]: Successful check results sorted by latency, fastest first.
+	"""
+	return ProxyValidator(test_url=test_url, timeout=timeout, max_concurrency=max_concurrency).validate(proxies)
@@ -0,0 +1,39 @@
+import sys
+import pathlib
+import subprocess
+
+
+heavy_modules = {"requests", "lxml", "bs4"}
+
+
+def get_imported_modules(statement: str) -> list[str]:
+	"""
+	Runs an import statement in a new interpreter with `-X importtime` and lists the imported modules.
+
+	Args:
+		statement (str): The Python statement to run.
+
+	Returns:
+		list[str]: The names of the modules imported by the statement, in import order.
+	"""
+	result = subprocess.run(
+			[sys.executable, "-X", "importtime", "-c", statement],
+			cwd=pathlib.Path(__file__).resolve().parent.parent,
+			capture_output=True,
+			text=True,
+			check=True
+	)
+	modules = []
+	
+	for line in result.stderr.splitlines():
+		if line.startswith("import time:") and "|" in line:
+			modules.append(line.rsplit("|", 1)[1].strip())
+	
+	return modules
+
+
+def test_user_agent_import_does_not_load_heavy_modules():
+	modules = get_imported_modules("import osn_requests.headers.user_agent")
+	
+	assert "osn_requests.headers.user_agent" in modules
+	assert [module for module in modules if module.split(".")[0] in heavy_modules] == []
@@ -0,0 +1,28 @@
+from osn_requests.proxies.rotation import ProxyRotator
+
+
+def test_choose_index_skips_stale_quarantine_entries():
+	rotator = ProxyRotator(
+			[
+				{"protocol": "http", "ip": "1.2.3.4", "port": "80", "country": "US"},
+				{"protocol": "http", "ip": "1.2.3.5", "port": "80", "country": "US"}
+			],
+			base_quarantine=10.0
+	)
+	
+	rotator._failure_streaks[0] = 1
+	rotator.quarantine(0, 0.0)
+	rotator._failure_streaks[0] = 3
+	rotator.quarantine(0, 1.0)
+	rotator._failure_streaks[1] = 1
+	rotator.quarantine(1, 1.0)
+	
+	assert rotator._quarantine_heap[0] == (10.0, 0)
+	assert rotator.choose_index(2.0) == 1
+	assert rotator._quarantine_heap[0] == (11.0, 1)
+	
+	rotator.release(1)
+	rotator.quarantine(1, 3.0)
+	
+	assert rotator.choose_index(4.0) == 1
+	assert rotator._quarantine_heap[0] == (13.0, 1)
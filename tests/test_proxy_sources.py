@@ -0,0 +1,76 @@
+import json
+from osn_requests.proxies import get_free_proxies
+from osn_requests.proxies.sources import (
+	CSVProxySource,
+	JSONProxySource,
+	TextProxySource,
+	fetch_proxy_sources
+)
+
+
+def test_text_source_skips_invalid_lines(tmp_path):
+	path = tmp_path / "proxies.txt"
+	path.write_text(
+			"# comment\n1.2.3.4:80\n5.6.7.8:abc\n9.9.9.9\nsocks5://[::1]:1080\nhost.example:80\n1.1.1.1:70000\n",
+			encoding="utf-8"
+	)
+	source = TextProxySource(path, name="text")
+	
+	proxies, reports = fetch_proxy_sources([source])
+	
+	assert proxies == [
+		{"protocol": "http", "ip": "1.2.3.4", "port": "80", "country": ""},
+		{"protocol": "socks5", "ip": "::1", "port": "1080", "country": ""}
+	]
+	assert reports[0]["count"] == 2
+	assert reports[0]["invalid_count"] == 4
+	assert reports[0]["error"] is None
+
+
+def test_json_source_skips_invalid_records(tmp_path):
+	path = tmp_path / "proxies.json"
+	path.write_text(
+			json.dumps(
+					[
+						{"protocol": "http", "ip": "1.2.3.4", "port": 8080, "geolocation": {"country": "US"}},
+						{"protocol": "http", "ip": "1.2.3.5"},
+						{"protocol": "http", "ip": "not an ip", "port": 80},
+						{"protocol": "socks4", "ip": "1.2.3.6", "port": "1080"},
+						"1.2.3.7:80"
+					]
+			),
+			encoding="utf-8"
+	)
+	
+	proxies, invalid_count = JSONProxySource(path).fetch_records()
+	
+	assert proxies == [
+		{"protocol": "http", "ip": "1.2.3.4", "port": "8080", "country": "US"},
+		{"protocol": "socks4", "ip": "1.2.3.6", "port": "1080", "country": ""}
+	]
+	assert invalid_count == 3
+
+
+def test_csv_source_skips_invalid_rows(tmp_path):
+	path = tmp_path / "proxies.csv"
+	path.write_text(
+			"protocol;ip;port;country\nhttps;1.2.3.4;443;DE\nhttp;1.2.3.5;;DE\nhttp;1.2.3.6;-1;DE\n;1.2.3.7;3128;\n",
+			encoding="utf-8"
+	)
+	
+	proxies, invalid_count = CSVProxySource(path, delimiter=";").fetch_records()
+	
+	assert proxies == [
+		{"protocol": "https", "ip": "1.2.3.4", "port": "443", "country": "DE"},
+		{"protocol": "http", "ip": "1.2.3.7", "port": "3128", "country": ""}
+	]
+	assert invalid_count == 2
+
+
+def test_get_free_proxies_keeps_valid_proxies_of_sources_with_bad_lines(tmp_path):
+	path = tmp_path / "proxies.txt"
+	path.write_text("1.2.3.4:80\n5.6.7.8:abc\n9.9.9.9\n", encoding="utf-8")
+	
+	assert get_free_proxies(sources=[TextProxySource(path)]) == [
+		{"protocol": "http", "ip": "1.2.3.4", "port": "80", "country": ""}
+	]
@@ -0,0 +1,148 @@
+import socket
+import asyncio
+from osn_requests.proxies.validation import ProxyValidator
+
+
+async def read_http_head(reader: asyncio.StreamReader) -> bytes:
+	"""
+	Reads an HTTP request head up to and including the empty line.
+
+	Args:
+		reader (asyncio.StreamReader): The stream to read from.
+
+	Returns:
+		bytes: The request head.
+	"""
+	return await reader.readuntil(b"\r\n\r\n")
+
+
+async def handle_proxy_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, requests: list[bytes]) -> None:
+	"""
+	Plays an HTTP, SOCKS4 or SOCKS5 proxy for one client, chosen by the first byte it sends.
+
+	Tunnels are not forwarded anywhere: after a successful handshake the stand-in answers the tunneled HTTP request itself.
+	Clients that close the connection early (HTTPS tunnels, failed checks) are dropped quietly.
+
+	Args:
+		reader (asyncio.StreamReader): The client stream.
+		writer (asyncio.StreamWriter): The client writer.
+		requests (list[bytes]): Receives the handshake and request bytes of every client.
+	"""
+	try:
+		first_byte = await reader.readexactly(1)
+	
+		if first_byte == b"\x05":
+			greeting = first_byte + await reader.readexactly(2)
+			writer.write(b"\x05\x00")
+	
+			header = await reader.readexactly(4)
+	
+			if header[3] == 3:
+				length = await reader.readexactly(1)
+				address = length + await reader.readexactly(length[0])
+			else:
+				address = await reader.readexactly(4)
+	
+			port = await reader.readexactly(2)
+			writer.write(b"\x05\x00\x00\x01" + bytes(4) + port)
+			requests.append(greeting + header + address + port)
+		elif first_byte == b"\x04":
+			request = first_byte + await reader.readexactly(7) + await reader.readuntil(b"\x00")
+			writer.write(b"\x00\x5a" + bytes(6))
+			requests.append(request)
+		else:
+			head = first_byte + await read_http_head(reader)
+			requests.append(head)
+	
+			if head.startswith(b"CONNECT "):
+				writer.write(b"HTTP/1.1 200 Connection established\r\n\r\n")
+			elif b"/forbidden" in head:
+				writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+			else:
+				writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+	
+			await writer.drain()
+			return
+	
+		await writer.drain()
+	
+		requests.append(await read_http_head(reader))
+		writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+		await writer.drain()
+	except asyncio.IncompleteReadError:
+		pass
+	finally:
+		writer.close()
+
+
+def get_unused_port() -> int:
+	"""
+	Finds a local TCP port with nothing listening on it.
+
+	Returns:
+		int: The port.
+	"""
+	with socket.socket() as sock:
+		sock.bind(("127.0.0.1", 0))
+		return sock.getsockname()[1]
+
+
+async def validate_with_local_proxy(test_url: str, protocols: list[str]) -> tuple[dict[str, dict], list[bytes]]:
+	"""
+	Runs a `ProxyValidator` against a local proxy stand-in.
+
+	Args:
+		test_url (str): The test URL of the validator.
+		protocols (list[str]): The protocols to check the stand-in with.
+
+	Returns:
+		tuple[dict[str, dict], list[bytes]]: The check results by protocol and the bytes received by the stand-in.
+	"""
+	requests: list[bytes] = []
+	server = await asyncio.start_server(
+			lambda reader, writer: handle_proxy_client(reader, writer, requests),
+			"127.0.0.1",
+			0
+	)
+	port = str(server.sockets[0].getsockname()[1])
+	
+	async with server:
+		validator = ProxyValidator(test_url=test_url, timeout=5.0)
+		await validator.validate_async(
+				[{"protocol": protocol, "ip": "127.0.0.1", "port": port, "country": "US"} for protocol in protocols]
+		)
+	
+	return {key[0]: result for key, result in validator.results.items()}, requests
+
+
+def test_validator_checks_http_socks4_and_socks5_proxies():
+	results, requests = asyncio.run(validate_with_local_proxy("http://127.0.0.1:8080/get", ["http", "socks4", "socks5"]))
+	
+	assert all(result["success"] for result in results.values()), results
+	assert all(result["total_latency"] >= result["connect_latency"] >= 0 for result in results.values())
+	assert b"GET http://127.0.0.1:8080/get HTTP/1.1\r\n" in b"".join(requests)
+	assert b"\x04\x01\x1f\x90\x7f\x00\x00\x01\x00" in requests
+	assert b"\x05\x01\x00" + b"\x05\x01\x00\x01\x7f\x00\x00\x01\x1f\x90" in requests
+	assert requests.count(b"GET /get HTTP/1.1\r\nHost: 127.0.0.1:8080\r\nConnection: close\r\n\r\n") == 2
+
+
+def test_validator_uses_connect_for_https_test_urls():
+	results, requests = asyncio.run(validate_with_local_proxy("https://example.test/", ["https", "socks5"]))
+	
+	assert results["https"]["success"] and results["socks5"]["success"]
+	assert b"CONNECT example.test:443 HTTP/1.1\r\nHost: example.test:443\r\n\r\n" in requests
+	assert b"\x05\x01\x00" + b"\x05\x01\x00\x03\x0cexample.test\x01\xbb" in requests
+
+
+def test_validator_reports_failures():
+	results, _ = asyncio.run(validate_with_local_proxy("http://127.0.0.1:8080/forbidden", ["http", "ftp"]))
+	
+	assert results["http"]["error"] == "Test URL responded with status 403."
+	assert results["ftp"]["error"] == "Unsupported proxy protocol: ftp"
+	
+	validator = ProxyValidator(test_url="http://127.0.0.1:8080/get", timeout=5.0)
+	live = validator.validate([{"protocol": "http", "ip": "127.0.0.1", "port": str(get_unused_port()), "country": "US"}])
+	
+	assert live == []
+	assert [result["success"] for result in validator.results.values()] == [False]
+	assert [result["connect_latency"] for result in validator.results.values()] == [None]
@@ -0,0 +1,47 @@
+import pytest
+from osn_requests.functions import reformat_proxies
+
+
+def test_socks5_only_proxies_are_used_for_http_and_https():
+	proxies = {"socks5": "socks5h://127.0.0.1:1080"}
+	
+	assert reformat_proxies(proxies) == {
+		"socks5": "socks5h://127.0.0.1:1080",
+		"http": "socks5h://127.0.0.1:1080",
+		"https": "socks5h://127.0.0.1:1080"
+	}
+	assert proxies == {"socks5": "socks5h://127.0.0.1:1080"}
+
+
+def test_socks4_only_proxies_are_used_for_http_and_https():
+	assert reformat_proxies({"socks4": "socks4://127.0.0.1:1080"}) == {
+		"socks4": "socks4://127.0.0.1:1080",
+		"http": "socks4://127.0.0.1:1080",
+		"https": "socks4://127.0.0.1:1080"
+	}
+
+
+def test_socks5_is_preferred_over_socks4():
+	reformatted = reformat_proxies({"socks4": "socks4://127.0.0.1:1081", "socks5": "socks5h://127.0.0.1:1080"})
+	
+	assert reformatted["http"] == reformatted["https"] == "socks5h://127.0.0.1:1080"
+
+
+@pytest.mark.parametrize(
+		"proxies",
+		[
+			{"http": "http://127.0.0.1:8080"},
+			{"https": "http://127.0.0.1:8080", "socks5": "socks5h://127.0.0.1:1080"},
+			{"all": "socks5h://127.0.0.1:1080", "socks4": "socks4://127.0.0.1:1081"},
+			{}
+		]
+)
+def test_proxies_with_scheme_entries_are_returned_as_they_are(proxies):
+	assert reformat_proxies(proxies) is proxies
+
+
+def test_invalid_proxies():
+	assert reformat_proxies(None) is None
+	
+	with pytest.raises(TypeError):
+		reformat_proxies("socks5h://127.0.0.1:1080")